@@ -0,0 +1,51 @@
+"""Add clone_journals table
+
+Revision ID: 7d21c4e8b6f0
+Revises: 3b8e5f2a9c41
+Create Date: 2026-10-17 14:15:40.902311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d21c4e8b6f0'
+down_revision: Union[str, Sequence[str], None] = '3b8e5f2a9c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('clone_journals',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('run_id', sa.String(), nullable=False),
+    sa.Column('source_project_id', sa.String(), nullable=False),
+    sa.Column('source_project_name', sa.String(), nullable=True),
+    sa.Column('new_project_name', sa.String(), nullable=False),
+    sa.Column('target_queue', sa.String(), nullable=False),
+    sa.Column('new_project_id', sa.String(), nullable=True),
+    sa.Column('new_project_short_id', sa.Integer(), nullable=True),
+    sa.Column('state', sa.JSON(), nullable=False),
+    sa.Column('status', sa.Enum('running', 'failed', 'completed', name='clonejournalstatus'), nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('run_id')
+    )
+    op.create_index(op.f('ix_clone_journals_status'), 'clone_journals', ['status'], unique=False)
+    op.create_index(op.f('ix_clone_journals_user_id'), 'clone_journals', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_clone_journals_user_id'), table_name='clone_journals')
+    op.drop_index(op.f('ix_clone_journals_status'), table_name='clone_journals')
+    op.drop_table('clone_journals')
+    sa.Enum(name='clonejournalstatus').drop(op.get_bind(), checkfirst=True)
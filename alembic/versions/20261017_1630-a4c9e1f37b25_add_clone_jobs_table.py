@@ -0,0 +1,57 @@
+"""Add clone_jobs table
+
+Revision ID: a4c9e1f37b25
+Revises: 7d21c4e8b6f0
+Create Date: 2026-10-17 16:30:12.418903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c9e1f37b25'
+down_revision: Union[str, Sequence[str], None] = '7d21c4e8b6f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('clone_jobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('journal_id', sa.Integer(), nullable=True),
+    sa.Column('source_project_id', sa.String(), nullable=False),
+    sa.Column('source_project_name', sa.String(), nullable=True),
+    sa.Column('new_project_name', sa.String(), nullable=False),
+    sa.Column('target_queue', sa.String(), nullable=False),
+    sa.Column('status', sa.Enum('queued', 'running', 'completed', 'failed', name='clonejobstatus'), nullable=False),
+    sa.Column('progress', sa.Integer(), nullable=False),
+    sa.Column('phase', sa.String(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('worker_id', sa.String(), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+    sa.Column('new_project_short_id', sa.Integer(), nullable=True),
+    sa.Column('created_count', sa.Integer(), nullable=True),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['journal_id'], ['clone_journals.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_clone_jobs_status'), 'clone_jobs', ['status'], unique=False)
+    op.create_index(op.f('ix_clone_jobs_user_id'), 'clone_jobs', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_clone_jobs_user_id'), table_name='clone_jobs')
+    op.drop_index(op.f('ix_clone_jobs_status'), table_name='clone_jobs')
+    op.drop_table('clone_jobs')
+    sa.Enum(name='clonejobstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,30 @@
+"""Add batch_id to clone_jobs
+
+Revision ID: c62f0d8e91a7
+Revises: a4c9e1f37b25
+Create Date: 2026-10-17 18:45:27.630154
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c62f0d8e91a7'
+down_revision: Union[str, Sequence[str], None] = 'a4c9e1f37b25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('clone_jobs', sa.Column('batch_id', sa.String(), nullable=True))
+    op.create_index(op.f('ix_clone_jobs_batch_id'), 'clone_jobs', ['batch_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_clone_jobs_batch_id'), table_name='clone_jobs')
+    op.drop_column('clone_jobs', 'batch_id')
@@ -0,0 +1,50 @@
+"""Add clone_runs table
+
+Revision ID: e3b7a5d14f62
+Revises: c62f0d8e91a7
+Create Date: 2026-10-17 20:10:41.205317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7a5d14f62'
+down_revision: Union[str, Sequence[str], None] = 'c62f0d8e91a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('clone_runs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('source_project_id', sa.String(), nullable=False),
+    sa.Column('new_project_short_id', sa.Integer(), nullable=True),
+    sa.Column('success', sa.Boolean(), nullable=False),
+    sa.Column('issues_count', sa.Integer(), nullable=False),
+    sa.Column('total_seconds', sa.Float(), nullable=False),
+    sa.Column('total_calls', sa.Integer(), nullable=False),
+    sa.Column('total_retries', sa.Integer(), nullable=False),
+    sa.Column('failures_count', sa.Integer(), nullable=False),
+    sa.Column('phases', sa.JSON(), nullable=False),
+    sa.Column('failures', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['clone_jobs.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_clone_runs_job_id'), 'clone_runs', ['job_id'], unique=False)
+    op.create_index(op.f('ix_clone_runs_user_id'), 'clone_runs', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_clone_runs_user_id'), table_name='clone_runs')
+    op.drop_index(op.f('ix_clone_runs_job_id'), table_name='clone_runs')
+    op.drop_table('clone_runs')
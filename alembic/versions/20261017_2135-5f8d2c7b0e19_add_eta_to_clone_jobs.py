@@ -0,0 +1,30 @@
+"""Add eta_seconds and items_per_second to clone_jobs
+
+Revision ID: 5f8d2c7b0e19
+Revises: e3b7a5d14f62
+Create Date: 2026-10-17 21:35:09.318246
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f8d2c7b0e19'
+down_revision: Union[str, Sequence[str], None] = 'e3b7a5d14f62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('clone_jobs', sa.Column('eta_seconds', sa.Integer(), nullable=True))
+    op.add_column('clone_jobs', sa.Column('items_per_second', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('clone_jobs', 'items_per_second')
+    op.drop_column('clone_jobs', 'eta_seconds')
@@ -0,0 +1,28 @@
+"""Add kind to clone_jobs
+
+Revision ID: 9b2e4f6a1c83
+Revises: 5f8d2c7b0e19
+Create Date: 2026-10-18 09:15:42.518307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e4f6a1c83'
+down_revision: Union[str, Sequence[str], None] = '5f8d2c7b0e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('clone_jobs', sa.Column('kind', sa.String(), server_default='clone', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('clone_jobs', 'kind')
@@ -0,0 +1 @@
+"""Бенчмарки клонирования проектов на локальном fake-сервере Tracker."""
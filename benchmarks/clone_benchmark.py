@@ -0,0 +1,403 @@
+"""Бенчмарк клонирования проектов на локальном fake-сервере Tracker.
+
+Запуск:
+    python -m benchmarks.clone_benchmark --sizes 10 100 1000
+    python -m benchmarks.clone_benchmark --sizes 5000 --latency 0.05 --rate-limit 50
+
+Для каждого размера шаблона измеряются fetch_project_data и clone_project
+(clone_project_streaming с --streaming, clone_project_batch с --batch N,
+создание задач через API импорта с --backend import):
+время, количество запросов к API по этапам и пиковая память (tracemalloc).
+Сервер работает в том же процессе, поэтому в пиковую память входят и буферы
+ответов сервера; данные шаблона генерируются до начала измерений.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from src.clone_pipeline import clone_project_streaming
+from src.clone_planner import ClonePlan, estimate_with_limiter, plan_clone
+from src.clone_progress import CloneProgress
+from src.clone_stats import CloneStats
+from src.project_cloner import (
+    ProjectCloner,
+    CloneTarget,
+    DEFAULT_MAX_CONCURRENCY,
+    CLONE_BACKENDS,
+    CLONE_PROFILES,
+    get_clone_profile,
+)
+from src.rate_limiter import TokenBucket, TrackerRateLimiter
+from src.reference_cache import TrackerReferenceData
+from src.tracker_client import TrackerClient
+from src.user_directory import load_user_directory
+
+from .fake_tracker import (
+    FakeTrackerConfig,
+    FakeTrackerServer,
+    FakeTrackerState,
+    generate_template,
+    template_stats,
+)
+
+# Размеры шаблонов по умолчанию (5000 - только явно, прогон занимает минуты)
+DEFAULT_SIZES = [10, 100, 1000]
+
+
+def _fetch_stage(value: float) -> str:
+    """Этап fetch_project_data по значению прогресса."""
+    if value < 5:
+        return "project"
+    if value < 40:
+        return "issues"
+    if value < 90:
+        return "details"
+    return "linked"
+
+
+def _clone_stage(value: float) -> str:
+    """Этап clone_project по значению прогресса."""
+    if value < 8:
+        return "project"
+    if value < 48:
+        return "issues"
+    if value < 50:
+        return "followers"
+    if value < 65:
+        return "checklists"
+    if value < 80:
+        return "links"
+    return "comments"
+
+
+@dataclass
+class StageResult:
+    """Результат измерения одного метода клонера."""
+
+    name: str
+    seconds: float = 0.0
+    peak_memory: int = 0
+    calls: Counter = field(default_factory=Counter)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+
+@dataclass
+class BenchmarkResult:
+    """Результат бенчмарка для одного шаблона."""
+
+    size: int
+    checklist_items: int
+    links: int
+    comments: int
+    stages: List[StageResult] = field(default_factory=list)
+    fetched_issues: int = 0
+    created_issues: int = 0
+    success: bool = False
+    errors: List[str] = field(default_factory=list)
+    http_requests: int = 0
+    throttled: int = 0
+    injected_errors: int = 0
+    retries: int = 0
+    plan: Optional[ClonePlan] = None
+    stats: Optional[CloneStats] = None  # CloneResult.stats первой копии
+
+
+def _endpoint_stage(endpoint: str, method: str) -> str:
+    """Этап по эндпоинту запроса (потоковое клонирование идет без этапов)."""
+    if endpoint.startswith("/users"):
+        return "users"
+    if endpoint.startswith("/entities"):
+        return "project"
+    if endpoint.startswith("/bulkchange"):
+        return "followers"
+    if endpoint.startswith("/issues/_search"):
+        return "search"
+    for name, stage in (("checklistItems", "checklists"), ("links", "links"), ("comments", "comments")):
+        if endpoint.endswith(name):
+            return stage if method != "GET" else "details"
+    return "issues"
+
+
+class CallCounter:
+    """Счетчик запросов к API с разбивкой по этапу клонирования."""
+
+    def __init__(self):
+        self.by_endpoint = False
+        self.result: Optional[StageResult] = None
+        self._progress: Optional[CloneProgress] = None
+        self._stage_of: Callable[[float], str] = lambda value: "project"
+
+    def install(self, tracker: TrackerClient) -> None:
+        """Обернуть client.request (поверх лимитера - считаются логические вызовы)."""
+        request = tracker.client.request
+
+        async def counted_request(endpoint, method="GET", data=None, params=None):
+            if self.result is not None:
+                # Справочник пользователей - общий этап пакета, считается по эндпоинту
+                if self.by_endpoint or self._progress is None or endpoint.startswith("/users"):
+                    stage = _endpoint_stage(endpoint, method)
+                else:
+                    stage = self._stage_of(self._progress.value)
+                self.result.calls[stage] += 1
+            return await request(endpoint, method, data, params)
+
+        tracker.client.request = counted_request
+
+    def follow(self, progress: CloneProgress, stage_of: Callable[[float], str]) -> None:
+        """Определять этап запроса по текущему значению счетчиков прогресса клонера."""
+        self._progress = progress
+        self._stage_of = stage_of
+
+
+async def _measure(counter: CallCounter, result: StageResult, coro):
+    """Выполнить корутину, измерив время и пиковую память."""
+    counter.result = result
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        result.seconds = time.perf_counter() - started
+        result.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        counter.result = None
+
+
+async def run_benchmark(
+    size: int,
+    server_config: FakeTrackerConfig,
+    concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    client_rate: float = 1000.0,
+    profile: str = "minimal",
+    streaming: bool = False,
+    batch: int = 1,
+    backend: str = "create",
+    dismissed: int = 0,
+    fallback_user: Optional[str] = None,
+) -> BenchmarkResult:
+    """
+    Прогнать клонирование шаблона заданного размера.
+
+    Args:
+        size: Количество задач шаблона
+        server_config: Настройки fake-сервера
+        concurrency: max_concurrency клонера
+        client_rate: Лимит запросов в секунду на стороне клиента
+        profile: Профиль загрузки задач (minimal, full)
+        streaming: Потоковое клонирование (clone_project_streaming)
+        batch: Количество копий шаблона (больше 1 - clone_project_batch)
+        backend: Способ создания задач (create, import)
+        dismissed: Сколько пользователей шаблона уволить перед клонированием
+        fallback_user: Пользователь вместо уволенных
+
+    Returns:
+        BenchmarkResult
+    """
+    state = FakeTrackerState()
+    project_id = generate_template(state, size, seed=server_config.seed)
+    issues_count, checklist_items, links, comments = template_stats(state, project_id)
+    state.dismiss_users(dismissed)
+
+    server = FakeTrackerServer(state, server_config)
+    base_url = await server.start()
+
+    rate_limiter = TrackerRateLimiter(bucket=TokenBucket(rate=client_rate, burst=max(1, int(client_rate))))
+    tracker = TrackerClient(
+        oauth_token="benchmark",
+        org_id="benchmark",
+        # Ответы 429/5xx ожидаемы - библиотека логирует каждый как ошибку
+        log_level="CRITICAL",
+        rate_limiter=rate_limiter,
+        base_url=base_url,
+    )
+
+    result = BenchmarkResult(
+        size=issues_count,
+        checklist_items=checklist_items,
+        links=links,
+        comments=comments,
+    )
+
+    try:
+        await tracker.start()
+        counter = CallCounter()
+        counter.install(tracker)
+        cloner = ProjectCloner(
+            tracker,
+            max_concurrency=concurrency,
+            profile=get_clone_profile(profile),
+            backend=backend,
+            fallback_user=fallback_user,
+        )
+
+        if streaming:
+            stage = StageResult("clone_project_streaming")
+            result.stages.append(stage)
+            counter.by_endpoint = True
+            clone_result, project_data = await _measure(
+                counter,
+                stage,
+                clone_project_streaming(cloner, project_id, f"Бенчмарк {size}", "WORK"),
+            )
+            result.fetched_issues = len(project_data.issues)
+        else:
+            stage = StageResult("fetch_project_data")
+            result.stages.append(stage)
+            counter.follow(cloner.progress, _fetch_stage)
+            project_data = await _measure(counter, stage, cloner.fetch_project_data(project_id))
+            result.fetched_issues = len(project_data.issues)
+            # Справочник пользователей для плана - отдельным кэшем и вне счетчика:
+            # клонер загрузит свой, и его запросы войдут в этап users
+            counter.result = None
+            users = await load_user_directory(TrackerReferenceData(tracker), fallback_user)
+            result.plan = estimate_with_limiter(
+                plan_clone(project_data, copies=batch, backend=backend, users=users),
+                rate_limiter,
+                concurrency,
+            )
+
+            if batch > 1:
+                # Копии идут одновременно - этапы считаются по эндпоинтам
+                stage = StageResult("clone_project_batch")
+                result.stages.append(stage)
+                counter.by_endpoint = True
+                targets = [CloneTarget(f"Бенчмарк {size} #{i + 1}", "WORK") for i in range(batch)]
+                clone_results = await _measure(
+                    counter, stage, cloner.clone_project_batch(project_data, targets)
+                )
+            else:
+                stage = StageResult("clone_project")
+                result.stages.append(stage)
+                counter.follow(cloner.progress, _clone_stage)
+                clone_results = [await _measure(
+                    counter,
+                    stage,
+                    cloner.clone_project(project_data, f"Бенчмарк {size}", "WORK"),
+                )]
+        if streaming:
+            clone_results = [clone_result]
+        result.created_issues = sum(len(r.new_issues_mapping) for r in clone_results)
+        result.success = all(r.success for r in clone_results)
+        result.errors = [error for r in clone_results for error in r.errors]
+        result.stats = clone_results[0].stats
+    finally:
+        await tracker.close()
+        await server.stop()
+
+    result.http_requests = server.requests_count
+    result.throttled = server.throttled_count
+    result.injected_errors = server.errors_count
+    result.retries = rate_limiter.retries_count
+    return result
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """Текстовый отчет по результату бенчмарка."""
+    lines = [
+        f"=== Шаблон: {result.size} задач, {result.checklist_items} пунктов чеклистов, "
+        f"{result.links} связей, {result.comments} комментариев ===",
+    ]
+    for stage in result.stages:
+        calls = ", ".join(f"{name}={count}" for name, count in stage.calls.items())
+        lines.append(
+            f"{stage.name:<20} {stage.seconds:8.2f} с  "
+            f"{stage.total_calls:6d} вызовов  "
+            f"пик памяти {stage.peak_memory / 1024 / 1024:7.1f} МБ  [{calls}]"
+        )
+    lines.append(
+        f"{'итого':<20} {sum(stage.seconds for stage in result.stages):8.2f} с  "
+        f"получено задач {result.fetched_issues}, создано {result.created_issues}, "
+        f"success={result.success}"
+    )
+    lines.append(
+        f"{'сервер':<20} HTTP-запросов {result.http_requests}, 429: {result.throttled}, "
+        f"ошибок 5xx: {result.injected_errors}, повторов клиента: {result.retries}"
+    )
+    if result.plan:
+        calls = ", ".join(f"{phase.name}={phase.calls}" for phase in result.plan.phases)
+        lines.append(
+            f"{'план':<20} {result.plan.total_seconds:8.2f} с  "
+            f"{result.plan.total_calls:6d} вызовов  [{calls}]"
+        )
+    if result.stats:
+        for name, phase in result.stats.to_dict().items():
+            latency = (
+                f"p50 {phase['p50'] * 1000:.0f} мс, p95 {phase['p95'] * 1000:.0f} мс"
+                if phase["p50"] is not None else "без запросов"
+            )
+            lines.append(
+                f"  {name:<18} {phase['seconds']:8.2f} с  {phase['calls']:6d} вызовов  "
+                f"повторов {phase['retries']}, ошибок {phase['failures']}, {latency}"
+            )
+    for error in result.errors[:5]:
+        lines.append(f"  ошибка: {error}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Разбор аргументов командной строки."""
+    parser = argparse.ArgumentParser(description="Бенчмарк клонирования проектов на fake-сервере Tracker")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Размеры шаблонов (задач), например: 10 100 1000 5000")
+    parser.add_argument("--latency", type=float, default=0.02, help="Задержка ответа сервера (с)")
+    parser.add_argument("--jitter", type=float, default=0.3, help="Разброс задержки (доля)")
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="Лимит сервера, запросов/с (0 - без лимита)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Доля ответов 5xx")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help="max_concurrency клонера")
+    parser.add_argument("--client-rate", type=float, default=1000.0,
+                        help="Лимит клиента, запросов/с")
+    parser.add_argument("--profile", choices=sorted(CLONE_PROFILES), default="minimal",
+                        help="Профиль загрузки задач")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Потоковое клонирование (получение и создание одновременно)")
+    parser.add_argument("--batch", type=int, default=1,
+                        help="Копий шаблона за один прогон (clone_project_batch)")
+    parser.add_argument("--backend", choices=CLONE_BACKENDS, default="create",
+                        help="Способ создания задач (import - API импорта)")
+    parser.add_argument("--no-import", action="store_true",
+                        help="Сервер отвечает 403 на импорт (проверка отката на create)")
+    parser.add_argument("--dismissed", type=int, default=0,
+                        help="Уволить N пользователей шаблона (проверка справочника пользователей)")
+    parser.add_argument("--fallback-user", default=None,
+                        help="Пользователь вместо уволенных (например, user0)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed генератора шаблонов")
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> List[BenchmarkResult]:
+    """Прогнать бенчмарк для всех размеров и вывести отчет."""
+    args = parse_args(argv)
+    server_config = FakeTrackerConfig(
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        error_rate=args.error_rate,
+        import_enabled=not args.no_import,
+        seed=args.seed,
+    )
+
+    results = []
+    for size in args.sizes:
+        result = await run_benchmark(
+            size, server_config, args.concurrency, args.client_rate, args.profile, args.streaming,
+            args.batch, args.backend, args.dismissed, args.fallback_user,
+        )
+        print(format_result(result), flush=True)
+        results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main())
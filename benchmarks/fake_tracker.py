@@ -0,0 +1,717 @@
+"""Локальный fake-сервер Yandex Tracker API для бенчмарков клонирования.
+
+Реализует эндпоинты, которые использует ProjectCloner: сущности (проекты),
+поиск/подсчет/создание/обновление задач, чеклисты, связи, комментарии,
+а также пользователей и очереди. Поддерживает задержку ответа, лимит
+запросов (429 с Retry-After) и случайные ошибки 5xx.
+"""
+
+import asyncio
+import itertools
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+
+# Размер страницы поиска задач по умолчанию (как в Tracker)
+DEFAULT_PER_PAGE = 50
+
+# Ключ очереди шаблона
+TEMPLATE_QUEUE = "TMPL"
+
+# Типы связей шаблона
+LINK_TYPES = ("relates", "depends", "duplicates")
+
+# relationship из issues.links.create -> (тип связи, задача запроса - сторона outward).
+# Отдельно от таблицы клонера, чтобы тесты замечали перепутанное направление:
+# как в Tracker, у "A depends on B" сторона outward - блокирующая задача B
+RELATIONSHIP_TYPES = {
+    "relates": ("relates", True),
+    "is dependent by": ("depends", True),
+    "depends on": ("depends", False),
+    "duplicates": ("duplicates", True),
+    "is duplicated by": ("duplicates", False),
+    "is parent task for": ("subtask", True),
+    "is subtask for": ("subtask", False),
+    "is epic of": ("epic", True),
+    "has epic": ("epic", False),
+}
+
+# Поля, которые Tracker возвращает при любом наборе fields
+BASE_FIELDS = {"self", "id", "key", "display"}
+
+# Переходы по статусам (expand=transitions)
+TRANSITIONS = [
+    {
+        "id": name,
+        "self": f"https://api.tracker.yandex.net/v3/transitions/{name}",
+        "display": display,
+        "to": {"id": str(idx), "key": name, "display": display},
+    }
+    for idx, (name, display) in enumerate((
+        ("start_progress", "В работу"),
+        ("need_info", "Требуется информация"),
+        ("review", "На ревью"),
+        ("resolve", "Решить"),
+        ("close", "Закрыть"),
+        ("reopen", "Переоткрыть"),
+    ))
+]
+
+
+@dataclass
+class FakeTrackerConfig:
+    """
+    Настройки fake-сервера.
+
+    Attributes:
+        latency: Средняя задержка ответа (в секундах)
+        latency_jitter: Разброс задержки (доля от latency)
+        rate_limit: Лимит запросов в секунду (0 - без лимита)
+        rate_burst: Размер всплеска для лимита запросов
+        error_rate: Доля запросов, завершающихся ошибкой 5xx
+        import_enabled: Разрешен импорт задач (иначе 403, как без прав администратора)
+        seed: Seed генератора случайных чисел
+    """
+
+    latency: float = 0.02
+    latency_jitter: float = 0.3
+    rate_limit: float = 0.0
+    rate_burst: int = 20
+    error_rate: float = 0.0
+    import_enabled: bool = True
+    seed: int = 42
+
+
+@dataclass
+class FakeTrackerState:
+    """Данные fake-сервера."""
+
+    projects: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    issues: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    checklists: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    links: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    comments: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    users: List[Dict[str, Any]] = field(default_factory=list)
+    queues: List[Dict[str, Any]] = field(default_factory=list)
+    unique: Dict[str, str] = field(default_factory=dict)
+    bulk_changes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    issue_counters: Dict[str, itertools.count] = field(default_factory=dict)
+    project_counter: itertools.count = field(default_factory=lambda: itertools.count(1000))
+    link_counter: itertools.count = field(default_factory=lambda: itertools.count(1))
+
+    def dismiss_users(self, count: int) -> None:
+        """Уволить последних count пользователей (руководитель шаблона - первый)."""
+        for user in self.users[len(self.users) - count:] if count > 0 else []:
+            user["dismissed"] = True
+
+    def next_issue_key(self, queue: str) -> str:
+        """Следующий ключ задачи в очереди."""
+        counter = self.issue_counters.setdefault(queue, itertools.count(1))
+        return f"{queue}-{next(counter)}"
+
+
+def generate_template(
+    state: FakeTrackerState, issues_count: int, seed: int = 42
+) -> str:
+    """
+    Сгенерировать синтетический проект-шаблон.
+
+    Иерархия до 4 уровней, около трети задач с чеклистами, пятая часть со
+    связями и до трех комментариев на задачу.
+
+    Args:
+        state: Данные fake-сервера
+        issues_count: Количество задач шаблона
+        seed: Seed генератора
+
+    Returns:
+        ID проекта-шаблона
+    """
+    rnd = random.Random(seed)
+
+    if not state.users:
+        state.users = [
+            {"id": str(1000 + i), "uid": 1000 + i, "login": f"user{i}", "display": f"User {i}"}
+            for i in range(20)
+        ]
+    if not state.queues:
+        state.queues = [
+            {"id": 1, "key": TEMPLATE_QUEUE, "name": "Шаблоны"},
+            {"id": 2, "key": "WORK", "name": "Рабочая очередь"},
+        ]
+
+    project_short_id = next(state.project_counter)
+    project_id = f"tmpl{project_short_id:08x}"
+    lead = state.users[0]
+    state.projects[project_id] = {
+        "id": project_id,
+        "shortId": project_short_id,
+        "entityType": "project",
+        "fields": {
+            "summary": f"Шаблон на {issues_count} задач",
+            "description": "Синтетический шаблон для бенчмарка",
+            "lead": {"id": lead["id"], "display": lead["display"]},
+            "teamUsers": [{"id": u["id"]} for u in state.users[:5]],
+            "teamAccess": True,
+            "updatedAt": "2026-01-01T00:00:00.000+0000",
+        },
+    }
+
+    keys: List[str] = []
+    depth: Dict[str, int] = {}
+    for idx in range(1, issues_count + 1):
+        key = state.next_issue_key(TEMPLATE_QUEUE)
+        assignee, follower = rnd.sample(state.users, 2)
+        issue = {
+            "id": f"id-{key}",
+            "key": key,
+            "summary": f"Задача шаблона {idx}",
+            "description": "Описание задачи " * rnd.randint(1, 20),
+            "type": {"id": "2", "key": "task", "display": "Задача"},
+            "priority": {"id": "3", "key": "normal", "display": "Средний"},
+            "queue": {"id": "1", "key": TEMPLATE_QUEUE},
+            "assignee": {"id": assignee["id"], "login": assignee["login"]},
+            "followers": [{"id": follower["id"], "login": follower["login"]}],
+            "tags": ["шаблон"] if rnd.random() < 0.3 else [],
+            "project": {"primary": {"id": project_id, "shortId": project_short_id}},
+            "createdAt": "2026-01-01T00:00:00.000+0000",
+            # Служебные поля полного ответа (клонированием не используются)
+            "self": f"https://api.tracker.yandex.net/v3/issues/{key}",
+            "version": rnd.randint(1, 50),
+            "status": {"id": "1", "key": "open", "display": "Открыт"},
+            "statusType": {"id": "new", "display": "Новый", "key": "new"},
+            "createdBy": {"id": lead["id"], "display": lead["display"]},
+            "updatedBy": {"id": assignee["id"], "display": assignee["display"]},
+            "votes": 0,
+            "favorite": False,
+            "updatedAt": f"2026-01-01T00:00:00.{idx % 1000:03d}+0000",
+        }
+
+        # Иерархия: ~60% задач - подзадачи уже созданных, глубина до 4
+        parents = [k for k in keys[-50:] if depth[k] < 3]
+        if parents and rnd.random() < 0.6:
+            parent_key = rnd.choice(parents)
+            issue["parent"] = {"key": parent_key, "id": f"id-{parent_key}"}
+            depth[key] = depth[parent_key] + 1
+        else:
+            depth[key] = 0
+
+        if rnd.random() < 0.35:
+            items = [
+                {"id": f"{key}-c{j}", "text": f"Пункт {j} задачи {idx}", "checked": rnd.random() < 0.2}
+                for j in range(rnd.randint(1, 5))
+            ]
+            state.checklists[key] = items
+            issue["checklistItems"] = items
+
+        state.comments[key] = [
+            {"id": next(state.link_counter), "text": f"Комментарий {j} к задаче {idx}"}
+            for j in range(rnd.randint(0, 3))
+        ]
+
+        state.issues[key] = issue
+        keys.append(key)
+
+    # Связи между задачами шаблона (обе стороны, как возвращает Tracker)
+    for key in keys:
+        if rnd.random() < 0.2 and len(keys) > 1:
+            other = rnd.choice(keys)
+            if other != key:
+                _add_link(state, key, rnd.choice(LINK_TYPES), other)
+
+    return project_id
+
+
+def _add_link(state: FakeTrackerState, key: str, relationship: str, other: str) -> Dict[str, Any]:
+    """Создать связь между задачами (с обратной стороной)."""
+    link_id = next(state.link_counter)
+    link = {
+        "id": link_id,
+        "type": {"id": relationship, "inward": relationship, "outward": relationship},
+        "direction": "outward",
+        "object": {"key": other, "id": f"id-{other}"},
+    }
+    state.links.setdefault(key, []).append(link)
+    state.links.setdefault(other, []).append({
+        "id": link_id,
+        "type": link["type"],
+        "direction": "inward",
+        "object": {"key": key, "id": f"id-{key}"},
+    })
+    return link
+
+
+def _add_followers(issue: Dict[str, Any], follower_ids: List[str]) -> None:
+    """Добавить наблюдателей задачи (повторное добавление ничего не меняет)."""
+    followers = issue.setdefault("followers", [])
+    known = {f.get("id") for f in followers} | {f.get("login") for f in followers}
+    followers.extend({"id": f} for f in follower_ids if f not in known)
+
+
+class FakeTrackerServer:
+    """HTTP-сервер, имитирующий Tracker API (префикс /v3)."""
+
+    def __init__(self, state: FakeTrackerState, config: Optional[FakeTrackerConfig] = None):
+        """
+        Args:
+            state: Данные сервера
+            config: Настройки задержек, лимитов и ошибок
+        """
+        self.state = state
+        self.config = config or FakeTrackerConfig()
+        self._random = random.Random(self.config.seed)
+        self._tokens = float(self.config.rate_burst)
+        self._tokens_at = time.monotonic()
+        self._runner: Optional[web.AppRunner] = None
+        self.requests_count = 0
+        self.throttled_count = 0
+        self.errors_count = 0
+
+    def make_app(self) -> web.Application:
+        """Создать aiohttp-приложение с маршрутами API."""
+        app = web.Application(middlewares=[self._middleware], client_max_size=16 * 1024 ** 2)
+        app.router.add_get("/v3/entities/{entity_type}/{entity_id}", self.get_entity)
+        app.router.add_post("/v3/entities/{entity_type}/_search", self.search_entities)
+        app.router.add_post("/v3/entities/{entity_type}", self.create_entity)
+        app.router.add_post("/v3/issues/_search", self.search_issues)
+        app.router.add_post("/v3/issues/_count", self.count_issues)
+        app.router.add_post("/v3/issues/", self.create_issue)
+        app.router.add_post("/v3/issues/_import", self.import_issue)
+        app.router.add_get("/v3/issues/{key}", self.get_issue)
+        app.router.add_patch("/v3/issues/{key}", self.update_issue)
+        app.router.add_get("/v3/issues/{key}/checklistItems", self.get_checklist)
+        app.router.add_post("/v3/issues/{key}/checklistItems", self.create_checklist_item)
+        app.router.add_get("/v3/issues/{key}/links", self.get_links)
+        app.router.add_post("/v3/issues/{key}/links", self.create_link)
+        app.router.add_get("/v3/issues/{key}/comments", self.get_comments)
+        app.router.add_post("/v3/issues/{key}/comments", self.create_comment)
+        app.router.add_post("/v3/bulkchange/_update", self.create_bulk_change)
+        app.router.add_get("/v3/bulkchange/{operation_id}", self.get_bulk_change)
+        app.router.add_get("/v3/users", self.get_users)
+        app.router.add_get("/v3/myself", self.get_myself)
+        app.router.add_get("/v3/queues/", self.get_queues)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Запустить сервер.
+
+        Args:
+            host: Адрес
+            port: Порт (0 - свободный)
+
+        Returns:
+            Базовый URL API (для TrackerClient(base_url=...))
+        """
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{bound_port}/v3"
+
+    async def stop(self) -> None:
+        """Остановить сервер."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        """Задержка, лимит запросов и внедрение ошибок."""
+        self.requests_count += 1
+        config = self.config
+
+        if config.rate_limit > 0 and not self._take_token():
+            self.throttled_count += 1
+            return web.json_response(
+                {"errorMessages": ["Too many requests"]}, status=429, headers={"Retry-After": "1"}
+            )
+
+        if config.latency > 0:
+            jitter = config.latency * config.latency_jitter
+            await asyncio.sleep(max(0.0, config.latency + self._random.uniform(-jitter, jitter)))
+
+        if config.error_rate > 0 and self._random.random() < config.error_rate:
+            self.errors_count += 1
+            return web.json_response(
+                {"errorMessages": ["Injected error"]}, status=self._random.choice((500, 503))
+            )
+
+        return await handler(request)
+
+    def _take_token(self) -> bool:
+        """Token bucket лимита запросов."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.config.rate_burst),
+            self._tokens + (now - self._tokens_at) * self.config.rate_limit,
+        )
+        self._tokens_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    @staticmethod
+    async def _json(request: web.Request) -> Dict[str, Any]:
+        """Тело запроса (пустой dict, если тела нет)."""
+        if not request.body_exists:
+            return {}
+        return json.loads(await request.text() or "{}")
+
+    @staticmethod
+    def _not_found() -> web.Response:
+        return web.json_response({"errorMessages": ["Not found"]}, status=404)
+
+    # === Сущности ===
+
+    async def get_entity(self, request: web.Request) -> web.Response:
+        project = self.state.projects.get(request.match_info["entity_id"])
+        return web.json_response(project) if project else self._not_found()
+
+    async def search_entities(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        text = (body.get("input") or "").lower()
+        values = [
+            p for p in self.state.projects.values()
+            if text in p["fields"].get("summary", "").lower()
+        ]
+        per_page = int(request.query.get("perPage", DEFAULT_PER_PAGE))
+        page = int(request.query.get("page", 1))
+        pages = max(1, -(-len(values) // per_page))
+        return web.json_response({
+            "hits": len(values),
+            "pages": pages,
+            "values": values[(page - 1) * per_page:page * per_page],
+        })
+
+    async def create_entity(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        fields = body.get("fields", {})
+        error = self._check_users([fields.get("lead"), *(fields.get("teamUsers") or [])])
+        if error:
+            return error
+
+        short_id = next(self.state.project_counter)
+        project = {
+            "id": f"proj{short_id:08x}",
+            "shortId": short_id,
+            "entityType": request.match_info["entity_type"],
+            "fields": body.get("fields", {}),
+        }
+        self.state.projects[project["id"]] = project
+        return web.json_response(project, status=201)
+
+    # === Задачи ===
+
+    def _filter_issues(self, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Задачи, подходящие под тело запроса _search/_count."""
+        if body.get("keys"):
+            keys = body["keys"] if isinstance(body["keys"], list) else [body["keys"]]
+            return [self.state.issues[k] for k in keys if k in self.state.issues]
+
+        issues = list(self.state.issues.values())
+        for name, value in (body.get("filter") or {}).items():
+            if name == "project":
+                issues = [
+                    i for i in issues
+                    if str(i.get("project", {}).get("primary", {}).get("id")) == str(value)
+                ]
+            elif name == "unique":
+                key = self.state.unique.get(value)
+                issues = [self.state.issues[key]] if key else []
+            elif name == "parent":
+                issues = [i for i in issues if i.get("parent", {}).get("key") == value]
+            elif name == "queue":
+                issues = [i for i in issues if i.get("queue", {}).get("key") == value]
+        return issues
+
+    async def search_issues(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        issues = self._filter_issues(body)
+
+        order = body.get("order")
+        if order:
+            field_name = order.lstrip("+-")
+            issues = sorted(issues, key=lambda i: str(i.get(field_name, "")), reverse=order.startswith("-"))
+
+        per_page = int(request.query.get("perPage", DEFAULT_PER_PAGE))
+        page = int(request.query.get("page", 1))
+        total = len(issues)
+        pages = max(1, -(-total // per_page))
+        fields = set(filter(None, request.query.get("fields", "").split(",")))
+        expand = set(request.query.get("expand", "").split(","))
+        return web.json_response(
+            [self._render_issue(i, fields, expand) for i in issues[(page - 1) * per_page:page * per_page]],
+            headers={"X-Total-Count": str(total), "X-Total-Pages": str(pages)},
+        )
+
+    @staticmethod
+    def _render_issue(issue: Dict[str, Any], fields: set, expand: set) -> Dict[str, Any]:
+        """Задача в ответе поиска с учетом fields и expand."""
+        if fields:
+            rendered = {k: v for k, v in issue.items() if k in fields or k in BASE_FIELDS}
+        else:
+            rendered = dict(issue)
+        if "transitions" in expand:
+            rendered["transitions"] = TRANSITIONS
+        if "attachments" in expand:
+            rendered["attachments"] = []
+        return rendered
+
+    async def count_issues(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        return web.json_response(len(self._filter_issues(body)))
+
+    async def get_issue(self, request: web.Request) -> web.Response:
+        issue = self.state.issues.get(request.match_info["key"])
+        return web.json_response(issue) if issue else self._not_found()
+
+    async def create_issue(self, request: web.Request) -> web.Response:
+        return self._create_issue(await self._json(request))
+
+    async def import_issue(self, request: web.Request) -> web.Response:
+        if not self.config.import_enabled:
+            return web.json_response({"errorMessages": ["Forbidden"]}, status=403)
+
+        body = await self._json(request)
+        if not body.get("createdAt") or not body.get("createdBy"):
+            return web.json_response({"errorMessages": ["createdAt and createdBy are required"]}, status=400)
+        # Импорт не проверяет unique: повтор создает вторую задачу
+        body.pop("unique", None)
+        return self._create_issue(body)
+
+    def _check_users(self, users: List[Any]) -> Optional[web.Response]:
+        """Ответ 422, если среди пользователей есть уволенный или неизвестный."""
+        active = {
+            str(user[name])
+            for user in self.state.users
+            if not user.get("dismissed")
+            for name in ("id", "uid", "login")
+        }
+        for user in users:
+            if isinstance(user, dict):
+                user = user.get("login") or user.get("id")
+            if user not in (None, "") and str(user) not in active:
+                return web.json_response({"errorMessages": [f"User {user} is not active"]}, status=422)
+        return None
+
+    def _create_issue(self, body: Dict[str, Any]) -> web.Response:
+        """Создать задачу (issues.create и импорт)."""
+        error = self._check_users([body.get("assignee"), *(body.get("followers") or [])])
+        if error:
+            return error
+
+        unique = body.get("unique")
+        if unique and unique in self.state.unique:
+            return web.json_response({"errorMessages": ["Issue already exists"]}, status=409)
+
+        queue = body.get("queue")
+        queue_key = queue.get("key") if isinstance(queue, dict) else queue
+        key = self.state.next_issue_key(queue_key or "WORK")
+
+        issue = {
+            "id": f"id-{key}",
+            "key": key,
+            "summary": body.get("summary"),
+            "description": body.get("description", ""),
+            "queue": {"key": queue_key},
+            "updatedAt": "2026-01-01T00:00:00.000+0000",
+        }
+        parent = body.get("parent")
+        if parent:
+            parent_key = parent.get("key") if isinstance(parent, dict) else parent
+            issue["parent"] = {"key": parent_key}
+        project = body.get("project")
+        if isinstance(project, dict) and project.get("primary"):
+            issue["project"] = {"primary": {"shortId": project["primary"]}}
+        if body.get("followers"):
+            _add_followers(issue, body["followers"])
+        # Импорт задает время создания и автора
+        if body.get("createdAt"):
+            issue["createdAt"] = body["createdAt"]
+        if body.get("createdBy"):
+            issue["createdBy"] = {"id": body["createdBy"]}
+
+        self.state.issues[key] = issue
+        if unique:
+            self.state.unique[unique] = key
+        return web.json_response(issue, status=201)
+
+    async def update_issue(self, request: web.Request) -> web.Response:
+        issue = self.state.issues.get(request.match_info["key"])
+        if not issue:
+            return self._not_found()
+
+        body = await self._json(request)
+        followers = body.get("followers")
+        if isinstance(followers, dict):
+            error = self._check_users(followers.get("add", []))
+            if error:
+                return error
+
+        for name, value in body.items():
+            if name == "parent":
+                issue["parent"] = value if isinstance(value, dict) else {"key": value}
+            elif name == "followers" and isinstance(value, dict):
+                _add_followers(issue, value.get("add", []))
+            else:
+                issue[name] = value
+        return web.json_response(issue)
+
+    # === Чеклисты, связи, комментарии ===
+
+    async def get_checklist(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        if key not in self.state.issues:
+            return self._not_found()
+        return web.json_response(self.state.checklists.get(key, []))
+
+    async def create_checklist_item(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        issue = self.state.issues.get(key)
+        if not issue:
+            return self._not_found()
+
+        body = await self._json(request)
+        items = self.state.checklists.setdefault(key, [])
+        items.append({"id": f"{key}-c{len(items)}", "text": body.get("text"), "checked": bool(body.get("checked"))})
+        issue["checklistItems"] = items
+        return web.json_response(issue, status=201)
+
+    async def get_links(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        if key not in self.state.issues:
+            return self._not_found()
+        return web.json_response(self.state.links.get(key, []))
+
+    async def create_link(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        body = await self._json(request)
+        other = body.get("issue")
+        if key not in self.state.issues or other not in self.state.issues:
+            return self._not_found()
+
+        type_id, outward = RELATIONSHIP_TYPES.get(body.get("relationship"), (None, True))
+        if not type_id:
+            return web.json_response({"errorMessages": ["Unknown relationship"]}, status=400)
+
+        # Между двумя задачами может быть только одна связь каждого типа
+        existing = [
+            link for link in self.state.links.get(key, [])
+            if link["object"]["key"] == other and link["type"]["id"] == type_id
+        ]
+        if existing:
+            return web.json_response({"errorMessages": ["Link already exists"]}, status=422)
+        if outward:
+            return web.json_response(_add_link(self.state, key, type_id, other), status=201)
+        _add_link(self.state, other, type_id, key)
+        return web.json_response(self.state.links[key][-1], status=201)
+
+    async def get_comments(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        if key not in self.state.issues:
+            return self._not_found()
+        return web.json_response(self.state.comments.get(key, []))
+
+    async def create_comment(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        if key not in self.state.issues:
+            return self._not_found()
+
+        body = await self._json(request)
+        comment = {"id": next(self.state.link_counter), "text": body.get("text", "")}
+        self.state.comments.setdefault(key, []).append(comment)
+        return web.json_response(comment, status=201)
+
+    # === Массовые изменения ===
+
+    async def create_bulk_change(self, request: web.Request) -> web.Response:
+        """Создать операцию (выполняется при первом опросе статуса)."""
+        body = await self._json(request)
+        operation_id = f"bulk{next(self.state.link_counter)}"
+        self.state.bulk_changes[operation_id] = {
+            "id": operation_id,
+            "status": "CREATED",
+            "statusText": "Bulk change task created.",
+            "totalIssues": len(body.get("issues", [])),
+            "totalCompletedIssues": 0,
+            "_issues": body.get("issues", []),
+            "_values": body.get("values", {}),
+        }
+        return web.json_response(self._public_bulk(operation_id), status=201)
+
+    async def get_bulk_change(self, request: web.Request) -> web.Response:
+        operation_id = request.match_info["operation_id"]
+        operation = self.state.bulk_changes.get(operation_id)
+        if not operation:
+            return self._not_found()
+
+        if operation["status"] == "CREATED":
+            completed = 0
+            followers = operation["_values"].get("followers")
+            users_error = isinstance(followers, dict) and self._check_users(followers.get("add", []))
+            for key in operation["_issues"]:
+                issue = self.state.issues.get(key)
+                if not issue or users_error:
+                    continue
+                for name, value in operation["_values"].items():
+                    if name == "followers" and isinstance(value, dict):
+                        _add_followers(issue, value.get("add", []))
+                    else:
+                        issue[name] = value
+                completed += 1
+            operation["totalCompletedIssues"] = completed
+            operation["status"] = "COMPLETE" if completed == operation["totalIssues"] else "FAILED"
+            operation["statusText"] = "Bulk change task completed."
+        return web.json_response(self._public_bulk(operation_id))
+
+    def _public_bulk(self, operation_id: str) -> Dict[str, Any]:
+        """Операция без служебных полей fake-сервера."""
+        return {k: v for k, v in self.state.bulk_changes[operation_id].items() if not k.startswith("_")}
+
+    # === Справочники ===
+
+    async def get_users(self, request: web.Request) -> web.Response:
+        per_page = int(request.query.get("perPage", DEFAULT_PER_PAGE))
+        page = int(request.query.get("page", 1))
+        total = len(self.state.users)
+        return web.json_response(
+            self.state.users[(page - 1) * per_page:page * per_page],
+            headers={"X-Total-Count": str(total), "X-Total-Pages": str(max(1, -(-total // per_page)))},
+        )
+
+    async def get_myself(self, request: web.Request) -> web.Response:
+        return web.json_response({"uid": 1, "login": "benchmark", "display": "Benchmark"})
+
+    async def get_queues(self, request: web.Request) -> web.Response:
+        return web.json_response(self.state.queues)
+
+
+def template_stats(state: FakeTrackerState, project_id: str) -> Tuple[int, int, int, int]:
+    """
+    Размер шаблона.
+
+    Args:
+        state: Данные сервера
+        project_id: ID проекта-шаблона
+
+    Returns:
+        Кортеж (задачи, пункты чеклистов, связи, комментарии)
+    """
+    keys = [
+        key for key, issue in state.issues.items()
+        if issue.get("project", {}).get("primary", {}).get("id") == project_id
+    ]
+    return (
+        len(keys),
+        sum(len(state.checklists.get(k, [])) for k in keys),
+        sum(len(state.links.get(k, [])) for k in keys),
+        sum(len(state.comments.get(k, [])) for k in keys),
+    )
@@ -1,6 +1,6 @@
-from .models import User, UserSettings, UserRole, PaymentRequest, PaymentRequestStatus, BillingNotification
+from .models import User, UserSettings, UserRole, PaymentRequest, PaymentRequestStatus, BillingNotification, TemplateSnapshot, CloneJournalRecord, CloneJournalStatus, CloneJob, CloneJobKind, CloneJobStatus, CloneRun, utcnow
 from .database import init_db, init_default_owners, get_session
-from .crud import UserCRUD, PaymentRequestCRUD, BillingNotificationCRUD
+from .crud import UserCRUD, PaymentRequestCRUD, BillingNotificationCRUD, TemplateSnapshotCRUD, CloneJournalCRUD, CloneJobCRUD, CloneRunCRUD
 
 __all__ = [
     "User",
@@ -9,10 +9,22 @@ __all__ = [
     "PaymentRequest",
     "PaymentRequestStatus",
     "BillingNotification",
+    "TemplateSnapshot",
+    "CloneJournalRecord",
+    "CloneJournalStatus",
+    "CloneJob",
+    "CloneJobKind",
+    "CloneJobStatus",
+    "CloneRun",
+    "utcnow",
     "init_db",
     "init_default_owners",
     "get_session",
     "UserCRUD",
     "PaymentRequestCRUD",
     "BillingNotificationCRUD",
+    "TemplateSnapshotCRUD",
+    "CloneJournalCRUD",
+    "CloneJobCRUD",
+    "CloneRunCRUD",
 ]
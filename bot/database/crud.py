@@ -1,9 +1,9 @@
-from typing import Optional, List
+from typing import Optional, List, Sequence, Tuple
 from datetime import datetime, date
-from sqlalchemy import select, func, case, Float
+from sqlalchemy import select, update, func, case, or_, Float
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from .models import User, UserSettings, UserRole, PaymentRequest, PaymentRequestStatus, BillingNotification
+from .models import User, UserSettings, UserRole, PaymentRequest, PaymentRequestStatus, BillingNotification, TemplateSnapshot, CloneJournalRecord, CloneJournalStatus, CloneJob, CloneJobKind, CloneJobStatus, CloneRun, utcnow
 
 class UserCRUD:
     """CRUD операции для работы с пользователями"""
@@ -341,8 +341,6 @@ class PaymentRequestCRUD:
         Returns:
             Созданный запрос на оплату
         """
-        from datetime import datetime as dt
-
         payment_request = PaymentRequest(
             created_by_id=created_by_id,
             title=title,
@@ -351,7 +349,7 @@ class PaymentRequestCRUD:
             invoice_file_id=invoice_file_id,
             payment_proof_file_id=payment_proof_file_id,
             status=status.value if isinstance(status, PaymentRequestStatus) else status,
-            created_at=created_at if created_at else dt.utcnow(),
+            created_at=created_at if created_at else utcnow(),
             paid_at=paid_at,
             paid_by_id=paid_by_id,
             scheduled_date=scheduled_date,
@@ -551,7 +549,7 @@ class PaymentRequestCRUD:
             if hasattr(payment_request, key):
                 setattr(payment_request, key, value)
 
-        payment_request.updated_at = datetime.utcnow()
+        payment_request.updated_at = utcnow()
         await session.commit()
         await session.refresh(payment_request)
         return payment_request
@@ -621,7 +619,7 @@ class PaymentRequestCRUD:
         update_data = {
             "status": PaymentRequestStatus.PAID.value,
             "paid_by_id": paid_by_id,
-            "paid_at": datetime.utcnow(),
+            "paid_at": utcnow(),
             "payment_proof_file_id": payment_proof_file_id,
         }
 
@@ -1081,3 +1079,749 @@ class BillingNotificationCRUD:
 
         await session.commit()
         return True
+
+
+class TemplateSnapshotCRUD:
+    """CRUD операции для работы со снимками проектов-шаблонов"""
+
+    @staticmethod
+    async def get_snapshot(
+        session: AsyncSession,
+        project_id: str,
+    ) -> Optional[TemplateSnapshot]:
+        """Получает снимок проекта-шаблона
+
+        Args:
+            session: Сессия БД
+            project_id: ID проекта в Tracker
+
+        Returns:
+            Снимок или None
+        """
+        return await session.get(TemplateSnapshot, project_id)
+
+    @staticmethod
+    async def get_all_snapshot_ids(session: AsyncSession) -> List[str]:
+        """Получает ID всех проектов, для которых есть снимки
+
+        Args:
+            session: Сессия БД
+
+        Returns:
+            Список ID проектов
+        """
+        result = await session.execute(select(TemplateSnapshot.project_id))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def save_snapshot(
+        session: AsyncSession,
+        project_id: str,
+        fingerprint: str,
+        payload: bytes,
+        issues_count: int,
+        project_name: Optional[str] = None,
+    ) -> TemplateSnapshot:
+        """Создает или обновляет снимок проекта-шаблона
+
+        Args:
+            session: Сессия БД
+            project_id: ID проекта в Tracker
+            fingerprint: Отпечаток задач проекта
+            payload: Сжатый JSON с ProjectData
+            issues_count: Количество задач в снимке
+            project_name: Название проекта
+
+        Returns:
+            Сохраненный снимок
+        """
+        snapshot = await session.get(TemplateSnapshot, project_id)
+        if snapshot is None:
+            snapshot = TemplateSnapshot(project_id=project_id)
+            session.add(snapshot)
+
+        snapshot.fingerprint = fingerprint
+        snapshot.payload = payload
+        snapshot.issues_count = issues_count
+        if project_name:
+            snapshot.project_name = project_name
+
+        await session.commit()
+        await session.refresh(snapshot)
+        return snapshot
+
+    @staticmethod
+    async def delete_snapshot(session: AsyncSession, project_id: str) -> bool:
+        """Удаляет снимок проекта-шаблона
+
+        Args:
+            session: Сессия БД
+            project_id: ID проекта в Tracker
+
+        Returns:
+            True если снимок был удален
+        """
+        snapshot = await session.get(TemplateSnapshot, project_id)
+        if not snapshot:
+            return False
+
+        await session.delete(snapshot)
+        await session.commit()
+        return True
+
+
+class CloneJournalCRUD:
+    """CRUD операции для работы с журналами клонирования"""
+
+    @staticmethod
+    async def create_journal(
+        session: AsyncSession,
+        run_id: str,
+        source_project_id: str,
+        new_project_name: str,
+        target_queue: str,
+        user_id: Optional[int] = None,
+        source_project_name: Optional[str] = None,
+    ) -> CloneJournalRecord:
+        """Создает журнал нового клонирования
+
+        Args:
+            session: Сессия БД
+            run_id: Идентификатор прогона
+            source_project_id: ID проекта-шаблона
+            new_project_name: Название нового проекта
+            target_queue: Очередь для новых задач
+            user_id: ID пользователя, запустившего клонирование
+            source_project_name: Название проекта-шаблона
+
+        Returns:
+            Созданный журнал
+        """
+        journal = CloneJournalRecord(
+            user_id=user_id,
+            run_id=run_id,
+            source_project_id=source_project_id,
+            source_project_name=source_project_name,
+            new_project_name=new_project_name,
+            target_queue=target_queue,
+            state={},
+            status=CloneJournalStatus.RUNNING.value,
+        )
+        session.add(journal)
+        await session.commit()
+        await session.refresh(journal)
+        return journal
+
+    @staticmethod
+    async def get_journal(
+        session: AsyncSession,
+        journal_id: int,
+    ) -> Optional[CloneJournalRecord]:
+        """Получает журнал клонирования по ID
+
+        Args:
+            session: Сессия БД
+            journal_id: ID журнала
+
+        Returns:
+            Журнал или None
+        """
+        return await session.get(CloneJournalRecord, journal_id)
+
+    @staticmethod
+    async def get_unfinished_journals(
+        session: AsyncSession,
+        user_id: int,
+    ) -> List[CloneJournalRecord]:
+        """Получает незавершенные клонирования пользователя (новые первыми)
+
+        Args:
+            session: Сессия БД
+            user_id: ID пользователя
+
+        Returns:
+            Список журналов со статусом RUNNING или FAILED
+        """
+        query = (
+            select(CloneJournalRecord)
+            .where(
+                CloneJournalRecord.user_id == user_id,
+                CloneJournalRecord.status != CloneJournalStatus.COMPLETED.value,
+            )
+            .order_by(CloneJournalRecord.updated_at.desc())
+        )
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def save_checkpoint(
+        session: AsyncSession,
+        journal_id: int,
+        state: dict,
+        new_project_id: Optional[str] = None,
+        new_project_short_id: Optional[int] = None,
+    ) -> Optional[CloneJournalRecord]:
+        """Сохраняет контрольную точку клонирования
+
+        Args:
+            session: Сессия БД
+            journal_id: ID журнала
+            state: Прогресс клонирования (CloneJournal.to_state())
+            new_project_id: ID созданного проекта
+            new_project_short_id: shortId созданного проекта
+
+        Returns:
+            Обновленный журнал или None
+        """
+        journal = await session.get(CloneJournalRecord, journal_id)
+        if not journal:
+            return None
+
+        journal.state = state
+        if new_project_id:
+            journal.new_project_id = new_project_id
+        if new_project_short_id:
+            journal.new_project_short_id = new_project_short_id
+
+        await session.commit()
+        return journal
+
+    @staticmethod
+    async def set_status(
+        session: AsyncSession,
+        journal_id: int,
+        status: CloneJournalStatus,
+        error: Optional[str] = None,
+    ) -> Optional[CloneJournalRecord]:
+        """Устанавливает статус журнала клонирования
+
+        Args:
+            session: Сессия БД
+            journal_id: ID журнала
+            status: Новый статус
+            error: Текст ошибки (для FAILED)
+
+        Returns:
+            Обновленный журнал или None
+        """
+        journal = await session.get(CloneJournalRecord, journal_id)
+        if not journal:
+            return None
+
+        journal.status = status.value
+        journal.error = error
+        await session.commit()
+        return journal
+
+
+# Ключ advisory-блокировки PostgreSQL, под которой воркеры берут задания
+CLONE_JOB_CLAIM_LOCK_ID = 0x636C6F6E
+
+
+class CloneJobCRUD:
+    """CRUD операции для работы с очередью заданий на клонирование"""
+
+    @staticmethod
+    async def create_job(
+        session: AsyncSession,
+        source_project_id: str,
+        new_project_name: str,
+        target_queue: str,
+        user_id: Optional[int] = None,
+        source_project_name: Optional[str] = None,
+        journal_id: Optional[int] = None,
+        kind: CloneJobKind = CloneJobKind.CLONE,
+    ) -> CloneJob:
+        """Ставит задание на клонирование в очередь
+
+        Args:
+            session: Сессия БД
+            source_project_id: ID проекта-шаблона
+            new_project_name: Название нового проекта
+            target_queue: Очередь для новых задач
+            user_id: ID пользователя, поставившего задание
+            source_project_name: Название проекта-шаблона
+            journal_id: ID журнала (для продолжения прерванного клонирования)
+            kind: Вид задания
+
+        Returns:
+            Созданное задание
+        """
+        job = CloneJob(
+            user_id=user_id,
+            journal_id=journal_id,
+            kind=kind.value,
+            source_project_id=source_project_id,
+            source_project_name=source_project_name,
+            new_project_name=new_project_name,
+            target_queue=target_queue,
+            status=CloneJobStatus.QUEUED.value,
+            progress=0,
+            attempts=0,
+        )
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+        return job
+
+    @staticmethod
+    async def create_batch_jobs(
+        session: AsyncSession,
+        batch_id: str,
+        source_project_id: str,
+        targets: Sequence[Tuple[str, str]],
+        user_id: Optional[int] = None,
+        source_project_name: Optional[str] = None,
+    ) -> List[CloneJob]:
+        """Ставит в очередь пакет заданий на клонирование одного шаблона
+
+        Args:
+            session: Сессия БД
+            batch_id: Идентификатор пакета
+            source_project_id: ID проекта-шаблона
+            targets: Пары (название нового проекта, очередь для новых задач)
+            user_id: ID пользователя, поставившего задания
+            source_project_name: Название проекта-шаблона
+
+        Returns:
+            Созданные задания в порядке targets
+        """
+        jobs = [
+            CloneJob(
+                user_id=user_id,
+                batch_id=batch_id,
+                source_project_id=source_project_id,
+                source_project_name=source_project_name,
+                new_project_name=new_project_name,
+                target_queue=target_queue,
+                status=CloneJobStatus.QUEUED.value,
+                progress=0,
+                attempts=0,
+            )
+            for new_project_name, target_queue in targets
+        ]
+        session.add_all(jobs)
+        await session.commit()
+        for job in jobs:
+            await session.refresh(job)
+        return jobs
+
+    @staticmethod
+    async def get_job(
+        session: AsyncSession,
+        job_id: int,
+    ) -> Optional[CloneJob]:
+        """Получает задание по ID
+
+        Args:
+            session: Сессия БД
+            job_id: ID задания
+
+        Returns:
+            Задание или None
+        """
+        return await session.get(CloneJob, job_id)
+
+    @staticmethod
+    async def get_active_job_for_journal(
+        session: AsyncSession,
+        journal_id: int,
+    ) -> Optional[CloneJob]:
+        """Получает ожидающее или выполняемое задание журнала
+
+        Args:
+            session: Сессия БД
+            journal_id: ID журнала
+
+        Returns:
+            Задание со статусом QUEUED или RUNNING, либо None
+        """
+        query = select(CloneJob).where(
+            CloneJob.journal_id == journal_id,
+            CloneJob.status.in_([CloneJobStatus.QUEUED.value, CloneJobStatus.RUNNING.value]),
+        )
+        result = await session.execute(query)
+        return result.scalars().first()
+
+    @staticmethod
+    async def claim_next_job(
+        session: AsyncSession,
+        worker_id: str,
+        per_user_limit: int,
+        global_limit: int,
+    ) -> Optional[CloneJob]:
+        """Берет в работу самое старое задание с учетом лимитов
+
+        Задания пользователей, у которых уже выполняется per_user_limit
+        заданий, пропускаются. Строка блокируется с SKIP LOCKED, поэтому
+        несколько воркеров не возьмут одно задание. Подсчет выполняемых
+        заданий и захват идут под advisory-блокировкой транзакции
+        (PostgreSQL): иначе два воркера одновременно увидят свободный
+        лимит и оба возьмут задание.
+
+        Args:
+            session: Сессия БД
+            worker_id: Идентификатор воркера
+            per_user_limit: Максимум выполняемых заданий одного пользователя
+            global_limit: Максимум выполняемых заданий всеми воркерами
+
+        Returns:
+            Задание со статусом RUNNING или None, если брать нечего
+        """
+        if session.get_bind().dialect.name == "postgresql":
+            # Снимается при commit/rollback
+            await session.execute(select(func.pg_advisory_xact_lock(CLONE_JOB_CLAIM_LOCK_ID)))
+
+        running = await session.execute(
+            select(CloneJob.user_id, func.count(CloneJob.id))
+            .where(CloneJob.status == CloneJobStatus.RUNNING.value)
+            .group_by(CloneJob.user_id)
+        )
+        running_per_user = {user_id: count for user_id, count in running.all()}
+        if sum(running_per_user.values()) >= global_limit:
+            await session.rollback()
+            return None
+
+        busy_users = [
+            user_id for user_id, count in running_per_user.items()
+            if user_id is not None and count >= per_user_limit
+        ]
+
+        query = (
+            select(CloneJob)
+            .where(CloneJob.status == CloneJobStatus.QUEUED.value)
+            .order_by(CloneJob.created_at, CloneJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if busy_users:
+            query = query.where(or_(CloneJob.user_id.is_(None), CloneJob.user_id.notin_(busy_users)))
+
+        result = await session.execute(query)
+        job = result.scalars().first()
+        if not job:
+            await session.rollback()
+            return None
+
+        now = utcnow()
+        job.status = CloneJobStatus.RUNNING.value
+        job.worker_id = worker_id
+        job.attempts = (job.attempts or 0) + 1
+        job.started_at = now
+        job.heartbeat_at = now
+        job.error = None
+        await session.commit()
+        await session.refresh(job)
+        return job
+
+    @staticmethod
+    async def get_jobs(
+        session: AsyncSession,
+        job_ids: Sequence[int],
+    ) -> List[CloneJob]:
+        """Получает задания по списку ID
+
+        Args:
+            session: Сессия БД
+            job_ids: ID заданий
+
+        Returns:
+            Найденные задания в порядке job_ids
+        """
+        if not job_ids:
+            return []
+
+        result = await session.execute(select(CloneJob).where(CloneJob.id.in_(list(job_ids))))
+        jobs = {job.id: job for job in result.scalars().all()}
+        return [jobs[job_id] for job_id in job_ids if job_id in jobs]
+
+    @staticmethod
+    async def claim_batch_jobs(
+        session: AsyncSession,
+        batch_id: str,
+        worker_id: str,
+    ) -> List[CloneJob]:
+        """Берет в работу ожидающие задания пакета
+
+        Пакет выполняется одним воркером за один прогон, поэтому лимиты
+        на пользователя и на все воркеры здесь не проверяются - они
+        учтены при выборе первого задания пакета.
+
+        Args:
+            session: Сессия БД
+            batch_id: Идентификатор пакета
+            worker_id: Идентификатор воркера
+
+        Returns:
+            Задания пакета, переведенные в RUNNING
+        """
+        result = await session.execute(
+            select(CloneJob)
+            .where(CloneJob.batch_id == batch_id, CloneJob.status == CloneJobStatus.QUEUED.value)
+            .order_by(CloneJob.id)
+            .with_for_update(skip_locked=True)
+        )
+        jobs = list(result.scalars().all())
+        if not jobs:
+            await session.rollback()
+            return []
+
+        now = utcnow()
+        for job in jobs:
+            job.status = CloneJobStatus.RUNNING.value
+            job.worker_id = worker_id
+            job.attempts = (job.attempts or 0) + 1
+            job.started_at = now
+            job.heartbeat_at = now
+            job.error = None
+        await session.commit()
+        for job in jobs:
+            await session.refresh(job)
+        return jobs
+
+    @staticmethod
+    async def update_progress(
+        session: AsyncSession,
+        job_id: int,
+        progress: int,
+        phase: Optional[str] = None,
+        eta_seconds: Optional[int] = None,
+        items_per_second: Optional[float] = None,
+    ) -> None:
+        """Обновляет прогресс задания (и сигнал активности воркера)
+
+        Args:
+            session: Сессия БД
+            job_id: ID задания
+            progress: Прогресс (0-100)
+            phase: Текущий этап
+            eta_seconds: Оценка оставшегося времени
+            items_per_second: Скорость обработки объектов
+        """
+        await session.execute(
+            update(CloneJob)
+            .where(CloneJob.id == job_id)
+            .values(
+                progress=progress,
+                phase=phase,
+                eta_seconds=eta_seconds,
+                items_per_second=items_per_second,
+                heartbeat_at=utcnow(),
+            )
+        )
+        await session.commit()
+
+    @staticmethod
+    async def touch_jobs(
+        session: AsyncSession,
+        job_ids: Sequence[int],
+    ) -> None:
+        """Обновляет сигнал активности выполняемых заданий
+
+        Args:
+            session: Сессия БД
+            job_ids: ID заданий воркера
+        """
+        if not job_ids:
+            return
+
+        await session.execute(
+            update(CloneJob)
+            .where(CloneJob.id.in_(list(job_ids)))
+            .values(heartbeat_at=utcnow())
+        )
+        await session.commit()
+
+    @staticmethod
+    async def set_journal(
+        session: AsyncSession,
+        job_id: int,
+        journal_id: int,
+    ) -> None:
+        """Привязывает журнал клонирования к заданию
+
+        Args:
+            session: Сессия БД
+            job_id: ID задания
+            journal_id: ID журнала
+        """
+        await session.execute(
+            update(CloneJob).where(CloneJob.id == job_id).values(journal_id=journal_id)
+        )
+        await session.commit()
+
+    @staticmethod
+    async def finish_job(
+        session: AsyncSession,
+        job_id: int,
+        status: CloneJobStatus,
+        new_project_short_id: Optional[int] = None,
+        created_count: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Завершает задание
+
+        Args:
+            session: Сессия БД
+            job_id: ID задания
+            status: COMPLETED или FAILED
+            new_project_short_id: shortId созданного проекта
+            created_count: Количество созданных задач
+            error: Текст ошибки
+        """
+        values = {
+            "status": status.value,
+            "new_project_short_id": new_project_short_id,
+            "created_count": created_count,
+            "error": error,
+            "eta_seconds": None,
+            "finished_at": utcnow(),
+        }
+        if status == CloneJobStatus.COMPLETED:
+            values["progress"] = 100
+
+        await session.execute(update(CloneJob).where(CloneJob.id == job_id).values(**values))
+        await session.commit()
+
+    @staticmethod
+    async def requeue_stale_jobs(
+        session: AsyncSession,
+        stale_before: datetime,
+        max_attempts: int,
+    ) -> int:
+        """Возвращает в очередь задания остановившихся воркеров
+
+        Задания, у которых закончились попытки, завершаются с ошибкой.
+
+        Args:
+            session: Сессия БД
+            stale_before: Задания без сигнала активности с этого момента считаются брошенными
+            max_attempts: Максимум запусков одного задания
+
+        Returns:
+            Количество возвращенных в очередь заданий
+        """
+        stale = (
+            CloneJob.status == CloneJobStatus.RUNNING.value,
+            or_(CloneJob.heartbeat_at.is_(None), CloneJob.heartbeat_at < stale_before),
+        )
+
+        await session.execute(
+            update(CloneJob)
+            .where(*stale, CloneJob.attempts >= max_attempts)
+            .values(
+                status=CloneJobStatus.FAILED.value,
+                error="Воркер клонирования остановился во время выполнения",
+                finished_at=utcnow(),
+            )
+        )
+        result = await session.execute(
+            update(CloneJob)
+            .where(*stale, CloneJob.attempts < max_attempts)
+            .values(status=CloneJobStatus.QUEUED.value, worker_id=None)
+        )
+        await session.commit()
+        return result.rowcount or 0
+
+    @staticmethod
+    async def release_worker_jobs(
+        session: AsyncSession,
+        worker_id: str,
+    ) -> int:
+        """Возвращает в очередь выполняемые задания остановленного воркера
+
+        Args:
+            session: Сессия БД
+            worker_id: Идентификатор воркера
+
+        Returns:
+            Количество возвращенных в очередь заданий
+        """
+        result = await session.execute(
+            update(CloneJob)
+            .where(
+                CloneJob.worker_id == worker_id,
+                CloneJob.status == CloneJobStatus.RUNNING.value,
+            )
+            .values(status=CloneJobStatus.QUEUED.value, worker_id=None)
+        )
+        await session.commit()
+        return result.rowcount or 0
+
+
+class CloneRunCRUD:
+    """CRUD операции для работы со статистикой клонирований"""
+
+    @staticmethod
+    async def create_run(
+        session: AsyncSession,
+        source_project_id: str,
+        success: bool,
+        issues_count: int,
+        total_seconds: float,
+        total_calls: int,
+        total_retries: int,
+        failures_count: int,
+        phases: dict,
+        failures: list,
+        job_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        new_project_short_id: Optional[int] = None,
+    ) -> CloneRun:
+        """Сохраняет статистику выполненного клонирования
+
+        Args:
+            session: Сессия БД
+            source_project_id: ID проекта-шаблона
+            success: Клонирование завершено успешно
+            issues_count: Количество созданных задач
+            total_seconds: Длительность клонирования (сек)
+            total_calls: Всего запросов к API
+            total_retries: Всего повторов запросов
+            failures_count: Количество пунктов, которые не удалось восстановить
+            phases: Статистика по этапам (CloneStats.to_dict)
+            failures: Ошибки пунктов (CloneStats.failures_to_list)
+            job_id: ID задания на клонирование
+            user_id: ID пользователя, поставившего задание
+            new_project_short_id: shortId созданного проекта
+
+        Returns:
+            Созданная запись
+        """
+        run = CloneRun(
+            job_id=job_id,
+            user_id=user_id,
+            source_project_id=source_project_id,
+            new_project_short_id=new_project_short_id,
+            success=success,
+            issues_count=issues_count,
+            total_seconds=total_seconds,
+            total_calls=total_calls,
+            total_retries=total_retries,
+            failures_count=failures_count,
+            phases=phases,
+            failures=failures,
+        )
+        session.add(run)
+        await session.commit()
+        await session.refresh(run)
+        return run
+
+    @staticmethod
+    async def get_job_runs(
+        session: AsyncSession,
+        job_id: int,
+    ) -> List[CloneRun]:
+        """Получает статистику всех запусков задания
+
+        Args:
+            session: Сессия БД
+            job_id: ID задания на клонирование
+
+        Returns:
+            Записи статистики в порядке запусков
+        """
+        result = await session.execute(
+            select(CloneRun).where(CloneRun.job_id == job_id).order_by(CloneRun.id)
+        )
+        return list(result.scalars().all())
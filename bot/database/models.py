@@ -1,11 +1,17 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Date, Numeric, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Date, Float, Numeric, ForeignKey, LargeBinary, JSON, Enum as SQLEnum
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
 
+
+def utcnow() -> datetime:
+    """Текущее время UTC без часового пояса (колонки DateTime хранят наивное UTC)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class UserRole(str, Enum):
     """Роли пользователей в системе"""
     OWNER = "owner"
@@ -20,6 +26,24 @@ class PaymentRequestStatus(str, Enum):
     PAID = "paid"                    # Оплачено
     CANCELLED = "cancelled"          # Отменен
 
+class CloneJournalStatus(str, Enum):
+    """Статусы журнала клонирования"""
+    RUNNING = "running"      # Выполняется (или бот перезапустился во время выполнения)
+    FAILED = "failed"        # Прервано ошибкой, можно продолжить
+    COMPLETED = "completed"  # Завершено
+
+class CloneJobStatus(str, Enum):
+    """Статусы задания на клонирование"""
+    QUEUED = "queued"        # Ожидает свободного воркера
+    RUNNING = "running"      # Выполняется воркером
+    COMPLETED = "completed"  # Завершено
+    FAILED = "failed"        # Завершено с ошибкой
+
+class CloneJobKind(str, Enum):
+    """Виды заданий воркеров клонирования"""
+    CLONE = "clone"          # Клонирование проекта
+    ESTIMATE = "estimate"    # Загрузка шаблона в снимок для оценки стоимости
+
 class User(Base):
     """Модель пользователя бота
 
@@ -45,7 +69,7 @@ class User(Base):
     role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.WORKER)
     is_billing_contact = Column(Boolean, default=False, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
 
     # Relationships
     settings = relationship("UserSettings", back_populates="user", uselist=False, cascade="all, delete-orphan")
@@ -115,8 +139,8 @@ class PaymentRequest(Base):
 
     # Статус и даты
     status = Column(SQLEnum(PaymentRequestStatus, values_callable=lambda x: [e.value for e in x]), nullable=False, default=PaymentRequestStatus.PENDING.value, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
 
     # Обработка billing контактом
     processing_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
@@ -160,7 +184,7 @@ class BillingNotification(Base):
     billing_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     message_id = Column(BigInteger, nullable=False)
     chat_id = Column(BigInteger, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
 
     # Relationships
     payment_request = relationship("PaymentRequest", back_populates="billing_notifications")
@@ -168,3 +192,180 @@ class BillingNotification(Base):
 
     def __repr__(self):
         return f"<BillingNotification(id={self.id}, request_id={self.payment_request_id}, user_id={self.billing_user_id}, message_id={self.message_id})>"
+
+
+class TemplateSnapshot(Base):
+    """Снимок данных проекта-шаблона для клонирования без повторной загрузки
+
+    Attributes:
+        project_id: ID проекта-шаблона в Tracker
+        project_name: Название проекта (для логов и прогрева)
+        fingerprint: Отпечаток задач проекта на момент снимка ("<count>:<max updatedAt>")
+        issues_count: Количество задач в снимке
+        payload: Сжатый JSON с ProjectData
+        created_at: Дата первого сохранения снимка
+        updated_at: Дата последнего обновления снимка
+    """
+    __tablename__ = "template_snapshots"
+
+    project_id = Column(String, primary_key=True)
+    project_name = Column(String, nullable=True)
+    fingerprint = Column(String, nullable=False)
+    issues_count = Column(Integer, nullable=False, default=0)
+    payload = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<TemplateSnapshot(project_id={self.project_id}, fingerprint={self.fingerprint}, issues={self.issues_count})>"
+
+
+class CloneJournalRecord(Base):
+    """Журнал клонирования проекта для продолжения после сбоя
+
+    Attributes:
+        id: Внутренний ID журнала
+        user_id: FK пользователя, запустившего клонирование
+        run_id: Идентификатор прогона (основа токенов идемпотентного создания задач)
+        source_project_id: ID проекта-шаблона
+        source_project_name: Название проекта-шаблона
+        new_project_name: Название нового проекта
+        target_queue: Очередь для новых задач
+        new_project_id: ID созданного проекта (после первого этапа)
+        new_project_short_id: shortId созданного проекта
+        state: Прогресс (issues_mapping, восстановленные чеклисты, связи, комментарии)
+        status: Статус журнала
+        error: Текст последней ошибки
+        created_at: Дата запуска клонирования
+        updated_at: Дата последней контрольной точки
+    """
+    __tablename__ = "clone_journals"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    run_id = Column(String, unique=True, nullable=False)
+    source_project_id = Column(String, nullable=False)
+    source_project_name = Column(String, nullable=True)
+    new_project_name = Column(String, nullable=False)
+    target_queue = Column(String, nullable=False)
+    new_project_id = Column(String, nullable=True)
+    new_project_short_id = Column(Integer, nullable=True)
+    state = Column(JSON, nullable=False, default=dict)
+    status = Column(SQLEnum(CloneJournalStatus, values_callable=lambda x: [e.value for e in x]), nullable=False, default=CloneJournalStatus.RUNNING.value, index=True)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
+
+    # Relationships
+    user = relationship("User")
+
+    def __repr__(self):
+        return f"<CloneJournalRecord(id={self.id}, source={self.source_project_id}, new_name={self.new_project_name}, status={self.status})>"
+
+
+class CloneJob(Base):
+    """Задание на клонирование проекта в очереди воркеров
+
+    Attributes:
+        id: Внутренний ID задания
+        user_id: FK пользователя, поставившего задание
+        journal_id: FK журнала клонирования (создается при первом запуске)
+        batch_id: Идентификатор пакета (задания пакета выполняются вместе)
+        kind: Вид задания (клонирование или оценка стоимости)
+        source_project_id: ID проекта-шаблона
+        source_project_name: Название проекта-шаблона
+        new_project_name: Название нового проекта
+        target_queue: Очередь для новых задач
+        status: Статус задания
+        progress: Прогресс выполнения (0-100)
+        phase: Текущий этап для отображения пользователю
+        eta_seconds: Оценка оставшегося времени (сек)
+        items_per_second: Скорость обработки объектов (задач, пунктов, комментариев)
+        attempts: Количество запусков задания воркерами
+        worker_id: Идентификатор воркера, выполняющего задание
+        heartbeat_at: Последний сигнал активности воркера
+        new_project_short_id: shortId созданного проекта
+        created_count: Количество созданных задач
+        error: Текст ошибки
+        created_at: Дата постановки в очередь
+        started_at: Дата последнего запуска
+        finished_at: Дата завершения
+        updated_at: Дата последнего обновления
+    """
+    __tablename__ = "clone_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    journal_id = Column(Integer, ForeignKey("clone_journals.id", ondelete="SET NULL"), nullable=True)
+    batch_id = Column(String, nullable=True, index=True)
+    kind = Column(String, nullable=False, default=CloneJobKind.CLONE.value, server_default=CloneJobKind.CLONE.value)
+    source_project_id = Column(String, nullable=False)
+    source_project_name = Column(String, nullable=True)
+    new_project_name = Column(String, nullable=False)
+    target_queue = Column(String, nullable=False)
+    status = Column(SQLEnum(CloneJobStatus, values_callable=lambda x: [e.value for e in x]), nullable=False, default=CloneJobStatus.QUEUED.value, index=True)
+    progress = Column(Integer, nullable=False, default=0)
+    phase = Column(String, nullable=True)
+    eta_seconds = Column(Integer, nullable=True)
+    items_per_second = Column(Float, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    worker_id = Column(String, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    new_project_short_id = Column(Integer, nullable=True)
+    created_count = Column(Integer, nullable=True)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
+
+    # Relationships
+    user = relationship("User")
+    journal = relationship("CloneJournalRecord")
+
+    def __repr__(self):
+        return f"<CloneJob(id={self.id}, source={self.source_project_id}, new_name={self.new_project_name}, status={self.status})>"
+
+
+class CloneRun(Base):
+    """Статистика выполненного клонирования (телеметрия по этапам)
+
+    Attributes:
+        id: Внутренний ID записи
+        job_id: FK задания на клонирование
+        user_id: FK пользователя, поставившего задание
+        source_project_id: ID проекта-шаблона
+        new_project_short_id: shortId созданного проекта
+        success: Клонирование завершено успешно
+        issues_count: Количество созданных задач
+        total_seconds: Длительность клонирования (сек)
+        total_calls: Всего запросов к API
+        total_retries: Всего повторов запросов
+        failures_count: Количество пунктов, которые не удалось восстановить
+        phases: Статистика по этапам {этап: {seconds, calls, retries, failures, p50, p95}}
+        failures: Ошибки пунктов [{phase, issue_key, status, error}]
+        created_at: Дата записи
+    """
+    __tablename__ = "clone_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("clone_jobs.id", ondelete="SET NULL"), nullable=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    source_project_id = Column(String, nullable=False)
+    new_project_short_id = Column(Integer, nullable=True)
+    success = Column(Boolean, nullable=False, default=False)
+    issues_count = Column(Integer, nullable=False, default=0)
+    total_seconds = Column(Float, nullable=False, default=0.0)
+    total_calls = Column(Integer, nullable=False, default=0)
+    total_retries = Column(Integer, nullable=False, default=0)
+    failures_count = Column(Integer, nullable=False, default=0)
+    phases = Column(JSON, nullable=False, default=dict)
+    failures = Column(JSON, nullable=False, default=list)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+
+    # Relationships
+    job = relationship("CloneJob")
+    user = relationship("User")
+
+    def __repr__(self):
+        return f"<CloneRun(id={self.id}, job_id={self.job_id}, success={self.success}, seconds={self.total_seconds})>"
@@ -7,6 +7,7 @@ from .windows import (
     enter_new_name_window,
     enter_queue_window,
     confirm_clone_window,
+    enter_batch_names_window,
 )
 
 
@@ -16,6 +17,7 @@ clone_project_dialog = Dialog(
     enter_new_name_window,
     enter_queue_window,
     confirm_clone_window,
+    enter_batch_names_window,
 )
 
 
@@ -2,3 +2,12 @@
 
 # Минимальный интервал между обновлениями UI (в секундах)
 UPDATE_INTERVAL = 1.0
+
+# Максимум новых проектов в одном пакетном клонировании
+BATCH_MAX_TARGETS = 10
+
+# Разделитель названия и очереди в строке пакетного клонирования
+BATCH_QUEUE_SEPARATOR = ";"
+
+# Клонирование дольше этого времени лучше запускать в нерабочее время (в секундах)
+LONG_CLONE_SECONDS = 15 * 60
@@ -1,92 +1,65 @@
 """Data getters для диалога клонирования проекта"""
 
+import html
+from typing import Optional
+
 from aiogram_dialog import DialogManager
-from src.tracker_client import TrackerClient
+from bot.database import get_session, CloneJournalCRUD
+from .constants import BATCH_MAX_TARGETS, BATCH_QUEUE_SEPARATOR, LONG_CLONE_SECONDS
+
+# Подписи этапов плана клонирования
+PLAN_PHASE_TITLES = {
+    "users": "Справочник пользователей (на все копии)",
+    "project": "Проект",
+    "issues": "Задачи",
+    "followers": "Наблюдатели (массовые изменения)",
+    "checklists": "Пункты чеклистов",
+    "links": "Связи",
+    "comments": "Комментарии",
+}
 
 
 async def get_select_project_data(dialog_manager: DialogManager, **kwargs):
-    """Getter для окна выбора проекта с загрузкой списка (с кэшированием)."""
-    # Проверяем кэш - если проекты уже загружены, не делаем повторный запрос
-    if "template_projects" in dialog_manager.dialog_data:
-        projects = dialog_manager.dialog_data["template_projects"]
-    else:
-        # Загружаем проекты со словом "шаблон"
+    """Getter для окна выбора проекта (индекс шаблонов с поиском по названию)."""
+    query = dialog_manager.dialog_data.get("template_query", "")
+
+    try:
+        templates = await kwargs["template_index"].search(query)
+        projects = [(t.name, t.id) for t in templates]
+    except Exception as e:
+        projects = []
+        dialog_manager.dialog_data["error"] = f"Ошибка загрузки проектов: {str(e)}"
+
+    # Сохраняем для получения названия выбранного проекта
+    dialog_manager.dialog_data["template_projects"] = projects
+
+    # Прерванные клонирования пользователя (можно продолжить с места остановки)
+    unfinished = []
+    user = kwargs.get("user")
+    if user:
         try:
-            async with TrackerClient() as tracker:
-                # Получаем все проекты с полем summary
-                projects_raw = await tracker.client.entities.search(
-                    entity_type="project",
-                    fields="summary,id"
-                )
-
-                # Если dict - это пагинированный ответ, берем values
-                if isinstance(projects_raw, dict):
-                    pages = projects_raw.get("pages", 1)
-
-                    # Если страниц больше 1 - загружаем все за один запрос
-                    if isinstance(pages, int) and pages > 1:
-                        per_page = pages * 50
-                        projects_raw = await tracker.client.entities.search(
-                            entity_type="project",
-                            fields="summary,id",
-                            per_page=per_page
-                        )
-
-                    if "values" in projects_raw:
-                        projects_raw = projects_raw["values"]
-                    else:
-                        projects_raw = []
-
-                # Если пустой список - пробуем без fields
-                if not projects_raw:
-                    projects_raw = await tracker.client.entities.search(
-                        entity_type="project"
-                    )
-                    # Снова проверяем на dict
-                    if isinstance(projects_raw, dict):
-                        pages = projects_raw.get("pages", 1)
-                        # Если страниц больше 1 - загружаем все
-                        if isinstance(pages, int) and pages > 1:
-                            per_page = pages * 50
-                            projects_raw = await tracker.client.entities.search(
-                                entity_type="project",
-                                per_page=per_page
-                            )
-
-                        if "values" in projects_raw:
-                            projects_raw = projects_raw["values"]
-
-                # Фильтруем локально по слову "шаблон" в названии
-                projects = []
-                for proj in projects_raw:
-                    if not isinstance(proj, dict):
-                        continue
-
-                    proj_id = proj.get("id", "")
-                    if not proj_id:
-                        continue
-
-                    # Проверяем где находится summary
-                    summary = proj.get("fields", {}).get("summary", "")
-                    if not summary:
-                        summary = proj.get("summary", "")
-
-                    if not summary:
-                        summary = f"Проект #{proj.get('shortId', 'N/A')}"
-
-                    # Фильтруем по слову "шаблон"
-                    if "шаблон" in summary.lower():
-                        projects.append((summary, proj_id))
-
-                # Сохраняем для повторного использования
-                dialog_manager.dialog_data["template_projects"] = projects
-        except Exception as e:
-            projects = []
-            dialog_manager.dialog_data["error"] = f"Ошибка загрузки проектов: {str(e)}"
+            async with get_session() as session:
+                journals = await CloneJournalCRUD.get_unfinished_journals(session, user.id)
+            unfinished = [
+                {
+                    "id": j.id,
+                    "source_project_id": j.source_project_id,
+                    "source_project_name": j.source_project_name,
+                    "new_project_name": j.new_project_name,
+                    "target_queue": j.target_queue,
+                }
+                for j in journals
+            ]
+        except Exception:
+            unfinished = []
+    dialog_manager.dialog_data["unfinished_journals"] = unfinished
 
     return {
         "projects": projects,
-        "count": len(projects)
+        "count": len(projects),
+        "query": query,
+        "unfinished_journals": unfinished,
+        "has_unfinished": bool(unfinished),
     }
 
 
@@ -130,19 +103,19 @@ async def get_queue_data(dialog_manager: DialogManager, **kwargs):
         else:
             # Загружаем и кэшируем очереди
             try:
-                async with TrackerClient() as tracker:
-                    queues_raw = await tracker.client.queues.get()
-                    queues = [
-                        {"key": q.get("key", ""), "name": q.get("name", q.get("key", ""))}
-                        for q in queues_raw
-                    ]
-                    # Сохраняем в кэш
-                    dialog_manager.dialog_data["cached_queues"] = queues
+                queues_raw = await kwargs["reference_data"].get_queues()
+                queues = [
+                    {"key": q.get("key", ""), "name": q.get("name", q.get("key", ""))}
+                    for q in queues_raw
+                ]
+                # Сохраняем в кэш
+                dialog_manager.dialog_data["cached_queues"] = queues
             except Exception as e:
                 dialog_manager.dialog_data["error"] = f"Ошибка загрузки очередей: {str(e)}"
 
     return {
         "new_name": new_name,
+        "batch_count": len(dialog_manager.dialog_data.get("batch_targets") or []),
         "default_queue": default_queue,
         "has_default": bool(default_queue),
         "queue_step": queue_step,
@@ -150,22 +123,125 @@ async def get_queue_data(dialog_manager: DialogManager, **kwargs):
     }
 
 
+def clone_plan_key(dialog_data: dict) -> str:
+    """Ключ плана клонирования: шаблон и количество копий."""
+    copies = len(dialog_data.get("batch_targets") or []) or 1
+    return f"{dialog_data.get('project_id')}:{copies}"
+
+
+def _format_duration(seconds: float) -> str:
+    """Длительность для отображения пользователю."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} с"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes} мин {seconds} с"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} ч {minutes} мин"
+
+
+def format_clone_speed(eta_seconds: Optional[int], items_per_second: Optional[float]) -> str:
+    """
+    Скорость и оставшееся время клонирования для окна прогресса.
+
+    Args:
+        eta_seconds: Оценка оставшегося времени (None - еще не оценена)
+        items_per_second: Скорость обработки объектов
+
+    Returns:
+        Текст или пустая строка, если оценки еще нет
+    """
+    parts = []
+    if eta_seconds is not None:
+        parts.append(f"⏱ Осталось ~{_format_duration(eta_seconds)}")
+    if items_per_second:
+        parts.append(f"{items_per_second:.1f} объектов/с")
+    return " · ".join(parts)
+
+
+def format_clone_plan(plan: dict) -> str:
+    """
+    Текст плана клонирования для окна подтверждения.
+
+    Args:
+        plan: ClonePlan в виде словаря (dataclasses.asdict)
+
+    Returns:
+        Текст с запросами по этапам и прогнозом длительности
+    """
+    lines = ["📊 <b>План клонирования</b>"]
+    for phase in plan["phases"]:
+        title = PLAN_PHASE_TITLES.get(phase["name"], phase["name"])
+        line = f"• {title}: {phase['calls']}"
+        if phase["name"] == "issues":
+            line += f" ({plan['levels']} ур. иерархии, родитель задается при создании)"
+        lines.append(line)
+
+    total_calls = sum(
+        phase["calls"] if phase.get("shared") else phase["calls"] * plan["copies"]
+        for phase in plan["phases"]
+    )
+    copies = f" на {plan['copies']} проекта(ов)" if plan["copies"] > 1 else ""
+    lines.append(f"Всего запросов к API{copies}: <b>{total_calls}</b>")
+
+    seconds = sum(phase["seconds"] for phase in plan["phases"])
+    lines.append(
+        f"⏱ Прогноз: ~{_format_duration(seconds)} "
+        f"(задержка {plan['latency'] * 1000:.0f} мс, лимит {plan['rate']:.0f} запр/с)"
+    )
+    if seconds >= LONG_CLONE_SECONDS:
+        lines.append("💡 Клонирование надолго займет лимит запросов организации - лучше запустить его в нерабочее время.")
+    return "\n".join(lines)
+
+
 async def get_final_confirm_data(dialog_manager: DialogManager, **kwargs):
     """Getter для финального подтверждения/прогресса/результата (динамическое окно)."""
     is_cloning = dialog_manager.dialog_data.get("is_cloning", False)
     progress = dialog_manager.dialog_data.get("progress", 0)
 
+    # План клонирования показывается только до начала клонирования
+    clone_plan = ""
+    can_estimate = False
+    if dialog_manager.dialog_data.get("estimate_job_id"):
+        # Шаблон загружает воркер (задание оценки)
+        clone_plan = "⏳ Шаблон загружается для оценки..."
+    elif not is_cloning and dialog_manager.dialog_data.get("result") is None:
+        # План считают хэндлеры при открытии окна и по завершении оценки
+        plan = (dialog_manager.dialog_data.get("clone_plan") or {}).get("plan")
+        clone_plan = format_clone_plan(plan) if plan else ""
+        can_estimate = plan is None
+        estimate_error = dialog_manager.dialog_data.get("estimate_error")
+        if estimate_error and not plan:
+            clone_plan = f"❌ Не удалось оценить клонирование: {html.escape(estimate_error)}"
+
+    # Пакетное клонирование: очередь из строки или выбранная по умолчанию
+    queue = dialog_manager.dialog_data.get("queue", "")
+    batch_targets = dialog_manager.dialog_data.get("batch_targets") or []
+    batch_targets_text = "\n".join(
+        f"• <b>{html.escape(target['name'])}</b> → {target['queue'] or queue}" for target in batch_targets
+    )
+
     return {
         # Данные подтверждения
         "project_id": dialog_manager.dialog_data.get("project_id", ""),
         "project_name": dialog_manager.dialog_data.get("project_name", "Неизвестен"),
         "new_name": dialog_manager.dialog_data.get("new_name", ""),
-        "queue": dialog_manager.dialog_data.get("queue", ""),
+        "queue": queue,
+        "is_batch": bool(batch_targets),
+        "batch_targets": batch_targets_text,
+        "clone_plan": clone_plan,
+        "can_estimate": can_estimate,
 
         # Данные прогресса
         "is_cloning": is_cloning,
         "progress": progress,
         "phase": dialog_manager.dialog_data.get("phase", "Инициализация..."),
+        "speed": format_clone_speed(
+            dialog_manager.dialog_data.get("eta_seconds"),
+            dialog_manager.dialog_data.get("items_per_second"),
+        ),
+        "batch_progress": dialog_manager.dialog_data.get("batch_progress", ""),
 
         # Данные результата
         "result": dialog_manager.dialog_data.get("result"),
@@ -173,5 +249,15 @@ async def get_final_confirm_data(dialog_manager: DialogManager, **kwargs):
         "new_project_short_id": dialog_manager.dialog_data.get("new_project_short_id", ""),
         "created_count": dialog_manager.dialog_data.get("created_count", 0),
         "project_url": dialog_manager.dialog_data.get("project_url", ""),
+        "batch_result": dialog_manager.dialog_data.get("batch_result", ""),
         "error": dialog_manager.dialog_data.get("error"),
     }
+
+
+async def get_batch_names_data(dialog_manager: DialogManager, **kwargs):
+    """Getter для окна ввода названий проектов пакета."""
+    return {
+        "project_name": dialog_manager.dialog_data.get("project_name", "Неизвестен"),
+        "max_targets": BATCH_MAX_TARGETS,
+        "separator": BATCH_QUEUE_SEPARATOR,
+    }
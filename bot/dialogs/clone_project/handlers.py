@@ -1,16 +1,23 @@
 """Button handlers для диалога клонирования проекта"""
 
 import asyncio
-import time
+import html
+import logging
+from dataclasses import asdict
+from typing import Dict, List, Optional
 from aiogram.types import Message, CallbackQuery
 from aiogram_dialog import DialogManager, ShowMode
 from aiogram_dialog.widgets.kbd import Button, Select
 from aiogram_dialog.widgets.input import MessageInput
 
-from .states import CloneProject
+from src.reference_cache import TrackerReferenceData
 from src.tracker_client import TrackerClient
-from src.project_cloner import ProjectCloner
-from .constants import UPDATE_INTERVAL
+
+from .states import CloneProject
+from .getters import clone_plan_key, format_clone_speed
+from .constants import UPDATE_INTERVAL, BATCH_MAX_TARGETS, BATCH_QUEUE_SEPARATOR
+
+logger = logging.getLogger(__name__)
 
 
 async def on_project_selected(
@@ -40,14 +47,111 @@ async def on_project_selected(
     await manager.switch_to(CloneProject.confirm_project)
 
 
+async def on_template_search(
+    message: Message, widget: MessageInput, manager: DialogManager
+):
+    """Поиск шаблона по части названия (текст сообщения)."""
+    manager.show_mode = ShowMode.EDIT
+    if not message.text:
+        return
+
+    manager.dialog_data["template_query"] = message.text.strip()
+
+
+async def on_reset_template_search(
+    callback: CallbackQuery, button: Button, manager: DialogManager
+):
+    """Сбросить поиск шаблона."""
+    manager.dialog_data["template_query"] = ""
+    manager.show_mode = ShowMode.EDIT
+
+
 async def on_confirm_project(
     callback: CallbackQuery, button: Button, manager: DialogManager
 ):
     """Подтверждение выбранного проекта."""
+    manager.dialog_data["batch_targets"] = None
     manager.show_mode = ShowMode.EDIT
     await manager.switch_to(CloneProject.enter_new_name)
 
 
+async def on_batch_clone(
+    callback: CallbackQuery, button: Button, manager: DialogManager
+):
+    """Клонирование шаблона сразу в несколько проектов."""
+    manager.show_mode = ShowMode.EDIT
+    await manager.switch_to(CloneProject.enter_batch_names)
+
+
+async def on_back_to_confirm_project(
+    callback: CallbackQuery, button: Button, manager: DialogManager
+):
+    """Возврат к подтверждению проекта из ввода названий пакета."""
+    manager.show_mode = ShowMode.EDIT
+    await manager.switch_to(CloneProject.confirm_project)
+
+
+def parse_batch_targets(text: str) -> List[Dict]:
+    """
+    Разобрать названия новых проектов пакета.
+
+    Каждая строка - название проекта, после BATCH_QUEUE_SEPARATOR можно
+    указать очередь: "Клиент А; CLIENTA". Пустые строки пропускаются.
+
+    Args:
+        text: Текст сообщения
+
+    Returns:
+        Список {"name": название, "queue": очередь или None}
+    """
+    targets = []
+    for line in text.splitlines():
+        name, _, queue = line.partition(BATCH_QUEUE_SEPARATOR)
+        name = name.strip()
+        if name:
+            targets.append({"name": name, "queue": queue.strip().upper() or None})
+    return targets
+
+
+async def on_batch_names_input(
+    message: Message, widget: MessageInput, manager: DialogManager
+):
+    """Обработчик ввода названий проектов пакета (по одному в строке)."""
+    manager.show_mode = ShowMode.EDIT
+    if not message.text:
+        await message.answer("❌ Пожалуйста, отправьте текстовое сообщение")
+        return
+
+    targets = parse_batch_targets(message.text)
+    if not targets:
+        await message.answer("❌ Не найдено ни одного названия проекта")
+        return
+    if len(targets) > BATCH_MAX_TARGETS:
+        await message.answer(f"❌ Не больше {BATCH_MAX_TARGETS} проектов за один раз")
+        return
+
+    names = [target["name"] for target in targets]
+    if len(set(names)) != len(names):
+        await message.answer("❌ Названия проектов в пакете не должны повторяться")
+        return
+
+    manager.dialog_data["batch_targets"] = targets
+    manager.dialog_data["new_name"] = ", ".join(names)
+    manager.dialog_data["queue_step"] = ""
+    await manager.switch_to(CloneProject.enter_queue)
+
+
+async def on_back_from_queue(
+    callback: CallbackQuery, button: Button, manager: DialogManager
+):
+    """Возврат из выбора очереди к вводу названия (или названий пакета)."""
+    manager.show_mode = ShowMode.EDIT
+    if manager.dialog_data.get("batch_targets"):
+        await manager.switch_to(CloneProject.enter_batch_names)
+    else:
+        await manager.switch_to(CloneProject.enter_new_name)
+
+
 async def on_new_name_input(
     message: Message, widget: MessageInput, manager: DialogManager
 ):
@@ -66,6 +170,49 @@ async def on_new_name_input(
     await manager.switch_to(CloneProject.enter_queue)
 
 
+async def _build_clone_plan(
+    dialog_data: dict,
+    tracker: TrackerClient,
+    reference_data: Optional[TrackerReferenceData] = None,
+) -> dict:
+    """
+    Посчитать план клонирования по снимку шаблона (без загрузки шаблона).
+
+    Args:
+        dialog_data: Данные диалога (шаблон и цели пакета)
+        tracker: TrackerClient пользователя
+        reference_data: Справочники трекера
+
+    Returns:
+        {"key": ключ плана, "plan": ClonePlan в виде словаря или None, если снимка нет}
+    """
+    # Импорт внутри функции: bot.services импортирует хэндлеры (циклический импорт)
+    from bot.services.clone_plans import get_clone_plan
+
+    copies = len(dialog_data.get("batch_targets") or []) or 1
+    try:
+        plan = await get_clone_plan(
+            tracker, dialog_data.get("project_id"), copies=copies, reference_data=reference_data
+        )
+    except Exception as e:
+        logger.warning(f"Failed to plan clone of {dialog_data.get('project_id')}: {e}")
+        plan = None
+    return {"key": clone_plan_key(dialog_data), "plan": asdict(plan) if plan else None}
+
+
+async def _open_confirm_clone(manager: DialogManager) -> None:
+    """Посчитать план (если шаблон или число копий изменились) и открыть подтверждение."""
+    data = manager.dialog_data
+    if (data.get("clone_plan") or {}).get("key") != clone_plan_key(data):
+        data["clone_plan"] = await _build_clone_plan(
+            data,
+            manager.middleware_data.get("tracker"),
+            manager.middleware_data.get("reference_data"),
+        )
+    manager.show_mode = ShowMode.EDIT
+    await manager.switch_to(CloneProject.confirm_clone)
+
+
 async def on_use_default_queue(
     callback: CallbackQuery, button: Button, manager: DialogManager
 ):
@@ -73,8 +220,7 @@ async def on_use_default_queue(
     user_settings = manager.middleware_data.get("user_settings")
     if user_settings and user_settings.default_queue:
         manager.dialog_data["queue"] = user_settings.default_queue
-        manager.show_mode = ShowMode.EDIT
-        await manager.switch_to(CloneProject.confirm_clone)
+        await _open_confirm_clone(manager)
 
 
 async def on_enter_custom_queue(
@@ -91,40 +237,157 @@ async def on_clone_queue_selected(
 ):
     """Обработка выбора очереди из списка."""
     manager.dialog_data["queue"] = item_id
+    await _open_confirm_clone(manager)
+
+
+async def on_estimate_clone(
+    callback: CallbackQuery, button: Button, manager: DialogManager
+):
+    """Поставить загрузку шаблона для оценки в очередь воркеров (снимка шаблона еще нет)."""
+    # Импорт внутри функции: bot.services импортирует хэндлеры (циклический импорт)
+    from bot.services.clone_jobs import enqueue_estimate_job
+
+    user = manager.middleware_data.get("user")
+    job_id = await enqueue_estimate_job(
+        source_project_id=manager.dialog_data.get("project_id"),
+        user_id=user.id if user else None,
+        source_project_name=manager.dialog_data.get("project_name"),
+    )
+    _notify_clone_workers(manager)
+
+    await callback.answer("⏳ Шаблон загружается для оценки...")
     manager.show_mode = ShowMode.EDIT
-    await manager.switch_to(CloneProject.confirm_clone)
+    manager.dialog_data["estimate_job_id"] = job_id
+    manager.dialog_data["estimate_error"] = None
+
+    # План строится по снимку, который сохранит воркер
+    asyncio.create_task(poll_estimate_job(
+        manager.bg(),
+        job_id,
+        dict(manager.dialog_data),
+        manager.middleware_data.get("tracker"),
+        manager.middleware_data.get("reference_data"),
+    ))
 
 
 async def on_start_clone(
     callback: CallbackQuery, button: Button, manager: DialogManager
 ):
-    """Запуск процесса клонирования (подход 9: динамическое окно)."""
-    # Получаем данные для передачи в фоновую задачу
-    project_id = manager.dialog_data.get("project_id")
-    new_name = manager.dialog_data.get("new_name")
-    queue = manager.dialog_data.get("queue")
+    """Постановка клонирования в очередь (подход 9: динамическое окно)."""
+    if manager.dialog_data.get("batch_targets"):
+        await _start_batch_clone(manager)
+        return
+
+    # Импорт внутри функции: bot.services импортирует хэндлеры (циклический импорт)
+    from bot.services.clone_jobs import enqueue_clone_job
+
+    user = manager.middleware_data.get("user")
+    job_id = await enqueue_clone_job(
+        source_project_id=manager.dialog_data.get("project_id"),
+        new_project_name=manager.dialog_data.get("new_name"),
+        target_queue=manager.dialog_data.get("queue"),
+        user_id=user.id if user else None,
+        source_project_name=manager.dialog_data.get("project_name"),
+    )
+    _notify_clone_workers(manager)
 
     # Инициализируем данные прогресса и устанавливаем флаг клонирования
+    manager.dialog_data["job_id"] = job_id
     manager.dialog_data["is_cloning"] = True
     manager.dialog_data["progress"] = 0
-    manager.dialog_data["phase"] = "Инициализация..."
+    manager.dialog_data["phase"] = "⏳ В очереди на клонирование..."
 
     # ❌ НЕ делаем switch_to! Остаемся на confirm_clone
     # Окно само перерисуется через when условия
-    # await manager.switch_to(CloneProject.progress)  # ← УБРАЛИ
-
-    # Создаем BgManager для фоновой задачи
-    bg = manager.bg()
-
-    # Запуск фоновой задачи с BgManager
-    asyncio.create_task(
-        clone_project_background_with_manager(
-            manager=bg,
-            project_id=project_id,
-            new_name=new_name,
-            queue=queue
-        )
+
+    # Фоновая задача только отображает статус задания (клонирует воркер)
+    asyncio.create_task(poll_clone_job(manager.bg(), job_id))
+
+
+async def _start_batch_clone(manager: DialogManager) -> None:
+    """Постановка пакетного клонирования: шаблон загружается один раз на все проекты."""
+    # Импорт внутри функции: bot.services импортирует хэндлеры (циклический импорт)
+    from bot.services.clone_jobs import enqueue_clone_batch
+
+    default_queue = manager.dialog_data.get("queue")
+    targets = [
+        (target["name"], target["queue"] or default_queue)
+        for target in manager.dialog_data["batch_targets"]
+    ]
+
+    user = manager.middleware_data.get("user")
+    job_ids = await enqueue_clone_batch(
+        source_project_id=manager.dialog_data.get("project_id"),
+        targets=targets,
+        user_id=user.id if user else None,
+        source_project_name=manager.dialog_data.get("project_name"),
     )
+    _notify_clone_workers(manager)
+
+    manager.dialog_data["job_ids"] = job_ids
+    manager.dialog_data["is_cloning"] = True
+    manager.dialog_data["progress"] = 0
+    manager.dialog_data["phase"] = "⏳ В очереди на клонирование..."
+
+    asyncio.create_task(poll_clone_batch(manager.bg(), job_ids))
+
+
+async def on_resume_clone_selected(
+    callback: CallbackQuery, widget: Select, manager: DialogManager, item_id: str
+):
+    """Продолжение прерванного клонирования по журналу."""
+    # Импорт внутри функции: bot.services импортирует хэндлеры (циклический импорт)
+    from bot.services.clone_jobs import enqueue_clone_job
+    from bot.database import get_session, CloneJobCRUD
+
+    journal_id = int(item_id)
+    journals = manager.dialog_data.get("unfinished_journals", [])
+    journal = next((j for j in journals if j["id"] == journal_id), None)
+    if not journal:
+        await callback.answer("❌ Клонирование не найдено", show_alert=True)
+        return
+
+    # Если клонирование уже в очереди или выполняется - просто показываем его статус
+    async with get_session() as session:
+        active_job = await CloneJobCRUD.get_active_job_for_journal(session, journal_id)
+
+    if active_job:
+        job_id = active_job.id
+    else:
+        user = manager.middleware_data.get("user")
+        job_id = await enqueue_clone_job(
+            source_project_id=journal["source_project_id"],
+            new_project_name=journal["new_project_name"],
+            target_queue=journal["target_queue"],
+            user_id=user.id if user else None,
+            source_project_name=journal["source_project_name"],
+            journal_id=journal_id,
+        )
+        _notify_clone_workers(manager)
+
+    manager.dialog_data.update({
+        "project_id": journal["source_project_id"],
+        "project_name": journal["source_project_name"] or "Неизвестен",
+        "new_name": journal["new_project_name"],
+        "queue": journal["target_queue"],
+        "batch_targets": None,
+        "job_id": job_id,
+        "is_cloning": True,
+        "progress": 0,
+        "phase": "♻️ Продолжение клонирования...",
+    })
+
+    manager.show_mode = ShowMode.EDIT
+    await manager.switch_to(CloneProject.confirm_clone)
+
+    asyncio.create_task(poll_clone_job(manager.bg(), job_id))
+
+
+def _notify_clone_workers(manager: DialogManager) -> None:
+    """Разбудить воркеры в процессе бота (внешние воркеры найдут задание сами)."""
+    clone_workers = manager.middleware_data.get("clone_workers")
+    if clone_workers:
+        clone_workers.notify()
 
 
 async def on_message_during_clone(
@@ -136,119 +399,194 @@ async def on_message_during_clone(
     manager.show_mode = ShowMode.EDIT
 
 
-async def clone_project_background_with_manager(
+async def poll_estimate_job(
     manager: DialogManager,
-    project_id: str,
-    new_name: str,
-    queue: str
+    job_id: int,
+    dialog_data: dict,
+    tracker: TrackerClient,
+    reference_data: Optional[TrackerReferenceData] = None,
 ):
     """
-    Фоновая задача клонирования проекта с использованием BgManager (подход 9).
+    Фоновая задача ожидания задания оценки.
+
+    Когда воркер сохранит снимок шаблона, план строится по снимку один раз
+    и сохраняется в dialog_data вместе с перерисовкой окна.
 
     Args:
         manager: BgManager для обновления UI
-        project_id: ID проекта-шаблона
-        new_name: Название нового проекта
-        queue: Очередь для задач
+        job_id: ID задания оценки
+        dialog_data: Копия данных диалога на момент запуска оценки
+        tracker: TrackerClient пользователя
+        reference_data: Справочники трекера
     """
-    try:
-        # Создание клиента Tracker
-        async with TrackerClient() as tracker:
-            cloner = ProjectCloner(tracker)
-
-            # Throttling: минимальный интервал между обновлениями UI (1 секунда)
-            last_update_time = 0.0
-
-            # Callback для обновления прогресса (этап 1: получение данных = 0-50%)
-            async def progress_update(value: float):
-                nonlocal last_update_time
-
-                # Масштабируем прогресс: 0-100% fetch -> 0-50% общий
-                total_progress = value * 0.5
-
-                # Определение текущей фазы
-                if value <= 5:
-                    phase = "📁 Получение проекта..."
-                elif value <= 40:
-                    phase = "🔄 Получение задач (рекурсивно)..."
-                elif value <= 55:
-                    phase = "✅ Получение чеклистов..."
-                elif value <= 75:
-                    phase = "🔗 Получение связей..."
-                elif value <= 90:
-                    phase = "💬 Получение комментариев..."
-                else:
-                    phase = "🔍 Проверка связанных задач..."
-
-                # Throttling: обновляем UI только раз в секунду или при завершении
-                current_time = time.time()
-                if current_time - last_update_time >= UPDATE_INTERVAL or value >= 100:
-                    last_update_time = current_time
-                    await manager.update({
-                        "is_cloning": True,
-                        "progress": int(total_progress),
-                        "phase": phase,
-                    })
-
-            cloner.set_progress_callback(progress_update)
-
-            # Этап 1: Получение данных
-            project_data = await cloner.fetch_project_data(project_id)
-
-            # Callback для клонирования (этап 2: клонирование = 50-100%)
-            async def clone_progress_update(value: float):
-                nonlocal last_update_time
-
-                # Масштабируем прогресс: 0-100% clone -> 50-100% общий
-                total_progress = 50 + value * 0.5
-
-                if value <= 8:
-                    phase = "📁 Создание проекта..."
-                elif value <= 40:
-                    phase = "📋 Клонирование задач..."
-                elif value <= 50:
-                    phase = "🌳 Восстановление иерархии..."
-                elif value <= 65:
-                    phase = "✅ Восстановление чеклистов..."
-                elif value <= 80:
-                    phase = "🔗 Восстановление связей..."
-                else:
-                    phase = "💬 Восстановление комментариев..."
-
-                # Throttling: обновляем UI только раз в секунду или при завершении
-                current_time = time.time()
-                if current_time - last_update_time >= UPDATE_INTERVAL or value >= 100:
-                    last_update_time = current_time
-                    await manager.update({
-                        "is_cloning": True,
-                        "progress": int(total_progress),
-                        "phase": phase,
-                    })
-
-            cloner.set_progress_callback(clone_progress_update)
-
-            # Этап 2: Клонирование
-            result = await cloner.clone_project(
-                project_data=project_data,
-                new_project_name=new_name,
-                target_queue=queue
-            )
+    # Импорт внутри функции: bot.services импортирует хэндлеры (циклический импорт)
+    from bot.services.clone_jobs import get_clone_job
+    from bot.database import CloneJobStatus
+
+    while True:
+        await asyncio.sleep(UPDATE_INTERVAL)
+
+        try:
+            job = await get_clone_job(job_id)
+        except Exception as e:
+            logger.warning(f"Failed to poll estimate job #{job_id}: {e}")
+            continue
+
+        if job and job.status in (CloneJobStatus.QUEUED, CloneJobStatus.RUNNING):
+            continue
+
+        data = {"estimate_job_id": None, "clone_plan": None, "estimate_error": None}
+        if not job:
+            data["estimate_error"] = "Задание оценки не найдено"
+        elif job.status == CloneJobStatus.FAILED:
+            data["estimate_error"] = job.error or "Неизвестная ошибка"
+        else:
+            data["clone_plan"] = await _build_clone_plan(dialog_data, tracker, reference_data)
+
+        try:
+            await manager.update(data)
+        except Exception as e:
+            logger.info(f"Stopped polling estimate job #{job_id}: {e}")
+        return
+
 
+async def poll_clone_job(manager: DialogManager, job_id: int):
+    """
+    Фоновая задача отображения статуса задания на клонирование (подход 9).
+
+    Клонирование выполняет пул воркеров, а окно раз в UPDATE_INTERVAL
+    показывает прогресс задания из БД.
+
+    Args:
+        manager: BgManager для обновления UI
+        job_id: ID задания на клонирование
+    """
+    # Импорт внутри функции: bot.services импортирует хэндлеры (циклический импорт)
+    from bot.services.clone_jobs import get_clone_job
+    from bot.database import CloneJobStatus
+
+    while True:
+        await asyncio.sleep(UPDATE_INTERVAL)
+
+        try:
+            job = await get_clone_job(job_id)
+        except Exception as e:
+            logger.warning(f"Failed to poll clone job #{job_id}: {e}")
+            continue
+
+        if not job:
+            data = {"is_cloning": False, "result": False, "error": "Задание на клонирование не найдено"}
+        elif job.status == CloneJobStatus.QUEUED:
+            data = {"is_cloning": True, "progress": job.progress, "phase": "⏳ В очереди на клонирование..."}
+        elif job.status == CloneJobStatus.RUNNING:
+            data = {
+                "is_cloning": True,
+                "progress": job.progress,
+                "phase": job.phase or "Инициализация...",
+                "eta_seconds": job.eta_seconds,
+                "items_per_second": job.items_per_second,
+            }
+        elif job.status == CloneJobStatus.COMPLETED:
             # Завершено - показываем результат
-            await manager.update({
+            data = {
                 "is_cloning": False,
-                "result": result.success,
-                "new_project_name": result.new_project_name,
-                "new_project_short_id": result.new_project_short_id,
-                "created_count": len(result.new_issues_mapping),
-                "project_url": f"https://tracker.yandex.ru/pages/projects/{result.new_project_short_id}",
-                "error": "\n".join(result.errors) if not result.success else None,
-            })
+                "result": True,
+                "new_project_name": job.new_project_name,
+                "new_project_short_id": job.new_project_short_id,
+                "created_count": job.created_count or 0,
+                "project_url": f"https://tracker.yandex.ru/pages/projects/{job.new_project_short_id}",
+                "error": None,
+            }
+        else:
+            # Ошибка - показываем сообщение об ошибке
+            data = {"is_cloning": False, "result": False, "error": job.error or "Неизвестная ошибка"}
+
+        try:
+            await manager.update(data)
+        except Exception as e:
+            # Диалог закрыт - задание продолжает выполняться без отображения
+            logger.info(f"Stopped polling clone job #{job_id}: {e}")
+            return
+
+        if not data["is_cloning"]:
+            return
+
+
+async def poll_clone_batch(manager: DialogManager, job_ids: List[int]):
+    """
+    Фоновая задача отображения статуса пакетного клонирования.
 
-    except Exception as e:
-        # Ошибка - показываем сообщение об ошибке
-        await manager.update({
-            "is_cloning": False,
-            "result": False,
-            "error": str(e),
-        })
+    Прогресс показывается по каждому проекту пакета и общий (среднее).
+
+    Args:
+        manager: BgManager для обновления UI
+        job_ids: ID заданий пакета
+    """
+    # Импорт внутри функции: bot.services импортирует хэндлеры (циклический импорт)
+    from bot.services.clone_jobs import get_clone_jobs
+    from bot.database import CloneJobStatus
+
+    finished_statuses = (CloneJobStatus.COMPLETED, CloneJobStatus.FAILED)
+
+    while True:
+        await asyncio.sleep(UPDATE_INTERVAL)
+
+        try:
+            jobs = await get_clone_jobs(job_ids)
+        except Exception as e:
+            logger.warning(f"Failed to poll clone batch {job_ids}: {e}")
+            continue
+
+        if not jobs:
+            data = {"is_cloning": False, "result": False, "error": "Задания на клонирование не найдены"}
+        elif any(job.status not in finished_statuses for job in jobs):
+            lines = []
+            for job in jobs:
+                if job.status == CloneJobStatus.QUEUED:
+                    status = "⏳ в очереди"
+                elif job.status == CloneJobStatus.RUNNING:
+                    status = f"{job.progress}% {job.phase or ''}"
+                    speed = format_clone_speed(job.eta_seconds, job.items_per_second)
+                    if speed:
+                        status += f" ({speed})"
+                elif job.status == CloneJobStatus.COMPLETED:
+                    status = "✅ готово"
+                else:
+                    status = "❌ ошибка"
+                lines.append(f"• {html.escape(job.new_project_name)}: {status}")
+
+            data = {
+                "is_cloning": True,
+                "progress": sum(job.progress for job in jobs) // len(jobs),
+                "phase": f"📦 Клонирование в {len(jobs)} проектов...",
+                "batch_progress": "\n".join(lines),
+            }
+        else:
+            lines = []
+            for job in jobs:
+                if job.status == CloneJobStatus.COMPLETED:
+                    url = f"https://tracker.yandex.ru/pages/projects/{job.new_project_short_id}"
+                    lines.append(
+                        f"✅ <a href=\"{url}\">{html.escape(job.new_project_name)}</a>: {job.created_count or 0} задач"
+                    )
+                else:
+                    lines.append(f"❌ {html.escape(job.new_project_name)}: {html.escape(job.error or 'Неизвестная ошибка')}")
+
+            completed = sum(job.status == CloneJobStatus.COMPLETED for job in jobs)
+            data = {
+                "is_cloning": False,
+                "result": bool(completed),
+                "batch_result": "\n".join(lines),
+                "created_count": sum(job.created_count or 0 for job in jobs),
+                "error": None if completed else "Ни один проект пакета не создан",
+            }
+
+        try:
+            await manager.update(data)
+        except Exception as e:
+            # Диалог закрыт - задания продолжают выполняться без отображения
+            logger.info(f"Stopped polling clone batch {job_ids}: {e}")
+            return
+
+        if not data["is_cloning"]:
+            return
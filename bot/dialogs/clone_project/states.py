@@ -11,6 +11,7 @@ class CloneProject(StatesGroup):
     enter_new_name = State()
     enter_queue = State()
     confirm_clone = State()
+    enter_batch_names = State()
 
 
 class ProjectInfo(StatesGroup):
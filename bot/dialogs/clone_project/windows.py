@@ -14,6 +14,7 @@ from .getters import (
     get_new_name_data,
     get_queue_data,
     get_final_confirm_data,
+    get_batch_names_data,
 )
 from .handlers import (
     on_project_selected,
@@ -24,13 +25,23 @@ from .handlers import (
     on_clone_queue_selected,
     on_start_clone,
     on_message_during_clone,
+    on_resume_clone_selected,
+    on_template_search,
+    on_reset_template_search,
+    on_batch_clone,
+    on_back_to_confirm_project,
+    on_batch_names_input,
+    on_back_from_queue,
+    on_estimate_clone,
 )
 
 
 # Окно 1: Выбор проекта
 select_project_window = Window(
     Const("Выберите проект для клонирования:", when="count"),
+    Format("🔎 Поиск: <b>{query}</b>", when="query"),
     Const("❌ Не найдено проектов со словом 'шаблон'", when=lambda data, widget, manager: not data.get("count")),
+    Const("\n💡 Отправьте часть названия для поиска"),
     ScrollingGroup(
         Select(
             Format("{item[0]}"),  # Отображаем название проекта
@@ -44,6 +55,23 @@ select_project_window = Window(
         height=5,
         when="count",  # Показываем только если есть проекты
     ),
+    Button(
+        Const("✖️ Сбросить поиск"),
+        id="reset_template_search",
+        on_click=on_reset_template_search,
+        when="query",
+    ),
+    MessageInput(on_template_search),
+    # Прерванные клонирования
+    Const("\n♻️ Прерванные клонирования:", when="has_unfinished"),
+    Select(
+        Format("♻️ Продолжить: {item[new_project_name]}"),
+        id="resume_clone_select",
+        item_id_getter=lambda x: x["id"],
+        items="unfinished_journals",
+        on_click=on_resume_clone_selected,
+        when="has_unfinished",
+    ),
     Cancel(Const("❌ Отмена")),
     state=CloneProject.select_project,
     getter=get_select_project_data,
@@ -57,6 +85,11 @@ confirm_project_window = Window(
         id="confirm_project",
         on_click=on_confirm_project,
     ),
+    Button(
+        Const("📦 Клонировать в несколько проектов"),
+        id="batch_clone",
+        on_click=on_batch_clone,
+    ),
     Back(Const("◀️ Назад")),
     state=CloneProject.confirm_project,
     getter=get_confirm_data,
@@ -74,7 +107,8 @@ enter_new_name_window = Window(
 
 # Окно 4: Выбор целевой очереди
 enter_queue_window = Window(
-    Format("Новый проект: <b>{new_name}</b>\n"),
+    Format("Новый проект: <b>{new_name}</b>\n", when=~F["batch_count"]),
+    Format("Новых проектов: <b>{batch_count}</b>\n", when="batch_count"),
     # Если есть дефолтная очередь и не в режиме выбора из списка
     Format(
         "Очередь из настроек: <code>{default_queue}</code>\n\n"
@@ -111,7 +145,8 @@ enter_queue_window = Window(
         height=5,
         when=lambda data, widget, manager: not data.get("has_default") or data.get("queue_step") == "select_queue_list",
     ),
-    Back(Const("◀️ Назад")),
+    Const("\n💡 Очередь используется для проектов пакета без своей очереди", when="batch_count"),
+    Button(Const("◀️ Назад"), id="back_from_queue", on_click=on_back_from_queue),
     state=CloneProject.enter_queue,
     getter=get_queue_data,
 )
@@ -120,8 +155,16 @@ enter_queue_window = Window(
 confirm_clone_window = Window(
     # === СОСТОЯНИЕ 1: Подтверждение (is_cloning=False, result=None) ===
     Format("📁 Исходный проект: <b>{project_name}</b>", when=~F["is_cloning"] & ~F["result"]),
-    Format("📝 Новый проект: <b>{new_name}</b>", when=~F["is_cloning"] & ~F["result"]),
-    Format("📮 Очередь: <b>{queue}</b>\n", when=~F["is_cloning"] & ~F["result"]),
+    Format("📝 Новый проект: <b>{new_name}</b>", when=~F["is_cloning"] & ~F["result"] & ~F["is_batch"]),
+    Format("📮 Очередь: <b>{queue}</b>\n", when=~F["is_cloning"] & ~F["result"] & ~F["is_batch"]),
+    Format("📝 Новые проекты:\n{batch_targets}\n", when=~F["is_cloning"] & ~F["result"] & F["is_batch"]),
+    Format("{clone_plan}\n", when=~F["is_cloning"] & ~F["result"] & F["clone_plan"]),
+    Button(
+        Const("📊 Оценить стоимость"),
+        id="estimate_clone",
+        on_click=on_estimate_clone,
+        when=~F["is_cloning"] & ~F["result"] & F["can_estimate"],
+    ),
     Const("⚠️ Начать клонирование?", when=~F["is_cloning"] & ~F["result"]),
     Button(
         Const("🚀 Начать"),
@@ -134,16 +177,20 @@ confirm_clone_window = Window(
     # === СОСТОЯНИЕ 2: Клонирование (is_cloning=True) ===
     Format("\n{phase}\n", when=F["is_cloning"]),
     Progress("progress", 10, when=F["is_cloning"]),
+    Format("{speed}", when=F["is_cloning"] & F["speed"]),
+    Format("\n{batch_progress}", when=F["is_cloning"] & F["batch_progress"]),
 
     # === СОСТОЯНИЕ 3: Результат (is_cloning=False, result есть) ===
     # Успех
-    Format("📁 Проект: <b>{new_project_name}</b>", when=~F["is_cloning"] & F["result"]),
+    Format("📁 Проект: <b>{new_project_name}</b>", when=~F["is_cloning"] & F["result"] & ~F["batch_result"]),
     Format("📋 Создано задач: <b>{created_count}</b>\n", when=~F["is_cloning"] & F["result"]),
     Url(
         Const("🔗 Открыть проект"),
         Format("{project_url}"),
-        when=~F["is_cloning"] & F["result"]
+        when=~F["is_cloning"] & F["result"] & ~F["batch_result"]
     ),
+    # Результаты пакета (и успешные, и с ошибкой)
+    Format("{batch_result}\n", when=~F["is_cloning"] & F["batch_result"]),
     Cancel(Const("🏠 Главное меню"), when=~F["is_cloning"] & F["result"]),
 
     # Ошибка
@@ -158,3 +205,18 @@ confirm_clone_window = Window(
     state=CloneProject.confirm_clone,
     getter=get_final_confirm_data,
 )
+
+# Окно 6: Ввод названий проектов пакетного клонирования
+enter_batch_names_window = Window(
+    Format("Клонируется проект: <b>{project_name}</b>\n"),
+    Format(
+        "Введите названия новых проектов, по одному в строке (не больше {max_targets}).\n"
+        "Очередь для проекта можно указать через «{separator}»:\n"
+        "<code>Клиент А{separator} CLIENTA</code>\n\n"
+        "Шаблон загрузится один раз, проекты будут созданы одновременно."
+    ),
+    MessageInput(on_batch_names_input),
+    Button(Const("◀️ Назад"), id="back_to_confirm_project", on_click=on_back_to_confirm_project),
+    state=CloneProject.enter_batch_names,
+    getter=get_batch_names_data,
+)
@@ -5,7 +5,6 @@ from typing import Any
 from aiogram_dialog import DialogManager
 
 from bot.database import get_session, UserCRUD, UserRole
-from src.tracker_client import TrackerClient
 from .constants import ROLE_MAPPING, ROLES_LIST, BILLING_CONTACT_OPTIONS
 
 logger = logging.getLogger(__name__)
@@ -68,21 +67,20 @@ async def get_user_management_data(dialog_manager: DialogManager, **kwargs) -> d
     tracker_users_map = {}  # Маппинг login -> display для сохранения display_name
     if step == "select_tracker_user" or (mode == "edit" and step == "tracker_login"):
         try:
-            async with TrackerClient() as tracker:
-                tracker_users_raw = await tracker.client.users.get()
-                tracker_users = [
-                    {
-                        "login": u.get("login", ""),
-                        "display": u.get("display", u.get("login", "")),
-                    }
-                    for u in tracker_users_raw
-                    if not u.get("dismissed", False)  # Только активные
-                ]
-                # Создаем маппинг для быстрого доступа
-                tracker_users_map = {
-                    u["login"]: u["display"] for u in tracker_users
+            tracker_users_raw = await kwargs["reference_data"].get_users()
+            tracker_users = [
+                {
+                    "login": u.get("login", ""),
+                    "display": u.get("display", u.get("login", "")),
                 }
-                logger.info(f"Loaded {len(tracker_users)} active tracker users")
+                for u in tracker_users_raw
+                if not u.get("dismissed", False)  # Только активные
+            ]
+            # Создаем маппинг для быстрого доступа
+            tracker_users_map = {
+                u["login"]: u["display"] for u in tracker_users
+            }
+            logger.info(f"Loaded {len(tracker_users)} active tracker users")
         except Exception as e:
             logger.error(f"Error fetching tracker users: {e}", exc_info=True)
 
@@ -5,7 +5,6 @@ from typing import Any
 from aiogram_dialog import DialogManager
 
 from bot.database import UserRole
-from src.tracker_client import TrackerClient
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +24,14 @@ async def get_user_settings_data(dialog_manager: DialogManager, **kwargs) -> dic
     portfolio_name = None
     if user_settings and user_settings.default_portfolio and step == "":
         try:
-            async with TrackerClient() as tracker:
-                portfolio_data = await tracker.client.entities.get(
-                    entity_id=user_settings.default_portfolio,
-                    entity_type="portfolio",
-                    fields="summary"
-                )
-                if portfolio_data:
-                    fields_dict = portfolio_data.get("fields", {})
-                    portfolio_name = fields_dict.get("summary") or f"Портфель #{portfolio_data.get('shortId')}"
+            portfolio_data = await kwargs["reference_data"].get_entity(
+                entity_id=user_settings.default_portfolio,
+                entity_type="portfolio",
+                fields="summary"
+            )
+            if portfolio_data:
+                fields_dict = portfolio_data.get("fields", {})
+                portfolio_name = fields_dict.get("summary") or f"Портфель #{portfolio_data.get('shortId')}"
         except Exception as e:
             logger.error(f"Error fetching portfolio name: {e}")
             portfolio_name = user_settings.default_portfolio
@@ -41,60 +39,40 @@ async def get_user_settings_data(dialog_manager: DialogManager, **kwargs) -> dic
     if step == "select_queue":
         # Получаем список очередей
         try:
-            async with TrackerClient() as tracker:
-                queues_raw = await tracker.client.queues.get()
-                logger.info(f"Fetched {len(queues_raw) if queues_raw else 0} queues from API")
-                logger.info(f"Sample queue: {queues_raw[0] if queues_raw else 'None'}")
-                queues = [
-                    {"key": q.get("key", ""), "name": q.get("name", q.get("key", ""))}
-                    for q in queues_raw
-                ]
-                logger.info(f"Processed {len(queues)} queues")
+            queues_raw = await kwargs["reference_data"].get_queues()
+            logger.info(f"Fetched {len(queues_raw) if queues_raw else 0} queues from API")
+            logger.info(f"Sample queue: {queues_raw[0] if queues_raw else 'None'}")
+            queues = [
+                {"key": q.get("key", ""), "name": q.get("name", q.get("key", ""))}
+                for q in queues_raw
+            ]
+            logger.info(f"Processed {len(queues)} queues")
         except Exception as e:
             logger.error(f"Error fetching queues: {e}", exc_info=True)
 
     elif step == "select_portfolio":
         # Получаем список портфелей
         try:
-            async with TrackerClient() as tracker:
-                # Запрашиваем портфели с полем summary
-                portfolios_raw = await tracker.client.entities.search(
-                    entity_type="portfolio",
-                    fields="summary"
+            # Портфели с полем summary из общего кэша справочных данных
+            portfolios_raw = await kwargs["reference_data"].get_portfolios()
+
+            logger.info(f"Fetched {len(portfolios_raw) if portfolios_raw else 0} portfolios from API")
+
+            # Формируем список портфелей с человекочитаемыми именами
+            portfolios = []
+            for p in portfolios_raw:
+                fields_dict = p.get("fields", {})
+                # Название из fields.summary или fallback на shortId
+                name = (
+                    fields_dict.get("summary") or
+                    f"Портфель #{p.get('shortId', p.get('id', ''))}"
                 )
+                portfolios.append({
+                    "id": p.get("id", ""),
+                    "name": name
+                })
 
-                logger.info(f"Raw portfolios response type: {type(portfolios_raw)}")
-
-                # Обработка пагинации
-                if isinstance(portfolios_raw, dict):
-                    pages = portfolios_raw.get("pages", 1)
-                    if isinstance(pages, int) and pages > 1:
-                        per_page = pages * 50
-                        portfolios_raw = await tracker.client.entities.search(
-                            entity_type="portfolio",
-                            fields="summary",
-                            per_page=per_page,
-                        )
-                    if "values" in portfolios_raw:
-                        portfolios_raw = portfolios_raw["values"]
-
-                logger.info(f"Fetched {len(portfolios_raw) if portfolios_raw else 0} portfolios from API")
-
-                # Формируем список портфелей с человекочитаемыми именами
-                portfolios = []
-                for p in portfolios_raw:
-                    fields_dict = p.get("fields", {})
-                    # Название из fields.summary или fallback на shortId
-                    name = (
-                        fields_dict.get("summary") or
-                        f"Портфель #{p.get('shortId', p.get('id', ''))}"
-                    )
-                    portfolios.append({
-                        "id": p.get("id", ""),
-                        "name": name
-                    })
-
-                logger.info(f"Processed {len(portfolios)} portfolios with names from fields.summary")
+            logger.info(f"Processed {len(portfolios)} portfolios with names from fields.summary")
         except Exception as e:
             logger.error(f"Error fetching portfolios: {e}", exc_info=True)
 
@@ -7,7 +7,7 @@ from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 
 from bot.database.models import UserRole, PaymentRequestStatus
-from bot.database import get_session, PaymentRequestCRUD
+from bot.database import get_session, PaymentRequestCRUD, utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -174,7 +174,7 @@ async def test_create_payments(callback: CallbackQuery, user=None):
     await callback.answer("⏳ Создаю тестовые платежи...")
 
     try:
-        now = datetime.utcnow()
+        now = utcnow()
         today = now.date()
 
         # Реальные file_id из Telegram (из выгрузки тестов)
@@ -0,0 +1,662 @@
+"""Очередь заданий на клонирование проектов и пул воркеров"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from bot.database import get_session, CloneJobCRUD, CloneRunCRUD, CloneJob, CloneJobKind, CloneJobStatus, utcnow
+from src.tracker_client import TrackerClient
+from src.clone_journal import CloneJournal
+from src.clone_pipeline import clone_project_streaming
+from src.clone_progress import CloneProgress, ProgressReporter, ProgressSnapshot
+from src.clone_stats import CloneStats, collect_stats
+from src.project_cloner import (
+    CloneResult,
+    CloneTarget,
+    ProjectCloner,
+    CREATE_BACKEND,
+    MINIMAL_CLONE_PROFILE,
+    get_clone_backend,
+    get_clone_profile,
+)
+from .clone_journals import start_clone_journal, load_clone_journal, finish_clone_journal
+from .template_snapshots import load_project_snapshot, save_project_snapshot, try_save_project_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Максимальное количество одновременных запросов к Tracker API в одном клонировании
+CLONE_MAX_CONCURRENCY = 10
+
+# Интервал опроса очереди свободным воркером (в секундах)
+POLL_INTERVAL = 2.0
+
+# Интервал сохранения прогресса задания фоновым ProgressReporter (в секундах)
+PROGRESS_SAVE_INTERVAL = 1.0
+
+# Интервал сигнала активности выполняемых заданий (в секундах)
+HEARTBEAT_INTERVAL = 30.0
+
+# Задание без сигнала активности дольше этого времени считается брошенным
+STALE_JOB_TIMEOUT = 120.0
+
+# Максимум запусков одного задания (перезапуски после остановки воркера)
+MAX_JOB_ATTEMPTS = 3
+
+
+@dataclass
+class CloneWorkerConfig:
+    """Настройки воркеров клонирования.
+
+    Attributes:
+        workers: Количество одновременно выполняемых заданий в одном процессе
+        per_user_limit: Максимум выполняемых заданий одного пользователя
+        global_limit: Максимум выполняемых заданий всеми процессами
+        embedded: Запускать воркеры в процессе бота (иначе - run_clone_worker.py)
+        profile: Профиль загрузки задач шаблона (minimal - только нужные поля, full - все)
+        streaming: Создавать задачи по мере получения (если нет снимка шаблона)
+        backend: Способ создания задач (create - issues.create, import - API импорта)
+        fallback_user: Пользователь вместо уволенных исполнителей и наблюдателей шаблона
+    """
+
+    workers: int = 2
+    per_user_limit: int = 1
+    global_limit: int = 4
+    embedded: bool = True
+    profile: str = MINIMAL_CLONE_PROFILE.name
+    streaming: bool = True
+    backend: str = CREATE_BACKEND
+    fallback_user: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "CloneWorkerConfig":
+        """
+        Загрузить настройки из переменных окружения.
+
+        CLONE_WORKERS, CLONE_JOBS_PER_USER, CLONE_MAX_RUNNING_JOBS,
+        CLONE_WORKER_MODE (embedded - в процессе бота, external - отдельный процесс)
+        CLONE_PROFILE, CLONE_STREAMING (0 - загрузка и клонирование по очереди)
+        CLONE_BACKEND (import - создавать задачи через API импорта)
+        и CLONE_FALLBACK_USER (логин вместо уволенных пользователей).
+
+        Returns:
+            CloneWorkerConfig
+        """
+        return cls(
+            workers=max(1, int(os.getenv("CLONE_WORKERS", cls.workers))),
+            per_user_limit=max(1, int(os.getenv("CLONE_JOBS_PER_USER", cls.per_user_limit))),
+            global_limit=max(1, int(os.getenv("CLONE_MAX_RUNNING_JOBS", cls.global_limit))),
+            embedded=os.getenv("CLONE_WORKER_MODE", "embedded").lower() != "external",
+            profile=get_clone_profile(os.getenv("CLONE_PROFILE")).name,
+            streaming=os.getenv("CLONE_STREAMING", "1").lower() not in ("0", "false", "no"),
+            backend=get_clone_backend(os.getenv("CLONE_BACKEND")),
+            fallback_user=os.getenv("CLONE_FALLBACK_USER") or None,
+        )
+
+
+def _fetch_phase(value: float) -> str:
+    """Этап получения данных для отображения пользователю"""
+    if value <= 5:
+        return "📁 Получение проекта..."
+    if value <= 40:
+        return "🔄 Получение задач (рекурсивно)..."
+    if value <= 90:
+        return "📦 Получение чеклистов, связей и комментариев..."
+    return "🔍 Проверка связанных задач..."
+
+
+def _stream_phase(value: float) -> str:
+    """Этап потокового клонирования для отображения пользователю"""
+    if value <= 5:
+        return "📁 Создание проекта..."
+    return "⚡ Получение и клонирование задач..."
+
+
+def _clone_phase(value: float) -> str:
+    """Этап клонирования для отображения пользователю"""
+    if value <= 8:
+        return "📁 Создание проекта..."
+    if value < 48:
+        return "📋 Клонирование задач и иерархии..."
+    if value <= 50:
+        return "👥 Добавление наблюдателей..."
+    if value <= 65:
+        return "✅ Восстановление чеклистов..."
+    if value <= 80:
+        return "🔗 Восстановление связей..."
+    return "💬 Восстановление комментариев..."
+
+
+async def enqueue_clone_job(
+    source_project_id: str,
+    new_project_name: str,
+    target_queue: str,
+    user_id: Optional[int] = None,
+    source_project_name: Optional[str] = None,
+    journal_id: Optional[int] = None,
+) -> int:
+    """Ставит клонирование в очередь
+
+    Args:
+        source_project_id: ID проекта-шаблона
+        new_project_name: Название нового проекта
+        target_queue: Очередь для новых задач
+        user_id: ID пользователя бота
+        source_project_name: Название проекта-шаблона
+        journal_id: ID журнала прерванного клонирования (для продолжения)
+
+    Returns:
+        ID задания
+    """
+    async with get_session() as session:
+        job = await CloneJobCRUD.create_job(
+            session,
+            source_project_id=source_project_id,
+            new_project_name=new_project_name,
+            target_queue=target_queue,
+            user_id=user_id,
+            source_project_name=source_project_name,
+            journal_id=journal_id,
+        )
+    logger.info(f"Clone job #{job.id} queued: {source_project_id} -> {new_project_name}")
+    return job.id
+
+
+async def enqueue_estimate_job(
+    source_project_id: str,
+    user_id: Optional[int] = None,
+    source_project_name: Optional[str] = None,
+) -> int:
+    """Ставит в очередь загрузку шаблона для оценки стоимости клонирования
+
+    Воркер загружает шаблон и сохраняет снимок, а план клонирования
+    строится по снимку (get_clone_plan) - обработчик бота шаблон не загружает.
+
+    Args:
+        source_project_id: ID проекта-шаблона
+        user_id: ID пользователя бота
+        source_project_name: Название проекта-шаблона
+
+    Returns:
+        ID задания
+    """
+    async with get_session() as session:
+        job = await CloneJobCRUD.create_job(
+            session,
+            source_project_id=source_project_id,
+            new_project_name="",
+            target_queue="",
+            user_id=user_id,
+            source_project_name=source_project_name,
+            kind=CloneJobKind.ESTIMATE,
+        )
+    logger.info(f"Estimate job #{job.id} queued: {source_project_id}")
+    return job.id
+
+
+async def enqueue_clone_batch(
+    source_project_id: str,
+    targets: Sequence[Tuple[str, str]],
+    user_id: Optional[int] = None,
+    source_project_name: Optional[str] = None,
+) -> List[int]:
+    """Ставит в очередь клонирование одного шаблона в несколько проектов
+
+    Задания пакета выполняет один воркер: шаблон загружается один раз,
+    копии создаются одновременно с общим лимитом запросов к API.
+
+    Args:
+        source_project_id: ID проекта-шаблона
+        targets: Пары (название нового проекта, очередь для новых задач)
+        user_id: ID пользователя бота
+        source_project_name: Название проекта-шаблона
+
+    Returns:
+        ID заданий в порядке targets
+    """
+    batch_id = uuid.uuid4().hex
+    async with get_session() as session:
+        jobs = await CloneJobCRUD.create_batch_jobs(
+            session,
+            batch_id=batch_id,
+            source_project_id=source_project_id,
+            targets=targets,
+            user_id=user_id,
+            source_project_name=source_project_name,
+        )
+    logger.info(f"Clone batch {batch_id} queued: {source_project_id} -> {len(jobs)} project(s)")
+    return [job.id for job in jobs]
+
+
+async def get_clone_job(job_id: int) -> Optional[CloneJob]:
+    """Получает задание на клонирование
+
+    Args:
+        job_id: ID задания
+
+    Returns:
+        Задание или None
+    """
+    async with get_session() as session:
+        return await CloneJobCRUD.get_job(session, job_id)
+
+
+async def get_clone_jobs(job_ids: Sequence[int]) -> List[CloneJob]:
+    """Получает задания на клонирование (например, задания пакета)
+
+    Args:
+        job_ids: ID заданий
+
+    Returns:
+        Найденные задания в порядке job_ids
+    """
+    async with get_session() as session:
+        return await CloneJobCRUD.get_jobs(session, job_ids)
+
+
+class CloneWorkerPool:
+    """
+    Пул воркеров, выполняющих задания на клонирование из очереди в БД.
+
+    Каждый процесс выполняет не больше config.workers заданий, а выбор
+    задания учитывает лимиты на пользователя и на все процессы. Задания
+    остановившихся воркеров возвращаются в очередь и продолжаются по журналу.
+    """
+
+    def __init__(self, tracker: TrackerClient, config: Optional[CloneWorkerConfig] = None):
+        """
+        Args:
+            tracker: Клиент Tracker
+            config: Настройки воркеров (если None - из переменных окружения)
+        """
+        self.tracker = tracker
+        self.config = config or CloneWorkerConfig.from_env()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._jobs: Dict[int, asyncio.Task] = {}
+        self._job_ids: Set[int] = set()  # выполняемые задания, включая задания пакетов
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Запустить пул воркеров"""
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run())
+            logger.info(f"✅ Clone worker pool started ({self.worker_id}, workers={self.config.workers})")
+
+    def notify(self) -> None:
+        """Разбудить пул (в очередь добавлено задание)"""
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Остановить пул воркеров
+
+        Выполняемые задания прерываются и возвращаются в очередь - любой
+        воркер продолжит их по журналу.
+        """
+        tasks = list(self._jobs.values())
+        if self._loop_task:
+            tasks.append(self._loop_task)
+            self._loop_task = None
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            async with get_session() as session:
+                released = await CloneJobCRUD.release_worker_jobs(session, self.worker_id)
+            if released:
+                logger.info(f"Returned {released} interrupted clone job(s) to the queue")
+        except Exception as e:
+            logger.error(f"Failed to release clone jobs of {self.worker_id}: {e}", exc_info=True)
+
+        logger.info("✅ Clone worker pool stopped")
+
+    async def _run(self) -> None:
+        """Основной цикл: выбор заданий из очереди и сигнал активности"""
+        last_heartbeat = 0.0
+        while True:
+            try:
+                now = time.monotonic()
+                if now - last_heartbeat >= HEARTBEAT_INTERVAL:
+                    last_heartbeat = now
+                    await self._heartbeat()
+
+                while len(self._jobs) < self.config.workers:
+                    job = await self._claim()
+                    if not job:
+                        break
+                    run_job = self._run_estimate if job.kind == CloneJobKind.ESTIMATE.value else self._run_job
+                    self._jobs[job.id] = asyncio.create_task(run_job(job))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Clone worker pool error: {e}", exc_info=True)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _heartbeat(self) -> None:
+        """Продлить активность своих заданий и вернуть в очередь брошенные"""
+        stale_before = utcnow() - timedelta(seconds=STALE_JOB_TIMEOUT)
+        async with get_session() as session:
+            await CloneJobCRUD.touch_jobs(session, list(self._job_ids))
+            requeued = await CloneJobCRUD.requeue_stale_jobs(session, stale_before, MAX_JOB_ATTEMPTS)
+        if requeued:
+            logger.warning(f"Requeued {requeued} stale clone job(s)")
+
+    async def _claim(self) -> Optional[CloneJob]:
+        """Взять следующее задание из очереди"""
+        async with get_session() as session:
+            return await CloneJobCRUD.claim_next_job(
+                session,
+                worker_id=self.worker_id,
+                per_user_limit=self.config.per_user_limit,
+                global_limit=self.config.global_limit,
+            )
+
+    def _make_cloner(self) -> ProjectCloner:
+        """Клонер с настройками воркеров"""
+        return ProjectCloner(
+            self.tracker,
+            max_concurrency=CLONE_MAX_CONCURRENCY,
+            profile=get_clone_profile(self.config.profile),
+            backend=self.config.backend,
+            fallback_user=self.config.fallback_user,
+        )
+
+    async def _clone(self, runs: List["_JobRun"]) -> List[CloneResult]:
+        """
+        Клонировать проекты заданий (одно задание или пакет одного шаблона).
+
+        Данные шаблона берутся из актуального снимка или загружаются один раз
+        на все задания пакета, затем копии клонируются одновременно с общим
+        лимитом запросов. Одиночное задание без снимка в потоковом режиме
+        создает задачи по мере получения.
+
+        Args:
+            runs: Выполняемые задания с журналами
+
+        Returns:
+            CloneResult для каждого задания в порядке runs
+        """
+        source_project_id = runs[0].job.source_project_id
+        cloner = self._make_cloner()
+
+        project_data, fingerprint = await load_project_snapshot(cloner, source_project_id)
+
+        if project_data is None and self.config.streaming and len(runs) == 1:
+            run = runs[0]
+            async with run.reporter(cloner.progress, _stream_phase):
+                result, fetched_data = await clone_project_streaming(
+                    cloner,
+                    project_id=source_project_id,
+                    new_project_name=run.job.new_project_name,
+                    target_queue=run.job.target_queue,
+                    journal=run.journal,
+                )
+            if result.success:
+                await try_save_project_snapshot(source_project_id, fingerprint, fetched_data)
+            return [result]
+
+        # Этап 1: Получение данных = 0-50% общего прогресса (одно на все задания)
+        fetch_stats = CloneStats()
+        if project_data is None:
+            async def fetch_progress(snapshot: ProgressSnapshot) -> None:
+                phase = _fetch_phase(cloner.progress.value)
+                for run in runs:
+                    await run.save_progress(snapshot, phase)
+
+            async with ProgressReporter(cloner.progress, fetch_progress, PROGRESS_SAVE_INTERVAL, end=50):
+                with collect_stats(fetch_stats):
+                    project_data = await cloner.fetch_project_data(source_project_id)
+            await try_save_project_snapshot(source_project_id, fingerprint, project_data)
+        else:
+            for run in runs:
+                await run.save_progress(ProgressSnapshot(50, 0), "⚡ Данные шаблона взяты из кэша")
+
+        # Этап 2: Клонирование = 50-100% прогресса каждого задания
+        async with contextlib.AsyncExitStack() as reporters:
+            for run in runs:
+                await reporters.enter_async_context(run.reporter(run.progress, _clone_phase, start=50))
+            results = await cloner.clone_project_batch(
+                project_data,
+                [
+                    CloneTarget(run.job.new_project_name, run.job.target_queue, run.journal, run.progress)
+                    for run in runs
+                ],
+            )
+
+        # Загрузка шаблона общая для пакета - входит в статистику каждой копии
+        for result in results:
+            result.stats.merge(fetch_stats)
+        return results
+
+    async def _run_job(self, job: CloneJob) -> None:
+        """
+        Выполнить задание на клонирование.
+
+        Вместе с заданием пакета берутся в работу остальные ожидающие
+        задания этого пакета - шаблон загружается один раз.
+
+        Args:
+            job: Задание со статусом RUNNING
+        """
+        jobs = [job]
+        if job.batch_id:
+            async with get_session() as session:
+                jobs += await CloneJobCRUD.claim_batch_jobs(session, job.batch_id, self.worker_id)
+        runs = [_JobRun(batch_job) for batch_job in jobs]
+        self._job_ids.update(batch_job.id for batch_job in jobs)
+
+        if job.batch_id:
+            logger.info(
+                f"Clone batch {job.batch_id} ({len(jobs)} job(s)) started by {self.worker_id} "
+                f"(attempt {job.attempts})"
+            )
+        else:
+            logger.info(f"Clone job #{job.id} started by {self.worker_id} (attempt {job.attempts})")
+
+        try:
+            for run in runs:
+                await run.open_journal()
+
+            results = await self._clone(runs)
+
+            for run, result in zip(runs, results):
+                await run.finish(result)
+
+        except asyncio.CancelledError:
+            # Остановка воркера: задания вернутся в очередь как брошенные
+            raise
+        except Exception as e:
+            logger.error(f"Clone job #{job.id} failed: {e}", exc_info=True)
+            for run in runs:
+                await run.fail(e)
+        finally:
+            self._jobs.pop(job.id, None)
+            self._job_ids.difference_update(batch_job.id for batch_job in jobs)
+            self.notify()
+
+
+    async def _run_estimate(self, job: CloneJob) -> None:
+        """
+        Выполнить задание оценки: загрузить шаблон и сохранить снимок.
+
+        Снимок с актуальным отпечатком не загружается заново. План по снимку
+        строит бот (get_clone_plan), а клонирование потом берет шаблон из кэша.
+
+        Args:
+            job: Задание со статусом RUNNING
+        """
+        self._job_ids.add(job.id)
+        run = _JobRun(job)
+        logger.info(f"Estimate job #{job.id} started by {self.worker_id}")
+
+        try:
+            cloner = self._make_cloner()
+            project_data, fingerprint = await load_project_snapshot(cloner, job.source_project_id)
+            if project_data is None:
+                async with run.reporter(cloner.progress, _fetch_phase):
+                    project_data = await cloner.fetch_project_data(job.source_project_id)
+                await save_project_snapshot(job.source_project_id, fingerprint, project_data)
+
+            async with get_session() as session:
+                await CloneJobCRUD.finish_job(session, job.id, CloneJobStatus.COMPLETED)
+            logger.info(f"Estimate job #{job.id} finished: {len(project_data.issues)} issues")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Estimate job #{job.id} failed: {e}", exc_info=True)
+            async with get_session() as session:
+                await CloneJobCRUD.finish_job(session, job.id, CloneJobStatus.FAILED, error=str(e))
+        finally:
+            self._jobs.pop(job.id, None)
+            self._job_ids.discard(job.id)
+            self.notify()
+
+
+class _JobRun:
+    """Выполнение одного задания воркером: журнал, прогресс и завершение."""
+
+    def __init__(self, job: CloneJob):
+        """
+        Args:
+            job: Задание со статусом RUNNING
+        """
+        self.job = job
+        self.journal_id = job.journal_id
+        self.journal: Optional[CloneJournal] = None
+        self.progress = CloneProgress()
+
+    async def open_journal(self) -> None:
+        """Загрузить журнал прерванного клонирования или начать новый."""
+        job = self.job
+        if self.journal_id:
+            loaded = await load_clone_journal(self.journal_id)
+            if not loaded:
+                raise ValueError(f"Журнал клонирования #{self.journal_id} не найден")
+            _, self.journal = loaded
+        else:
+            self.journal_id, self.journal = await start_clone_journal(
+                user_id=job.user_id,
+                source_project_id=job.source_project_id,
+                source_project_name=job.source_project_name,
+                new_project_name=job.new_project_name,
+                target_queue=job.target_queue,
+            )
+            async with get_session() as session:
+                await CloneJobCRUD.set_journal(session, job.id, self.journal_id)
+
+    async def save_progress(self, snapshot: ProgressSnapshot, phase: str) -> None:
+        """Сохранить выборку прогресса задания (ошибка не прерывает клонирование)."""
+        eta = snapshot.eta_seconds
+        try:
+            async with get_session() as session:
+                await CloneJobCRUD.update_progress(
+                    session,
+                    self.job.id,
+                    int(snapshot.progress),
+                    phase,
+                    eta_seconds=round(eta) if eta is not None else None,
+                    items_per_second=round(snapshot.items_per_second, 1),
+                )
+        except Exception as e:
+            logger.warning(f"Failed to save clone job #{self.job.id} progress: {e}")
+
+    def reporter(
+        self,
+        progress: CloneProgress,
+        phase_of: Callable[[float], str],
+        start: float = 0.0,
+        end: float = 100.0,
+    ) -> ProgressReporter:
+        """
+        Фоновое сохранение прогресса этапа раз в PROGRESS_SAVE_INTERVAL.
+
+        Args:
+            progress: Счетчики прогресса клонера
+            phase_of: Текст этапа по прогрессу клонера (0-100)
+            start: Прогресс задания в начале этапа
+            end: Прогресс задания в конце этапа
+
+        Returns:
+            ProgressReporter (async context manager)
+        """
+
+        async def save(snapshot: ProgressSnapshot) -> None:
+            await self.save_progress(snapshot, phase_of(progress.value))
+
+        return ProgressReporter(progress, save, PROGRESS_SAVE_INTERVAL, start=start, end=end)
+
+    async def finish(self, result: CloneResult) -> None:
+        """Завершить задание по результату клонирования."""
+        error = "\n".join(result.errors) or None
+        await finish_clone_journal(self.journal_id, result.success, error)
+        async with get_session() as session:
+            await CloneJobCRUD.finish_job(
+                session,
+                self.job.id,
+                CloneJobStatus.COMPLETED if result.success else CloneJobStatus.FAILED,
+                new_project_short_id=result.new_project_short_id,
+                created_count=len(result.new_issues_mapping),
+                error=error if not result.success else None,
+            )
+        await self.save_stats(result)
+        logger.info(
+            f"Clone job #{self.job.id} finished: success={result.success}, "
+            f"{result.stats.total_seconds:.1f}s, {result.stats.total_calls} calls, "
+            f"{result.stats.total_retries} retries, {result.stats.failures_count} failures"
+        )
+
+    async def save_stats(self, result: CloneResult) -> None:
+        """Сохранить статистику клонирования (ошибка не влияет на задание)."""
+        stats = result.stats
+        try:
+            async with get_session() as session:
+                await CloneRunCRUD.create_run(
+                    session,
+                    source_project_id=self.job.source_project_id,
+                    success=result.success,
+                    issues_count=len(result.new_issues_mapping),
+                    total_seconds=round(stats.total_seconds, 3),
+                    total_calls=stats.total_calls,
+                    total_retries=stats.total_retries,
+                    failures_count=stats.failures_count,
+                    phases=stats.to_dict(),
+                    failures=stats.failures_to_list(),
+                    job_id=self.job.id,
+                    user_id=self.job.user_id,
+                    new_project_short_id=result.new_project_short_id,
+                )
+        except Exception as e:
+            logger.warning(f"Failed to save clone job #{self.job.id} stats: {e}")
+
+    async def fail(self, error: Exception) -> None:
+        """Завершить задание с ошибкой."""
+        if self.journal is not None:
+            await finish_clone_journal(self.journal_id, False, str(error))
+        async with get_session() as session:
+            await CloneJobCRUD.finish_job(session, self.job.id, CloneJobStatus.FAILED, error=str(error))
+
+
+async def run_clone_workers() -> None:
+    """Запуск воркеров клонирования отдельным процессом (run_clone_worker.py)"""
+    config = CloneWorkerConfig.from_env()
+    async with TrackerClient() as tracker:
+        pool = CloneWorkerPool(tracker, config)
+        pool.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await pool.stop()
@@ -0,0 +1,107 @@
+"""Сохранение журналов клонирования в БД"""
+
+import logging
+from typing import Optional, Tuple
+
+from bot.database import get_session, CloneJournalCRUD, CloneJournalRecord, CloneJournalStatus
+from src.clone_journal import CloneJournal
+
+logger = logging.getLogger(__name__)
+
+
+def _bind_checkpoint(journal_id: int, journal: CloneJournal) -> CloneJournal:
+    """Привязывает сохранение контрольных точек журнала к записи в БД"""
+
+    async def save(current: CloneJournal) -> None:
+        try:
+            async with get_session() as session:
+                await CloneJournalCRUD.save_checkpoint(
+                    session,
+                    journal_id,
+                    state=current.to_state(),
+                    new_project_id=current.new_project_id,
+                    new_project_short_id=current.new_project_short_id,
+                )
+        except Exception as e:
+            # Ошибка сохранения журнала не должна прерывать клонирование
+            logger.error(f"Failed to save clone journal #{journal_id}: {e}", exc_info=True)
+
+    journal.on_checkpoint = save
+    return journal
+
+
+async def start_clone_journal(
+    user_id: Optional[int],
+    source_project_id: str,
+    source_project_name: Optional[str],
+    new_project_name: str,
+    target_queue: str,
+) -> Tuple[int, CloneJournal]:
+    """Создает журнал нового клонирования
+
+    Args:
+        user_id: ID пользователя бота
+        source_project_id: ID проекта-шаблона
+        source_project_name: Название проекта-шаблона
+        new_project_name: Название нового проекта
+        target_queue: Очередь для новых задач
+
+    Returns:
+        Кортеж (ID записи журнала, CloneJournal с привязанным сохранением)
+    """
+    journal = CloneJournal()
+    async with get_session() as session:
+        record = await CloneJournalCRUD.create_journal(
+            session,
+            run_id=journal.run_id,
+            source_project_id=source_project_id,
+            source_project_name=source_project_name,
+            new_project_name=new_project_name,
+            target_queue=target_queue,
+            user_id=user_id,
+        )
+    return record.id, _bind_checkpoint(record.id, journal)
+
+
+async def load_clone_journal(
+    journal_id: int,
+) -> Optional[Tuple[CloneJournalRecord, CloneJournal]]:
+    """Загружает журнал для продолжения клонирования
+
+    Args:
+        journal_id: ID записи журнала
+
+    Returns:
+        Кортеж (запись журнала, CloneJournal с сохраненным прогрессом) или None
+    """
+    async with get_session() as session:
+        record = await CloneJournalCRUD.get_journal(session, journal_id)
+        if not record:
+            return None
+        await CloneJournalCRUD.set_status(session, journal_id, CloneJournalStatus.RUNNING)
+
+    journal = CloneJournal.from_state(
+        run_id=record.run_id,
+        state=record.state,
+        new_project_id=record.new_project_id,
+        new_project_short_id=record.new_project_short_id,
+    )
+    return record, _bind_checkpoint(journal_id, journal)
+
+
+async def finish_clone_journal(
+    journal_id: int, success: bool, error: Optional[str] = None
+) -> None:
+    """Отмечает завершение клонирования
+
+    Args:
+        journal_id: ID записи журнала
+        success: Клонирование завершено успешно
+        error: Текст ошибки (при неудаче)
+    """
+    status = CloneJournalStatus.COMPLETED if success else CloneJournalStatus.FAILED
+    try:
+        async with get_session() as session:
+            await CloneJournalCRUD.set_status(session, journal_id, status, error=error)
+    except Exception as e:
+        logger.error(f"Failed to finish clone journal #{journal_id}: {e}", exc_info=True)
@@ -0,0 +1,60 @@
+"""Оценка стоимости клонирования шаблона перед постановкой в очередь"""
+
+import logging
+from typing import Optional
+
+from src.tracker_client import TrackerClient
+from src.clone_planner import ClonePlan, estimate_with_limiter, plan_clone
+from src.project_cloner import ProjectCloner, get_clone_profile
+from src.reference_cache import TrackerReferenceData
+from .clone_jobs import CLONE_MAX_CONCURRENCY, CloneWorkerConfig
+from .template_snapshots import load_project_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+async def get_clone_plan(
+    tracker: TrackerClient,
+    project_id: str,
+    copies: int = 1,
+    reference_data: Optional[TrackerReferenceData] = None,
+) -> Optional[ClonePlan]:
+    """Считает запросы и прогноз длительности клонирования шаблона
+
+    План строится только по актуальному снимку шаблона: шаблон целиком
+    загружает воркер по заданию оценки (enqueue_estimate_job). Наблюдатели
+    считаются после замены уволенных тем же справочником пользователей,
+    что у воркера (тот же запасной пользователь).
+
+    Args:
+        tracker: Клиент Tracker (его лимитер дает лимит и задержки запросов)
+        project_id: ID проекта-шаблона
+        copies: Количество копий (пакетное клонирование)
+        reference_data: Общие справочные данные бота (если None - свой кэш)
+
+    Returns:
+        ClonePlan или None, если актуального снимка нет
+    """
+    # Профиль тот же, что у воркеров - иначе снимок не совпадет по отпечатку
+    config = CloneWorkerConfig.from_env()
+    cloner = ProjectCloner(
+        tracker,
+        max_concurrency=CLONE_MAX_CONCURRENCY,
+        profile=get_clone_profile(config.profile),
+        backend=config.backend,
+        fallback_user=config.fallback_user,
+        reference_data=reference_data,
+    )
+
+    project_data, _ = await load_project_snapshot(cloner, project_id)
+    if project_data is None:
+        return None
+
+    users = await cloner.load_users()
+    plan = plan_clone(project_data, copies=copies, backend=cloner.backend, users=users)
+    estimate_with_limiter(plan, tracker.rate_limiter, CLONE_MAX_CONCURRENCY)
+    logger.info(
+        f"Clone plan for project {project_id} x{plan.copies}: "
+        f"{plan.total_calls} calls, ~{plan.total_seconds:.0f}s"
+    )
+    return plan
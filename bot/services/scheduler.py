@@ -6,6 +6,8 @@ from apscheduler.triggers.cron import CronTrigger
 from pytz import timezone
 from aiogram import Bot
 
+from src.tracker_client import TrackerClient
+
 from .payment_reminders import (
     send_reminder_scheduled_today,
     send_reminder_scheduled_date,
@@ -13,6 +15,7 @@ from .payment_reminders import (
     rollover_overdue_scheduled_date,
     send_morning_pending_list,
 )
+from .template_snapshots import prewarm_template_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +26,12 @@ MSK = timezone('Europe/Moscow')
 scheduler: AsyncIOScheduler | None = None
 
 
-def start_scheduler(bot: Bot):
+def start_scheduler(bot: Bot, tracker: TrackerClient | None = None):
     """Запускает scheduler с задачами для напоминаний об оплате
 
     Args:
         bot: Instance бота для отправки сообщений
+        tracker: Общий клиент Tracker приложения (для задач, работающих с Tracker)
     """
     global scheduler
 
@@ -93,6 +97,17 @@ def start_scheduler(bot: Bot):
     )
     logger.info("Scheduled morning_pending_list at 09:05 MSK")
 
+    # Задача 6: Прогрев снимков проектов-шаблонов в 03:00 МСК (нерабочее время)
+    scheduler.add_job(
+        prewarm_template_snapshots,
+        trigger=CronTrigger(hour=3, minute=0, timezone=MSK),
+        args=[tracker],
+        id='prewarm_template_snapshots',
+        name='Prewarm template project snapshots at 03:00 MSK',
+        replace_existing=True,
+    )
+    logger.info("Scheduled prewarm_template_snapshots at 03:00 MSK")
+
     # Запускаем scheduler
     scheduler.start()
     logger.info("✅ Scheduler started successfully")
@@ -0,0 +1,146 @@
+"""Кэш снимков проектов-шаблонов для клонирования"""
+
+import logging
+import os
+from typing import List, Optional, Tuple
+
+from bot.database import get_session, TemplateSnapshotCRUD
+from src.tracker_client import TrackerClient
+from src.project_cloner import ProjectCloner, ProjectData, get_clone_profile
+
+logger = logging.getLogger(__name__)
+
+
+def _project_name(project_data: ProjectData) -> str:
+    """Название проекта из данных снимка"""
+    project = project_data.project or {}
+    return project.get("fields", {}).get("summary") or project.get("summary") or ""
+
+
+async def save_project_snapshot(
+    project_id: str, fingerprint: str, project_data: ProjectData
+) -> None:
+    """Сохраняет снимок данных проекта в БД
+
+    Args:
+        project_id: ID проекта-шаблона
+        fingerprint: Отпечаток задач проекта на момент загрузки
+        project_data: Загруженные данные проекта
+    """
+    async with get_session() as session:
+        await TemplateSnapshotCRUD.save_snapshot(
+            session,
+            project_id=project_id,
+            fingerprint=fingerprint,
+            payload=project_data.to_snapshot(),
+            issues_count=len(project_data.issues),
+            project_name=_project_name(project_data),
+        )
+
+
+async def load_project_snapshot(
+    cloner: ProjectCloner, project_id: str
+) -> Tuple[Optional[ProjectData], str]:
+    """Возвращает актуальный снимок проекта, если он есть
+
+    Снимок используется, если отпечаток задач проекта (количество и
+    максимальный updatedAt) не изменился. Сам проект (описание, руководитель,
+    участники) всегда запрашивается заново - это один дешевый запрос.
+
+    Args:
+        cloner: ProjectCloner
+        project_id: ID проекта-шаблона
+
+    Returns:
+        Кортеж (данные проекта или None, текущий отпечаток задач проекта)
+    """
+    fingerprint = await cloner.fetch_project_fingerprint(project_id)
+
+    async with get_session() as session:
+        snapshot = await TemplateSnapshotCRUD.get_snapshot(session, project_id)
+
+    if snapshot and snapshot.fingerprint == fingerprint:
+        try:
+            project_data = ProjectData.from_snapshot(snapshot.payload)
+            project_data.project = await cloner.fetch_project(project_id)
+            logger.info(f"Template snapshot hit for project {project_id} ({snapshot.issues_count} issues)")
+            return project_data, fingerprint
+        except Exception as e:
+            logger.warning(f"Broken template snapshot for project {project_id}: {e}")
+
+    return None, fingerprint
+
+
+async def try_save_project_snapshot(
+    project_id: str, fingerprint: str, project_data: ProjectData
+) -> None:
+    """Сохраняет снимок, не прерывая клонирование при ошибке
+
+    Args:
+        project_id: ID проекта-шаблона
+        fingerprint: Отпечаток задач проекта на момент загрузки
+        project_data: Загруженные данные проекта
+    """
+    try:
+        await save_project_snapshot(project_id, fingerprint, project_data)
+    except Exception as e:
+        # Ошибка кэша не должна ломать клонирование
+        logger.error(f"Failed to save template snapshot for project {project_id}: {e}", exc_info=True)
+
+
+async def _refresh_snapshots(tracker: TrackerClient, project_ids: List[str]) -> int:
+    """Перезагружает снимки изменившихся проектов
+
+    Args:
+        tracker: Клиент Tracker
+        project_ids: ID проектов-шаблонов
+
+    Returns:
+        Количество обновленных снимков
+    """
+    refreshed = 0
+    # Снимки загружаются с тем же профилем, что и у воркеров клонирования
+    cloner = ProjectCloner(tracker, profile=get_clone_profile(os.getenv("CLONE_PROFILE")))
+    for project_id in project_ids:
+        try:
+            fingerprint = await cloner.fetch_project_fingerprint(project_id)
+
+            async with get_session() as session:
+                snapshot = await TemplateSnapshotCRUD.get_snapshot(session, project_id)
+            if snapshot and snapshot.fingerprint == fingerprint:
+                continue
+
+            project_data = await cloner.fetch_project_data(project_id)
+            await save_project_snapshot(project_id, fingerprint, project_data)
+            refreshed += 1
+        except Exception as e:
+            logger.error(f"Failed to prewarm template snapshot {project_id}: {e}", exc_info=True)
+
+    return refreshed
+
+
+async def prewarm_template_snapshots(tracker: Optional[TrackerClient] = None) -> None:
+    """Обновляет устаревшие снимки проектов-шаблонов (запускается ночью)
+
+    Проверяет отпечаток каждого сохраненного шаблона и перезагружает
+    данные только для изменившихся проектов.
+
+    Args:
+        tracker: Общий клиент Tracker (если None - открывается отдельный клиент)
+    """
+    logger.info("Running template snapshots prewarm...")
+
+    async with get_session() as session:
+        project_ids = await TemplateSnapshotCRUD.get_all_snapshot_ids(session)
+
+    if not project_ids:
+        logger.info("No template snapshots to prewarm")
+        return
+
+    if tracker is None:
+        async with TrackerClient() as own_tracker:
+            refreshed = await _refresh_snapshots(own_tracker, project_ids)
+    else:
+        refreshed = await _refresh_snapshots(tracker, project_ids)
+
+    logger.info(f"Template snapshots prewarm finished: {refreshed}/{len(project_ids)} refreshed")
@@ -28,6 +28,10 @@ from bot.database import init_db, init_default_owners
 from bot.database.database import engine
 from bot.database.models import Base
 from bot.services import start_scheduler, shutdown_scheduler
+from bot.services.clone_jobs import CloneWorkerConfig, CloneWorkerPool
+from src.tracker_client import TrackerClient
+from src.reference_cache import TrackerReferenceData
+from src.template_index import TemplateIndex
 
 # Настройка логирования
 logging.basicConfig(
@@ -114,6 +118,25 @@ async def main(reset_database: bool = False, confirm_reset: bool = False, contin
     # Сохранение конфигурации в данных диспетчера
     dp["config"] = config
 
+    # Общий клиент Tracker на все приложение: одна HTTP-сессия с пулом
+    # keep-alive соединений вместо нового клиента на каждую отрисовку окна
+    tracker = TrackerClient(
+        oauth_token=config.tracker_api_key,
+        org_id=config.tracker_org_id,
+    )
+    await tracker.start()
+    dp["tracker"] = tracker
+
+    # Общий кэш справочных данных Tracker (очереди, портфели, проекты, пользователи)
+    dp["reference_data"] = TrackerReferenceData(tracker)
+
+    # Индекс проектов-шаблонов: загружаем в фоне, чтобы выбор шаблона открывался сразу
+    template_index = TemplateIndex(tracker)
+    dp["template_index"] = template_index
+    template_index_warmup = asyncio.create_task(template_index.refresh())
+    template_index_warmup.add_done_callback(lambda t: t.cancelled() or t.exception())
+    logger.info("✅ Клиент Tracker инициализирован")
+
     # Инициализация базы данных
     await init_db()
     logger.info("✅ База данных инициализирована")
@@ -158,7 +181,17 @@ async def main(reset_database: bool = False, confirm_reset: bool = False, contin
         logger.info("Продолжаем запуск...")
 
     # Запуск scheduler для напоминаний
-    start_scheduler(bot)
+    start_scheduler(bot, tracker)
+
+    # Воркеры клонирования: в процессе бота или отдельным процессом (run_clone_worker.py)
+    clone_workers = None
+    clone_worker_config = CloneWorkerConfig.from_env()
+    if clone_worker_config.embedded:
+        clone_workers = CloneWorkerPool(tracker, clone_worker_config)
+        clone_workers.start()
+    else:
+        logger.info("Воркеры клонирования запускаются отдельным процессом (CLONE_WORKER_MODE=external)")
+    dp["clone_workers"] = clone_workers
 
     logger.info("🚀 Бот запущен и готов к работе!")
 
@@ -168,6 +201,9 @@ async def main(reset_database: bool = False, confirm_reset: bool = False, contin
     finally:
         # Останавливаем scheduler
         shutdown_scheduler()
+        if clone_workers:
+            await clone_workers.stop()
+        await tracker.close()
         await bot.session.close()
         logger.info("👋 Бот остановлен")
 
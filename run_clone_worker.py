@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Скрипт для запуска воркеров клонирования отдельным процессом
+
+Используется с CLONE_WORKER_MODE=external, чтобы клонирование больших
+шаблонов не нагружало процесс бота.
+"""
+
+if __name__ == "__main__":
+    import asyncio
+    import logging
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logging.getLogger("YaTrackerApi").propagate = False
+
+    # bot.handlers импортируется первым: bot.services и обработчики платежей
+    # импортируют друг друга, и обратный порядок дает циклический импорт
+    import bot.handlers  # noqa: F401
+    from bot.services.clone_jobs import run_clone_workers
+
+    try:
+        asyncio.run(run_clone_workers())
+    except KeyboardInterrupt:
+        pass
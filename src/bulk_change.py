@@ -0,0 +1,252 @@
+"""Массовое изменение задач через bulkchange API Yandex Tracker."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from dataclasses import dataclass, field
+
+from .tracker_client import TrackerClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Максимум задач в одной операции массового изменения
+BULK_CHANGE_CHUNK_SIZE = 500
+
+# Группа меньше этого размера изменяется обычными запросами: операция с
+# опросом статуса стоит не меньше двух запросов и паузы BULK_POLL_INTERVAL
+BULK_MIN_ISSUES = 5
+
+# Одновременных запросов, если лимит не передан снаружи
+BULK_MAX_CONCURRENCY = 8
+
+# Интервал опроса статуса операции (растет до максимального)
+BULK_POLL_INTERVAL = 0.5
+BULK_MAX_POLL_INTERVAL = 5.0
+
+# Сколько ждать завершения одной операции (в секундах)
+BULK_OPERATION_TIMEOUT = 300.0
+
+# Статусы завершенной операции
+BULK_COMPLETE_STATUSES = {"COMPLETE", "COMPLETED"}
+BULK_FAILED_STATUSES = {"FAILED", "CANCELED", "CANCELLED"}
+
+
+@dataclass
+class BulkChangeResult:
+    """Результат применения массовых изменений."""
+
+    operations: int = 0
+    updated: int = 0
+    direct_updates: int = 0
+    fallback_updates: int = 0
+    failed: Dict[str, str] = field(default_factory=dict)  # {issue_key: error}
+
+
+class BulkChangeEngine:
+    """
+    Группирует одинаковые изменения задач в операции массового изменения.
+
+    Изменения с одинаковыми значениями (например, добавление одного и того же
+    наблюдателя) объединяются в одну операцию POST /bulkchange/_update на
+    BULK_CHANGE_CHUNK_SIZE задач. Статус операции опрашивается до завершения.
+    Если операция завершилась с ошибкой или изменила не все задачи, ее задачи
+    обновляются по одной - так ошибка привязывается к конкретной задаче.
+    Группы меньше min_issues задач сразу изменяются по одной: для них
+    операция дороже обычных запросов.
+
+    Все запросы идут через limited (например, ProjectCloner._limited), поэтому
+    изменение по одной не превышает лимит одновременных запросов клонера.
+    """
+
+    def __init__(
+        self,
+        tracker: TrackerClient,
+        chunk_size: int = BULK_CHANGE_CHUNK_SIZE,
+        poll_interval: float = BULK_POLL_INTERVAL,
+        timeout: float = BULK_OPERATION_TIMEOUT,
+        min_issues: int = BULK_MIN_ISSUES,
+        limited: Optional[Callable[[Awaitable[Any]], Awaitable[Any]]] = None,
+    ):
+        """
+        Args:
+            tracker: Клиент Tracker
+            chunk_size: Максимум задач в одной операции
+            poll_interval: Начальный интервал опроса статуса (сек)
+            timeout: Максимальное ожидание одной операции (сек)
+            min_issues: Минимум задач группы для операции массового изменения
+            limited: Обертка запроса с лимитом одновременных запросов
+                (None - собственный лимит BULK_MAX_CONCURRENCY)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть положительным числом")
+
+        self.tracker = tracker
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.min_issues = min_issues
+        self._limited = limited
+        self._semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+        self._groups: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+
+    def __len__(self) -> int:
+        """Количество накопленных изменений."""
+        return sum(len(keys) for _, keys in self._groups.values())
+
+    def add(self, issue_key: str, values: Dict[str, Any]) -> None:
+        """
+        Добавить изменение задачи.
+
+        Args:
+            issue_key: Ключ задачи
+            values: Изменяемые поля (как в issues.update)
+        """
+        group_key = json.dumps(values, sort_keys=True, ensure_ascii=False)
+        group = self._groups.setdefault(group_key, (values, []))
+        group[1].append(issue_key)
+
+    async def flush(self) -> BulkChangeResult:
+        """
+        Применить накопленные изменения.
+
+        Returns:
+            BulkChangeResult (в failed - задачи, которые не удалось изменить)
+        """
+        groups, self._groups = self._groups, {}
+        result = BulkChangeResult()
+
+        chunks = [
+            (values, keys[i:i + self.chunk_size])
+            for values, keys in groups.values()
+            if len(keys) >= self.min_issues
+            for i in range(0, len(keys), self.chunk_size)
+        ]
+        direct = [
+            (values, keys) for values, keys in groups.values() if len(keys) < self.min_issues
+        ]
+        outcomes, direct_failed = await asyncio.gather(
+            asyncio.gather(*(self._apply_chunk(values, keys) for values, keys in chunks)),
+            asyncio.gather(*(self._apply_one_by_one(values, keys) for values, keys in direct)),
+        )
+
+        for (_, keys), (bulk_ok, failed) in zip(chunks, outcomes):
+            result.operations += 1
+            if not bulk_ok:
+                result.fallback_updates += len(keys)
+            result.updated += len(keys) - len(failed)
+            result.failed.update(failed)
+
+        for (_, keys), failed in zip(direct, direct_failed):
+            result.direct_updates += len(keys)
+            result.updated += len(keys) - len(failed)
+            result.failed.update(failed)
+
+        if result.failed:
+            logger.warning(f"Bulk change: {len(result.failed)} issue(s) were not updated")
+        return result
+
+    async def _apply_chunk(
+        self, values: Dict[str, Any], keys: List[str]
+    ) -> Tuple[bool, Dict[str, str]]:
+        """
+        Применить одно изменение к группе задач.
+
+        Args:
+            values: Изменяемые поля
+            keys: Ключи задач
+
+        Returns:
+            Кортеж (операция выполнена целиком, {issue_key: ошибка})
+        """
+        try:
+            operation = await self._request(self.tracker.client.request(
+                "/bulkchange/_update",
+                method="POST",
+                data={"issues": keys, "values": values},
+            ))
+            status = await self._wait(operation)
+            total = status.get("totalIssues")
+            completed = status.get("totalCompletedIssues")
+            if status.get("status") in BULK_COMPLETE_STATUSES and (
+                total is None or completed is None or completed >= total
+            ):
+                return True, {}
+            logger.warning(
+                f"Bulk change {operation.get('id')} finished with status "
+                f"{status.get('status')}: {status.get('statusText', '')}"
+            )
+        except Exception as e:
+            logger.warning(f"Bulk change of {len(keys)} issue(s) failed: {e}")
+
+        # Операция не выполнена целиком - изменяем задачи по одной
+        return False, await self._apply_one_by_one(values, keys)
+
+    async def _wait(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Дождаться завершения операции массового изменения.
+
+        Args:
+            operation: Ответ на создание операции
+
+        Returns:
+            Последний статус операции
+        """
+        status = operation
+        interval = self.poll_interval
+        deadline = time.monotonic() + self.timeout
+
+        while status.get("status") not in BULK_COMPLETE_STATUSES | BULK_FAILED_STATUSES:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Bulk change {operation.get('id')} timed out")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, BULK_MAX_POLL_INTERVAL)
+            status = await self._request(
+                self.tracker.client.request(f"/bulkchange/{operation['id']}")
+            )
+
+        return status
+
+    async def _apply_one_by_one(
+        self, values: Dict[str, Any], keys: List[str]
+    ) -> Dict[str, str]:
+        """
+        Изменить задачи по одной.
+
+        Args:
+            values: Изменяемые поля
+            keys: Ключи задач
+
+        Returns:
+            Словарь {issue_key: ошибка} для неудачных изменений
+        """
+        results = await asyncio.gather(
+            *(
+                self._request(self.tracker.client.issues.update(issue_id=key, **values))
+                for key in keys
+            ),
+            return_exceptions=True,
+        )
+        return {
+            key: str(outcome)
+            for key, outcome in zip(keys, results)
+            if isinstance(outcome, BaseException)
+        }
+
+    async def _request(self, coro: Awaitable[T]) -> T:
+        """
+        Выполнить запрос с учетом лимита одновременных запросов.
+
+        Args:
+            coro: Корутина запроса
+
+        Returns:
+            Результат корутины
+        """
+        if self._limited:
+            return await self._limited(coro)
+        async with self._semaphore:
+            return await coro
@@ -0,0 +1,133 @@
+"""Журнал клонирования для продолжения прерванного клонирования."""
+
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from dataclasses import dataclass, field
+
+# Минимальный интервал между сохранениями журнала (в секундах)
+CHECKPOINT_INTERVAL = 2.0
+
+
+@dataclass
+class CloneJournal:
+    """
+    Состояние клонирования, достаточное для продолжения с места остановки.
+
+    Задачи создаются с уникальным токеном `run_id:old_key`, поэтому повторный
+    прогон не создаст дубликат задачи, даже если журнал не успел сохраниться.
+    Для чеклистов и комментариев хранится количество уже восстановленных
+    (или пропущенных из-за постоянной ошибки) пунктов каждой задачи -
+    продолжение начинается со следующего пункта.
+    """
+
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    new_project_id: Optional[str] = None
+    new_project_short_id: Optional[int] = None
+    issues_mapping: Dict[str, str] = field(default_factory=dict)
+    checklists_done: Dict[str, int] = field(default_factory=dict)  # {old_key: restored_items}
+    comments_done: Dict[str, int] = field(default_factory=dict)  # {old_key: restored_items}
+    links_done: Set[str] = field(default_factory=set)  # ключи восстановленных связей
+    followers_done: Set[str] = field(default_factory=set)  # old_key задач с наблюдателями
+    on_checkpoint: Optional[Callable[["CloneJournal"], Awaitable[None]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _last_checkpoint_at: float = field(default=0.0, repr=False, compare=False)
+
+    def unique_token(self, old_key: str) -> str:
+        """
+        Токен идемпотентного создания задачи (поле unique в Tracker).
+
+        Args:
+            old_key: Ключ исходной задачи
+
+        Returns:
+            Уникальное значение для issues.create(unique=...)
+        """
+        return f"clone:{self.run_id}:{old_key}"
+
+    async def checkpoint(self, force: bool = False) -> None:
+        """
+        Сохранить журнал (не чаще CHECKPOINT_INTERVAL, если не force).
+
+        Args:
+            force: Сохранить немедленно (границы этапов)
+        """
+        if not self.on_checkpoint:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint_at < CHECKPOINT_INTERVAL:
+            return
+
+        self._last_checkpoint_at = now
+        await self.on_checkpoint(self)
+
+    def unfinished_items(
+        self, checklists: Dict[str, List[Any]], comments: Dict[str, List[Any]]
+    ) -> int:
+        """
+        Количество пунктов чеклистов и комментариев созданных задач,
+        до которых восстановление не дошло.
+
+        Args:
+            checklists: Пункты чеклистов исходных задач {old_key: [item]}
+            comments: Комментарии исходных задач {old_key: [text]}
+
+        Returns:
+            Число невосстановленных пунктов
+        """
+        unfinished = 0
+        for items_by_key, done in ((checklists, self.checklists_done), (comments, self.comments_done)):
+            for old_key, items in items_by_key.items():
+                if old_key in self.issues_mapping:
+                    unfinished += max(0, len(items) - done.get(old_key, 0))
+        return unfinished
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Сериализовать прогресс клонирования в JSON-совместимый словарь.
+
+        Returns:
+            Словарь состояния
+        """
+        return {
+            "issues_mapping": dict(self.issues_mapping),
+            "checklists_done": dict(self.checklists_done),
+            "comments_done": dict(self.comments_done),
+            "links_done": sorted(self.links_done),
+            "followers_done": sorted(self.followers_done),
+        }
+
+    @classmethod
+    def from_state(
+        cls,
+        run_id: str,
+        state: Optional[Dict[str, Any]],
+        new_project_id: Optional[str] = None,
+        new_project_short_id: Optional[int] = None,
+    ) -> "CloneJournal":
+        """
+        Восстановить журнал из сохраненного состояния.
+
+        Args:
+            run_id: Идентификатор прогона клонирования
+            state: Словарь из to_state() (или None для нового журнала)
+            new_project_id: ID уже созданного проекта
+            new_project_short_id: shortId уже созданного проекта
+
+        Returns:
+            CloneJournal
+        """
+        state = state or {}
+        links_done: List[str] = state.get("links_done", [])
+        return cls(
+            run_id=run_id,
+            new_project_id=new_project_id,
+            new_project_short_id=new_project_short_id,
+            issues_mapping=dict(state.get("issues_mapping", {})),
+            checklists_done=dict(state.get("checklists_done", {})),
+            comments_done=dict(state.get("comments_done", {})),
+            links_done=set(links_done),
+            followers_done=set(state.get("followers_done", [])),
+        )
@@ -0,0 +1,349 @@
+"""Потоковое клонирование: получение и создание задач одновременно."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple
+
+from .clone_journal import CloneJournal
+from .clone_stats import collect_stats, stats_phase
+from .link_planner import PlannedLink, canonical_link
+from .project_cloner import CloneResult, ProjectCloner, ProjectData
+from .project_records import ChecklistItem, IssueRecord, LinkRecord
+
+logger = logging.getLogger(__name__)
+
+# Детали задачи: (пункты чеклиста, связи, тексты комментариев)
+IssueDetails = Tuple[List[ChecklistItem], List[LinkRecord], List[str]]
+
+
+class StreamingClone:
+    """
+    Клонирование проекта без раздельных этапов "получить все" и "создать все".
+
+    Страницы задач обрабатываются по мере получения: задача создается, как
+    только получена она и создан ее родитель; чеклист и комментарии
+    восстанавливаются, как только у задачи есть новый ключ, а связь - как
+    только созданы обе задачи. Поэтому время клонирования стремится к
+    max(получение, запись), а не к их сумме.
+
+    Конвейер только планирует шаги, сами шаги (разбор, создание задачи,
+    детали, восстановление пунктов и связей) - публичные методы
+    ProjectCloner, общие с clone_project. Все запросы идут через семафор
+    ProjectCloner, журнал клонирования используется так же, как в
+    ProjectCloner.clone_project.
+    """
+
+    def __init__(self, cloner: ProjectCloner, target_queue: str, journal: CloneJournal):
+        """
+        Args:
+            cloner: Клонер (клиент, лимит запросов, профиль загрузки)
+            target_queue: Очередь для новых задач
+            journal: Журнал клонирования
+        """
+        self.cloner = cloner
+        self.target_queue = target_queue
+        self.journal = journal
+
+        self.project: Dict[str, Any] = {}
+        self.issues: Dict[str, IssueRecord] = {}  # {old_key: issue} в порядке получения
+        self.parent_child: Dict[str, str] = {}
+        self.details: Dict[str, IssueDetails] = {}
+
+        self._finished: Set[str] = set()  # задачи, создание которых завершено
+        self._restored: Set[str] = set()  # задачи, восстановление которых запущено
+        self._waiting_children: Dict[str, List[IssueRecord]] = {}  # {parent_key: [issue]}
+        self._planned_links: Set[PlannedLink] = set()  # связь приходит от обеих задач
+        self._waiting_links: Dict[str, List[PlannedLink]] = {}  # {ожидаемая задача: [link]}
+        self._tasks: Set[asyncio.Task] = set()
+        self._progress = 0.0
+
+    @property
+    def project_data(self) -> ProjectData:
+        """Данные проекта, собранные по ходу клонирования (для снимка шаблона)."""
+        return ProjectData(
+            project=self.project,
+            issues=list(self.issues.values()),
+            checklists={key: details[0] for key, details in self.details.items()},
+            links={key: details[1] for key, details in self.details.items()},
+            comments={key: details[2] for key, details in self.details.items()},
+            parent_child=dict(self.parent_child),
+        )
+
+    async def run(self, project_id: str, new_project_name: str) -> CloneResult:
+        """
+        Клонировать проект.
+
+        Args:
+            project_id: ID исходного проекта
+            new_project_name: Название нового проекта
+
+        Returns:
+            CloneResult с результатами клонирования
+        """
+        cloner = self.cloner
+        journal = self.journal
+        result = CloneResult(success=False)
+        with collect_stats(result.stats):
+            self._set_progress(0)
+
+            try:
+                # 1. Получить исходный проект и справочник пользователей, создать новый проект (5%)
+                with stats_phase("fetch"):
+                    self.project = await cloner.fetch_project(project_id)
+                await cloner.prepare_copy(self.project, new_project_name, journal)
+
+                result.new_project_id = journal.new_project_id
+                result.new_project_short_id = journal.new_project_short_id
+                result.new_project_name = new_project_name
+                self._set_progress(5)
+
+                # 2. Получать страницы задач и сразу запускать создание и детали
+                with stats_phase("fetch"):
+                    async for page in cloner.iter_project_issues(project_id):
+                        for raw_issue in page:
+                            issue, checklist = cloner.parse_issue(raw_issue)
+                            self._add_issue(issue, fetch_details=True, checklist=checklist)
+                        self._raise_failed()
+
+                # 3. Связанные задачи вне проекта ищутся по связям всех задач
+                await self._wait_details()
+                with stats_phase("linked"):
+                    await self._add_linked_issues()
+
+                # 4. Дождаться всех созданий и восстановлений
+                await self._drain()
+
+                # 5. Наблюдатели - массовыми изменениями после создания всех задач
+                await cloner.restore_followers(list(self.issues.values()), journal)
+                await journal.checkpoint(force=True)
+
+                result.new_issues_mapping = journal.issues_mapping
+                self._set_progress(100)
+                result.success = cloner.check_unfinished(result, journal, self.project_data)
+
+            except Exception as e:
+                result.errors.append(str(e))
+                result.success = False
+            finally:
+                for task in self._tasks:
+                    task.cancel()
+                if self._tasks:
+                    await asyncio.gather(*self._tasks, return_exceptions=True)
+                self._tasks.clear()
+
+        return result
+
+    def _spawn(self, coro: Awaitable[Any]) -> None:
+        """Запустить шаг конвейера."""
+        self._tasks.add(asyncio.ensure_future(coro))
+
+    def _raise_failed(self) -> None:
+        """Пробросить неожиданную ошибку завершившегося шага."""
+        for task in [t for t in self._tasks if t.done()]:
+            self._tasks.discard(task)
+            if not task.cancelled():
+                task.result()
+
+    async def _drain(self) -> None:
+        """
+        Дождаться всех шагов конвейера.
+
+        Задачи, чей родитель не клонируется (или входит в цикл иерархии),
+        создаются как корневые, когда ждать больше нечего.
+        """
+        while True:
+            while self._tasks:
+                done, _ = await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    self._tasks.discard(task)
+                    task.result()
+
+            if not self._waiting_children:
+                return
+
+            # Сначала родители вне проекта, затем разрываем циклы
+            parent_key = next(
+                (key for key in self._waiting_children if key not in self.issues),
+                next(iter(self._waiting_children)),
+            )
+            self._release_children(parent_key)
+
+    async def _wait_details(self) -> None:
+        """Дождаться деталей всех полученных задач (созданию не мешает)."""
+        while len(self.details) < len(self.issues):
+            if not self._tasks:
+                break
+            done, _ = await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                self._tasks.discard(task)
+                task.result()
+
+    def _add_issue(
+        self,
+        issue: IssueRecord,
+        fetch_details: bool,
+        checklist: Optional[List[ChecklistItem]] = None,
+    ) -> None:
+        """
+        Принять задачу в конвейер.
+
+        Args:
+            issue: Задача
+            fetch_details: Запросить чеклист, связи и комментарии задачи
+            checklist: Пункты чеклиста из ответа поиска (None - запросить)
+        """
+        old_key = issue.key
+        if not old_key or old_key in self.issues:
+            return
+
+        self.issues[old_key] = issue
+        if issue.parent:
+            self.parent_child[old_key] = issue.parent
+
+        if fetch_details:
+            self._spawn(self._fetch_details(old_key, checklist))
+        self._schedule_create(issue)
+
+    def _schedule_create(self, issue: IssueRecord) -> None:
+        """Создать задачу сейчас или после создания ее родителя."""
+        old_key = issue.key
+
+        # Задача создана прошлым прогоном
+        if old_key in self.journal.issues_mapping:
+            self._on_created(old_key)
+            return
+
+        parent_key = self.parent_child.get(old_key)
+        if parent_key and parent_key not in self._finished and parent_key != old_key:
+            self._waiting_children.setdefault(parent_key, []).append(issue)
+            return
+
+        self._spawn(self._create(issue, self.journal.issues_mapping.get(parent_key)))
+
+    def _release_children(self, parent_key: str) -> None:
+        """Запустить создание подзадач, ожидавших родителя."""
+        for child in self._waiting_children.pop(parent_key, []):
+            self._spawn(self._create(child, self.journal.issues_mapping.get(parent_key)))
+
+    async def _create(self, issue: IssueRecord, new_parent_key: Optional[str]) -> None:
+        """Создать задачу и запустить все, что ждало ее нового ключа."""
+        old_key = issue.key
+        _, new_key = await self.cloner.clone_issue(
+            issue,
+            self.target_queue,
+            self.journal.new_project_short_id,
+            new_parent_key,
+            self.journal.unique_token(old_key),
+        )
+        if new_key:
+            self.journal.issues_mapping[old_key] = new_key
+            await self.journal.checkpoint()
+        self._on_created(old_key)
+        self._report_progress()
+
+    def _on_created(self, old_key: str) -> None:
+        """Создание задачи завершено (успешно или нет)."""
+        self._finished.add(old_key)
+        self._release_children(old_key)
+
+        # Связи, которые ждали эту задачу
+        for link in self._waiting_links.pop(old_key, []):
+            self._spawn(self.cloner.restore_link(link, self.journal))
+
+        self._start_restore(old_key)
+
+    async def _fetch_details(self, issue_key: str, checklist: Optional[List[ChecklistItem]]) -> None:
+        """Получить чеклист, связи и комментарии задачи."""
+        old_key, checklist, links, comments = await self.cloner.fetch_issue_details(
+            issue_key, checklist
+        )
+        self.details[old_key] = (checklist, links, comments)
+        self._start_restore(old_key)
+        self._report_progress()
+
+    def _start_restore(self, old_key: str) -> None:
+        """Восстановить чеклист, комментарии и связи, когда есть ключ и детали."""
+        new_key = self.journal.issues_mapping.get(old_key)
+        if not new_key or old_key not in self.details or old_key in self._restored:
+            return
+        self._restored.add(old_key)
+
+        checklist, links, comments = self.details[old_key]
+        on_item = self.cloner.progress.advance
+        if checklist:
+            self._spawn(self.cloner.restore_issue_checklist(
+                old_key, new_key, checklist, self.journal, on_item
+            ))
+        if comments:
+            self._spawn(self.cloner.restore_issue_comments(
+                old_key, new_key, comments, self.journal, on_item
+            ))
+
+        for issue_link in links:
+            link = canonical_link(old_key, issue_link)
+            if not link or link in self._planned_links:
+                continue
+            self._planned_links.add(link)
+
+            other_key = link.target if link.source == old_key else link.source
+            if other_key in self._finished:
+                self._spawn(self.cloner.restore_link(link, self.journal))
+            else:
+                self._waiting_links.setdefault(other_key, []).append(link)
+
+    async def _add_linked_issues(self) -> None:
+        """Добавить связанные и родительские задачи, которых нет в проекте."""
+        issues = list(self.issues.values())
+        known = len(issues)
+        links = {key: details[1] for key, details in self.details.items()}
+
+        await self.cloner.ensure_all_linked_issues(issues, links, self.parent_child)
+
+        for issue in issues[known:]:
+            old_key = issue.key
+            # Как и в fetch_project_data: чеклисты и комментарии не запрашиваются
+            self.details[old_key] = ([], links.get(old_key, []), [])
+            self._add_issue(issue, fetch_details=False)
+
+    def _report_progress(self) -> None:
+        """Прогресс 5-95%: созданные задачи и полученные детали."""
+        total = len(self.issues)
+        self.cloner.progress.advance()
+        if total:
+            done = len(self._finished) + len(self.details)
+            self._set_progress(5 + done / (2 * total) * 90)
+
+    def _set_progress(self, value: float) -> None:
+        """Прогресс только растет (общее число задач становится известно по ходу)."""
+        if value >= self._progress:
+            self._progress = value
+            self.cloner.progress.set(value)
+
+
+async def clone_project_streaming(
+    cloner: ProjectCloner,
+    project_id: str,
+    new_project_name: str,
+    target_queue: str,
+    journal: Optional[CloneJournal] = None,
+) -> Tuple[CloneResult, ProjectData]:
+    """
+    Клонировать проект, создавая задачи по мере их получения.
+
+    В отличие от fetch_project_data + clone_project, задачи создаются,
+    пока загружаются следующие страницы, а чеклисты, комментарии и связи
+    восстанавливаются сразу после создания задач.
+
+    Args:
+        cloner: Клонер (клиент, лимит запросов, профиль загрузки)
+        project_id: ID исходного проекта
+        new_project_name: Название нового проекта
+        target_queue: Очередь для новых задач
+        journal: Журнал клонирования (для сохранения и продолжения прогресса)
+
+    Returns:
+        Кортеж (CloneResult, данные исходного проекта для снимка шаблона)
+    """
+    pipeline = StreamingClone(cloner, target_queue, journal or CloneJournal())
+    result = await pipeline.run(project_id, new_project_name)
+    return result, pipeline.project_data
@@ -0,0 +1,271 @@
+"""Оценка стоимости клонирования проекта без обращений к API."""
+
+import math
+import statistics
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .bulk_change import BULK_CHANGE_CHUNK_SIZE, BULK_MIN_ISSUES, BULK_POLL_INTERVAL
+from .link_planner import plan_links
+from .project_cloner import (
+    CREATE_BACKEND,
+    DEFAULT_MAX_CONCURRENCY,
+    IMPORT_BACKEND,
+    ProjectCloner,
+    ProjectData,
+)
+from .rate_limiter import TrackerRateLimiter
+from .reference_cache import users_pages
+from .user_directory import UserDirectory
+
+# Задержка запроса, если лимитер еще не измерил ни одного запроса (в секундах)
+DEFAULT_LATENCY = 0.3
+
+
+@dataclass
+class PhasePlan:
+    """
+    Запросы одного этапа клонирования.
+
+    Attributes:
+        name: Идентификатор этапа (users, project, issues, followers, checklists, links, comments)
+        calls: Количество запросов к API
+        waves: Размеры групп запросов, выполняемых параллельно (группы идут друг за другом);
+            пустой список - все запросы этапа параллельны
+        sequential: Запросы этапа выполняются строго по одному
+        chain: Самая длинная цепочка запросов, которые идут строго по порядку
+            (пункты чеклиста или комментарии одной задачи)
+        wait_seconds: Ожидание без запросов (опрос операций массового изменения)
+        shared: Запросы этапа выполняются один раз на весь пакет копий
+        seconds: Прогноз длительности этапа (заполняет estimate_duration)
+    """
+
+    name: str
+    calls: int
+    waves: List[int] = field(default_factory=list)
+    sequential: bool = False
+    chain: int = 0
+    wait_seconds: float = 0.0
+    shared: bool = False
+    seconds: float = 0.0
+
+
+@dataclass
+class ClonePlan:
+    """
+    План клонирования: запросы по этапам и прогноз длительности.
+
+    Attributes:
+        issues_count: Количество клонируемых задач
+        levels: Количество уровней иерархии (родитель задается при создании
+            задачи, отдельных запросов на обновление родителя нет)
+        phases: Этапы в порядке выполнения clone_project (запросы одной копии,
+            кроме общих для пакета этапов с shared)
+        copies: Количество копий (пакетное клонирование)
+        latency: Задержка запроса, использованная в прогнозе (сек)
+        rate: Лимит запросов в секунду, использованный в прогнозе
+        concurrency: Число одновременных запросов, использованное в прогнозе
+    """
+
+    issues_count: int
+    levels: int
+    phases: List[PhasePlan] = field(default_factory=list)
+    copies: int = 1
+    latency: float = DEFAULT_LATENCY
+    rate: float = 0.0
+    concurrency: int = 0
+
+    @property
+    def total_calls(self) -> int:
+        """Всего запросов к API (все копии)."""
+        return sum(
+            phase.calls if phase.shared else phase.calls * self.copies for phase in self.phases
+        )
+
+    @property
+    def total_seconds(self) -> float:
+        """Прогноз длительности клонирования (сек)."""
+        return sum(phase.seconds for phase in self.phases)
+
+    def phase(self, name: str) -> Optional[PhasePlan]:
+        """Этап по идентификатору."""
+        return next((phase for phase in self.phases if phase.name == name), None)
+
+
+def plan_clone(
+    project_data: ProjectData,
+    copies: int = 1,
+    bulk_chunk_size: int = BULK_CHANGE_CHUNK_SIZE,
+    backend: str = CREATE_BACKEND,
+    users: Optional[UserDirectory] = None,
+) -> ClonePlan:
+    """
+    Посчитать запросы clone_project для загруженных данных проекта.
+
+    Считается так же, как выполняет ProjectCloner: перед созданием проекта
+    загружается справочник пользователей (постранично, один раз на пакет
+    копий), задачи создаются по уровням иерархии, наблюдатели - операциями
+    массового изменения (одна операция на набор наблюдателей и
+    bulk_chunk_size задач плюс опрос статуса; набор меньше чем у
+    BULK_MIN_ISSUES задач - запрос на задачу), каждая связь создается один
+    раз, пункты чеклистов и комментарии - по одному запросу (по порядку
+    внутри задачи, задачи параллельно). Наблюдатели группируются после
+    замены уволенных пользователей справочником users - теми же наборами,
+    что отправляет клонер. При импорте (backend=import) наблюдатели
+    передаются вместе с задачей, запрос автора импорта (один) нужен только
+    задачам без автора в шаблоне.
+    Повторы после 429/5xx и попадания в кэш справочника в план не входят.
+
+    Args:
+        project_data: Данные исходного проекта
+        copies: Количество копий (clone_project_batch)
+        bulk_chunk_size: Максимум задач в одной операции массового изменения
+        backend: Способ создания задач (CLONE_BACKENDS)
+        users: Справочник пользователей клонера (None - наблюдатели без
+            замены, справочник на одну страницу)
+
+    Returns:
+        ClonePlan без прогноза длительности (см. estimate_duration)
+    """
+    issues = project_data.issues
+    issue_keys = {issue.key for issue in issues}
+    levels = ProjectCloner.group_issues_by_depth(issues, project_data.parent_child)
+
+    # Наблюдатели: задачи группируются по набору наблюдателей после замены
+    # уволенных, как в restore_followers и BulkChangeEngine
+    users = users or UserDirectory()
+    follower_sets = (users.resolve_many(issue.followers) for issue in issues if issue.followers)
+    follower_groups = Counter(
+        frozenset(str(follower_id) for follower_id in followers)
+        for followers in follower_sets
+        if followers
+    )
+    operations = sum(
+        math.ceil(count / bulk_chunk_size)
+        for count in follower_groups.values()
+        if count >= BULK_MIN_ISSUES
+    )
+    direct_updates = sum(count for count in follower_groups.values() if count < BULK_MIN_ISSUES)
+    # При импорте наблюдатели передаются с задачей; запрос владельца токена
+    # нужен, если у задачи нет автора или он уволен без замены
+    author_calls = 0
+    if backend == IMPORT_BACKEND:
+        operations = direct_updates = 0
+        author_calls = int(any(not users.resolve(issue.created_by) for issue in issues))
+
+    checklist_lanes = [
+        len(items) for key, items in project_data.checklists.items() if key in issue_keys
+    ]
+    links = [
+        link for link in plan_links(project_data.links)
+        if link.source in issue_keys and link.target in issue_keys
+    ]
+    comment_lanes = [
+        len(comment_list) for key, comment_list in project_data.comments.items() if key in issue_keys
+    ]
+
+    return ClonePlan(
+        issues_count=len(issues),
+        levels=len(levels),
+        copies=max(1, copies),
+        phases=[
+            # Справочник пользователей: общий кэш клонеров пакета
+            PhasePlan(
+                "users", users_pages(users.size or 0), sequential=True, shared=True
+            ),
+            PhasePlan("project", 1, sequential=True),
+            PhasePlan(
+                "issues",
+                author_calls + len(issues),
+                waves=[author_calls] * author_calls + [len(level) for level in levels],
+            ),
+            # Создание операции и как минимум один опрос ее статуса,
+            # малые группы - одновременно с созданием операций
+            PhasePlan(
+                "followers",
+                operations * 2 + direct_updates,
+                waves=[operations + direct_updates, operations] if operations else [direct_updates],
+                wait_seconds=BULK_POLL_INTERVAL if operations else 0.0,
+            ),
+            PhasePlan("checklists", sum(checklist_lanes), chain=max(checklist_lanes, default=0)),
+            PhasePlan("links", len(links)),
+            PhasePlan("comments", sum(comment_lanes), chain=max(comment_lanes, default=0)),
+        ],
+    )
+
+
+def estimate_duration(
+    plan: ClonePlan,
+    latency: float = DEFAULT_LATENCY,
+    rate: float = math.inf,
+    concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> ClonePlan:
+    """
+    Заполнить прогноз длительности этапов.
+
+    Группа из n параллельных запросов занимает не меньше ceil(n / concurrency)
+    задержек и не меньше n / rate секунд (бюджет токена организации);
+    последовательные запросы - n задержек, этап с цепочками - не меньше
+    самой длинной цепочки. Копии пакета идут одновременно и делят
+    concurrency и rate; общие этапы (shared) выполняются один раз.
+
+    Args:
+        plan: План клонирования
+        latency: Задержка одного запроса (сек)
+        rate: Лимит запросов в секунду
+        concurrency: Число одновременных запросов
+
+    Returns:
+        Тот же план с заполненными seconds
+    """
+    concurrency = max(1, concurrency)
+
+    def wave_seconds(calls: int, copies: int) -> float:
+        # Группа запросов всех копий
+        calls *= copies
+        if calls <= 0:
+            return 0.0
+        return max(math.ceil(calls / concurrency) * latency, calls / rate)
+
+    for phase in plan.phases:
+        copies = 1 if phase.shared else plan.copies
+        if phase.sequential:
+            # Каждая копия выполняет свою цепочку запросов
+            chains = math.ceil(copies / concurrency)
+            seconds = max(chains * phase.calls * latency, phase.calls * copies / rate)
+        else:
+            seconds = sum(wave_seconds(calls, copies) for calls in phase.waves or [phase.calls])
+            seconds = max(seconds, phase.chain * latency)
+        phase.seconds = seconds + phase.wait_seconds
+
+    plan.latency = latency
+    plan.rate = rate
+    plan.concurrency = concurrency
+    return plan
+
+
+def estimate_with_limiter(
+    plan: ClonePlan,
+    rate_limiter: TrackerRateLimiter,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> ClonePlan:
+    """
+    Прогноз длительности по текущему состоянию лимитера организации.
+
+    Используются медиана последних измеренных задержек, лимит token bucket
+    и текущий адаптивный лимит одновременных запросов (не больше
+    max_concurrency клонера).
+
+    Args:
+        plan: План клонирования
+        rate_limiter: Общий лимитер организации
+        max_concurrency: max_concurrency клонера
+
+    Returns:
+        Тот же план с заполненными seconds
+    """
+    latencies = list(rate_limiter.latencies)
+    latency = statistics.median(latencies) if latencies else DEFAULT_LATENCY
+    concurrency = min(max_concurrency, rate_limiter.concurrency.limit)
+    return estimate_duration(plan, latency, rate_limiter.bucket.rate, concurrency)
@@ -0,0 +1,187 @@
+"""Прогресс клонирования: счетчики клонера и фоновая выборка с ETA."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Интервал выборки прогресса по умолчанию (в секундах)
+PROGRESS_REPORT_INTERVAL = 1.0
+
+# Окно, по которому считаются скорость и ETA (в секундах)
+PROGRESS_RATE_WINDOW = 30.0
+
+
+class CloneProgress:
+    """
+    Счетчики прогресса клонирования.
+
+    Клонер только записывает значения (без await и обращений к UI), а
+    ProgressReporter в отдельной задаче читает их с заданным интервалом.
+    Прогресс пакета - среднее по прогрессам копий (add_part).
+    """
+
+    def __init__(self):
+        self._value = 0.0
+        self._items = 0
+        self._parts: List["CloneProgress"] = []
+
+    @property
+    def value(self) -> float:
+        """Прогресс (0-100)."""
+        if self._parts:
+            return sum(part.value for part in self._parts) / len(self._parts)
+        return self._value
+
+    @property
+    def items(self) -> int:
+        """Количество обработанных объектов (задач, пунктов, связей, комментариев)."""
+        return self._items + sum(part.items for part in self._parts)
+
+    def set(self, value: float) -> None:
+        """
+        Установить прогресс.
+
+        Args:
+            value: Значение прогресса (0-100)
+        """
+        self._value = value
+
+    def advance(self, value: Optional[float] = None) -> None:
+        """
+        Учесть обработанный объект.
+
+        Args:
+            value: Новое значение прогресса (0-100), если оно изменилось
+        """
+        self._items += 1
+        if value is not None:
+            self._value = value
+
+    def add_part(self, part: Optional["CloneProgress"] = None) -> "CloneProgress":
+        """
+        Добавить прогресс копии пакета.
+
+        Args:
+            part: Прогресс копии (None - создать новый)
+
+        Returns:
+            Прогресс копии
+        """
+        part = part or CloneProgress()
+        self._parts.append(part)
+        return part
+
+
+@dataclass
+class ProgressSnapshot:
+    """
+    Выборка прогресса.
+
+    Attributes:
+        progress: Прогресс (0-100, с учетом диапазона этапа)
+        items: Обработано объектов
+        items_per_second: Скорость обработки за последнее окно
+        eta_seconds: Оценка оставшегося времени (None - пока не оценить)
+    """
+
+    progress: float
+    items: int
+    items_per_second: float = 0.0
+    eta_seconds: Optional[float] = None
+
+
+# Callback выборки прогресса
+ProgressReportCallback = Callable[[ProgressSnapshot], Awaitable[None]]
+
+
+class ProgressReporter:
+    """
+    Фоновая задача, которая раз в interval читает CloneProgress и передает
+    выборку в callback.
+
+    Медленный callback (запись в БД, редактирование сообщения) задерживает
+    только следующую выборку, но не запросы клонирования. Скорость и ETA
+    считаются по выборкам за последние window секунд.
+
+    Пример:
+        async with ProgressReporter(cloner.progress, save, start=50, end=100):
+            await cloner.clone_project(...)
+    """
+
+    def __init__(
+        self,
+        progress: CloneProgress,
+        callback: ProgressReportCallback,
+        interval: float = PROGRESS_REPORT_INTERVAL,
+        window: float = PROGRESS_RATE_WINDOW,
+        start: float = 0.0,
+        end: float = 100.0,
+    ):
+        """
+        Args:
+            progress: Счетчики прогресса
+            callback: Получатель выборок
+            interval: Интервал выборки (сек)
+            window: Окно для скорости и ETA (сек)
+            start: Общий прогресс в начале этапа (прогресс этапа 0)
+            end: Общий прогресс в конце этапа (прогресс этапа 100)
+        """
+        self.progress = progress
+        self.callback = callback
+        self.interval = interval
+        self.window = window
+        self.start = start
+        self.end = end
+        self._samples: Deque[Tuple[float, float, int]] = deque()  # (время, прогресс, объекты)
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "ProgressReporter":
+        self.sample()  # Начальная точка окна: скорость известна уже к первой выборке
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # Итоговая выборка - чтобы последнее значение этапа не потерялось
+        await self.report()
+
+    def sample(self) -> ProgressSnapshot:
+        """Выборка прогресса со скоростью и ETA за последнее окно."""
+        now = time.monotonic()
+        value = self.start + self.progress.value * (self.end - self.start) / 100
+        items = self.progress.items
+
+        samples = self._samples
+        samples.append((now, value, items))
+        while len(samples) > 2 and now - samples[1][0] >= self.window:
+            samples.popleft()
+
+        snapshot = ProgressSnapshot(progress=value, items=items)
+        first_at, first_value, first_items = samples[0]
+        elapsed = now - first_at
+        if elapsed > 0:
+            snapshot.items_per_second = (items - first_items) / elapsed
+            progress_rate = (value - first_value) / elapsed
+            if progress_rate > 0:
+                snapshot.eta_seconds = (100 - value) / progress_rate
+        return snapshot
+
+    async def report(self) -> None:
+        """Передать выборку в callback (ошибка callback не прерывает клонирование)."""
+        try:
+            await self.callback(self.sample())
+        except Exception as e:
+            logger.warning(f"Progress report failed: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.report()
@@ -0,0 +1,242 @@
+"""Статистика клонирования по этапам: время, запросы, повторы, задержки и ошибки."""
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+import aiohttp
+
+from .rate_limiter import request_observer
+
+# Максимум ошибок отдельных пунктов, сохраняемых в статистике
+MAX_RECORDED_FAILURES = 500
+
+# Статистика текущего клонирования и текущий этап (видны всем задачам клонирования)
+_current_stats: ContextVar[Optional["CloneStats"]] = ContextVar("clone_stats", default=None)
+_current_phase: ContextVar[str] = ContextVar("clone_phase", default="other")
+
+
+def _percentile(values: List[float], share: float) -> Optional[float]:
+    """Перцентиль (ближайший ранг) или None для пустого списка."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(share * len(ordered)) - 1)]
+
+
+@dataclass
+class PhaseStats:
+    """
+    Статистика одного этапа клонирования.
+
+    Attributes:
+        name: Этап (fetch, project, issues, followers, checklists, links, comments, ...)
+        started_at: Начало первого участка этапа (time.monotonic)
+        finished_at: Конец последнего участка этапа (time.monotonic)
+        calls: Запросов к API (без повторов)
+        retries: Повторов запросов (429, 5xx, обрывы соединения)
+        failures: Пунктов, которые не удалось восстановить
+        latencies: Задержки всех попыток запросов (сек)
+    """
+
+    name: str
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    calls: int = 0
+    retries: int = 0
+    failures: int = 0
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def seconds(self) -> float:
+        """Время этапа: от начала первого до конца последнего участка."""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Сводка этапа для сохранения (без сырых задержек)."""
+        p50 = _percentile(self.latencies, 0.5)
+        p95 = _percentile(self.latencies, 0.95)
+        return {
+            "seconds": round(self.seconds, 3),
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "p50": round(p50, 4) if p50 is not None else None,
+            "p95": round(p95, 4) if p95 is not None else None,
+        }
+
+
+@dataclass
+class ItemFailure:
+    """
+    Пункт, который не удалось восстановить.
+
+    Attributes:
+        phase: Этап
+        issue_key: Ключ исходной задачи
+        status: HTTP статус ответа (None - ошибка без ответа сервера)
+        error: Текст ошибки
+    """
+
+    phase: str
+    issue_key: Optional[str]
+    status: Optional[int]
+    error: str
+
+
+@dataclass
+class CloneStats:
+    """
+    Статистика клонирования.
+
+    Запросы и повторы учитываются через наблюдатель TrackerRateLimiter, этап
+    берется из контекста (stats_phase), поэтому запросы параллельных задач
+    относятся к своим этапам.
+    """
+
+    phases: Dict[str, PhaseStats] = field(default_factory=dict)
+    failures: List[ItemFailure] = field(default_factory=list)
+    failures_count: int = 0
+
+    def get_phase(self, name: str) -> PhaseStats:
+        """Статистика этапа (создается при первом обращении)."""
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PhaseStats(name)
+        return phase
+
+    @property
+    def total_calls(self) -> int:
+        """Всего запросов к API."""
+        return sum(phase.calls for phase in self.phases.values())
+
+    @property
+    def total_retries(self) -> int:
+        """Всего повторов запросов."""
+        return sum(phase.retries for phase in self.phases.values())
+
+    @property
+    def total_seconds(self) -> float:
+        """Время от начала первого до конца последнего этапа."""
+        spans = [
+            (phase.started_at, phase.finished_at)
+            for phase in self.phases.values()
+            if phase.started_at is not None and phase.finished_at is not None
+        ]
+        if not spans:
+            return 0.0
+        return max(end for _, end in spans) - min(start for start, _ in spans)
+
+    def record_attempt(self, latency: float, retried: bool) -> None:
+        """
+        Учесть попытку запроса (наблюдатель TrackerRateLimiter).
+
+        Args:
+            latency: Задержка попытки (сек)
+            retried: Попытка не удалась и запрос будет повторен
+        """
+        phase = self.get_phase(_current_phase.get())
+        phase.latencies.append(latency)
+        if retried:
+            phase.retries += 1
+        else:
+            phase.calls += 1
+
+    def record_failure(self, phase: str, issue_key: Optional[str], error: Any) -> None:
+        """
+        Учесть пункт, который не удалось восстановить.
+
+        Args:
+            phase: Этап
+            issue_key: Ключ исходной задачи
+            error: Исключение или текст ошибки
+        """
+        self.get_phase(phase).failures += 1
+        self.failures_count += 1
+        if len(self.failures) >= MAX_RECORDED_FAILURES:
+            return
+
+        status = error.status if isinstance(error, aiohttp.ClientResponseError) else None
+        self.failures.append(ItemFailure(phase, issue_key, status, str(error)))
+
+    def merge(self, other: "CloneStats") -> None:
+        """
+        Добавить этапы и ошибки, собранные вне клонирования
+        (например, общую для пакета загрузку шаблона).
+
+        Args:
+            other: Статистика с этапами, которых нет в этой
+        """
+        self.phases.update(other.phases)
+        self.failures.extend(other.failures[:MAX_RECORDED_FAILURES - len(self.failures)])
+        self.failures_count += other.failures_count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Сводка по этапам для сохранения."""
+        return {name: phase.to_dict() for name, phase in self.phases.items()}
+
+    def failures_to_list(self) -> List[Dict[str, Any]]:
+        """Ошибки отдельных пунктов для сохранения."""
+        return [
+            {"phase": f.phase, "issue_key": f.issue_key, "status": f.status, "error": f.error}
+            for f in self.failures
+        ]
+
+
+@contextmanager
+def collect_stats(stats: CloneStats) -> Iterator[CloneStats]:
+    """
+    Собирать статистику запросов текущей задачи (и задач, созданных внутри).
+
+    Args:
+        stats: Статистика клонирования
+    """
+    stats_token = _current_stats.set(stats)
+    observer_token = request_observer.set(stats.record_attempt)
+    try:
+        yield stats
+    finally:
+        request_observer.reset(observer_token)
+        _current_stats.reset(stats_token)
+
+
+@contextmanager
+def stats_phase(name: str) -> Iterator[None]:
+    """
+    Отнести запросы и время участка кода к этапу.
+
+    Участки одного этапа могут идти параллельно (потоковое клонирование) -
+    время этапа считается от начала первого до конца последнего участка.
+
+    Args:
+        name: Этап
+    """
+    stats = _current_stats.get()
+    token = _current_phase.set(name)
+    phase = stats.get_phase(name) if stats else None
+    if phase and phase.started_at is None:
+        phase.started_at = time.monotonic()
+    try:
+        yield
+    finally:
+        _current_phase.reset(token)
+        if phase:
+            phase.finished_at = time.monotonic()
+
+
+def record_failure(issue_key: Optional[str], error: Any) -> None:
+    """
+    Учесть ошибку пункта в статистике текущего клонирования и текущем этапе.
+
+    Args:
+        issue_key: Ключ исходной задачи
+        error: Исключение или текст ошибки
+    """
+    stats = _current_stats.get()
+    if stats:
+        stats.record_failure(_current_phase.get(), issue_key, error)
@@ -0,0 +1,110 @@
+"""Создание задач через API импорта Yandex Tracker."""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from .tracker_client import TrackerClient
+
+logger = logging.getLogger(__name__)
+
+# Ответы, после которых импорт не используется до конца клонирования:
+# нет прав администратора (403) или API импорта недоступно (404, 405, 501)
+IMPORT_UNAVAILABLE_STATUSES = {403, 404, 405, 501}
+
+
+class ImportUnavailable(Exception):
+    """API импорта недоступно - задачи нужно создавать через issues.create."""
+
+
+class IssueImporter:
+    """
+    Создает задачи запросом POST /issues/_import.
+
+    В отличие от issues.create, импорт принимает наблюдателей вместе с
+    задачей, поэтому для импортированных задач не нужен этап массового
+    добавления наблюдателей. Импорт требует автора и время создания: они
+    переносятся из задачи шаблона, а если их нет (снимок без этих полей,
+    автор уволен и запасного нет) - автор владелец токена (GET /myself, один
+    раз), время - момент импорта.
+
+    Поле unique импорт не принимает: токен идемпотентности в запрос не
+    передается, и повтор импорта может создать дубликат. Поэтому запрос
+    импорта не повторяется после 5xx, а продолжение прерванного клонирования
+    создает оставшиеся задачи через issues.create с unique - задача,
+    импортированная перед обрывом связи, может остаться дубликатом только
+    если ответ на ее импорт потерян.
+
+    Импорт доступен только администраторам организации. Первый ответ из
+    IMPORT_UNAVAILABLE_STATUSES отключает импорт: import_issue бросает
+    ImportUnavailable, и клонер создает задачи обычным способом.
+    """
+
+    def __init__(self, tracker: TrackerClient):
+        """
+        Args:
+            tracker: Клиент Tracker
+        """
+        self.tracker = tracker
+        self.available = True
+        self._author: Optional[str] = None
+        self._author_lock = asyncio.Lock()
+
+    async def import_issue(
+        self,
+        payload: Dict[str, Any],
+        created_at: Optional[str] = None,
+        created_by: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Импортировать задачу.
+
+        Args:
+            payload: Поля задачи (как для issues.create, плюс followers; unique
+                не передается)
+            created_at: Время создания задачи шаблона (None - момент импорта)
+            created_by: Автор задачи шаблона (None - владелец токена)
+
+        Returns:
+            Созданная задача
+
+        Raises:
+            ImportUnavailable: Импорт недоступен (задачу нужно создать иначе)
+            aiohttp.ClientResponseError: Ошибка импорта этой задачи
+        """
+        if not self.available:
+            raise ImportUnavailable("API импорта недоступно")
+
+        try:
+            return await self.tracker.client.request(
+                "/issues/_import",
+                method="POST",
+                data={
+                    **{name: value for name, value in payload.items() if name != "unique"},
+                    "createdAt": created_at or self._now(),
+                    "createdBy": created_by or await self._get_author(),
+                },
+            )
+        except aiohttp.ClientResponseError as e:
+            if e.status not in IMPORT_UNAVAILABLE_STATUSES:
+                raise
+            if self.available:
+                logger.warning(f"Issue import is unavailable ({e.status}), falling back to issues.create")
+            self.available = False
+            raise ImportUnavailable(str(e)) from e
+
+    async def _get_author(self) -> str:
+        """Логин владельца токена (запрашивается один раз)."""
+        async with self._author_lock:
+            if self._author is None:
+                myself = await self.tracker.client.request("/myself")
+                self._author = myself.get("login") or str(myself.get("uid"))
+        return self._author
+
+    @staticmethod
+    def _now() -> str:
+        """Текущее время в формате дат Tracker."""
+        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
@@ -0,0 +1,111 @@
+"""Планирование восстановления связей между задачами."""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+from dataclasses import dataclass
+
+from .project_records import LinkRecord
+
+logger = logging.getLogger(__name__)
+
+# Тип связи Tracker -> (relationship со стороны outward, со стороны inward).
+# Сторона outward у depends - блокирующая задача: связь "A depends on B"
+# Tracker отдает у B с direction outward и у A с direction inward.
+# Других relationship issues.links.create не принимает.
+LINK_RELATIONSHIPS = {
+    "relates": ("relates", "relates"),
+    "depends": ("is dependent by", "depends on"),
+    "duplicates": ("duplicates", "is duplicated by"),
+    "subtask": ("is parent task for", "is subtask for"),
+    "epic": ("is epic of", "has epic"),
+}
+
+# Связи без направления (одна и та же с обеих сторон)
+SYMMETRIC_LINK_TYPES = {"relates"}
+
+# Иерархия восстанавливается через поле parent при создании задач
+HIERARCHY_LINK_TYPES = {"subtask"}
+
+# Неизвестные типы связей, о которых уже предупредили (предупреждение - одно на тип)
+_skipped_link_types: Set[str] = set()
+
+
+@dataclass(frozen=True)
+class PlannedLink:
+    """
+    Связь в каноническом виде: создается от source к target.
+
+    Attributes:
+        source: Ключ исходной задачи, от которой создается связь
+        relationship: Значение relationship для issues.links.create
+        target: Ключ исходной связываемой задачи
+    """
+
+    source: str
+    relationship: str
+    target: str
+
+    @property
+    def key(self) -> str:
+        """Ключ связи в журнале клонирования."""
+        return f"{self.source}:{self.relationship}:{self.target}"
+
+
+def canonical_link(issue_key: str, link: LinkRecord) -> Optional[PlannedLink]:
+    """
+    Привести связь из ответа API к каноническому виду.
+
+    Tracker возвращает одну и ту же связь у обеих задач (outward у одной,
+    inward у другой). Каноническая форма всегда создается со стороны
+    outward, а для связей без направления - от меньшего ключа к большему,
+    поэтому обе стороны дают одинаковый PlannedLink.
+
+    Args:
+        issue_key: Ключ задачи, у которой получена связь
+        link: Связь задачи (разобранный ответ API)
+
+    Returns:
+        PlannedLink или None, если связь не нужно (или нельзя) восстанавливать
+    """
+    linked_key = link.linked_key
+    if not linked_key or linked_key == issue_key:
+        return None
+
+    type_id = link.type_id
+    if type_id in HIERARCHY_LINK_TYPES:
+        return None
+
+    if type_id in SYMMETRIC_LINK_TYPES:
+        source, target = sorted((issue_key, linked_key))
+        return PlannedLink(source, LINK_RELATIONSHIPS[type_id][0], target)
+
+    if type_id not in LINK_RELATIONSHIPS:
+        # issues.links.create отклонит такой relationship - не создаем связь вовсе
+        if type_id not in _skipped_link_types:
+            _skipped_link_types.add(type_id)
+            logger.warning(f"Link type {type_id!r} is not supported, such links are not cloned")
+        return None
+
+    outward_relationship = LINK_RELATIONSHIPS[type_id][0]
+    if link.direction == "inward":
+        return PlannedLink(linked_key, outward_relationship, issue_key)
+    return PlannedLink(issue_key, outward_relationship, linked_key)
+
+
+def plan_links(links: Dict[str, Iterable[LinkRecord]]) -> List[PlannedLink]:
+    """
+    Составить список уникальных связей для восстановления.
+
+    Args:
+        links: Словарь связей {issue_key: [links]}
+
+    Returns:
+        Уникальные связи в порядке первого появления
+    """
+    planned: Dict[PlannedLink, None] = {}
+    for issue_key, link_list in links.items():
+        for link in link_list:
+            planned_link = canonical_link(issue_key, link)
+            if planned_link:
+                planned.setdefault(planned_link, None)
+    return list(planned)
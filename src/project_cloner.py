@@ -1,21 +1,242 @@
 """Модуль для копирования проектов из Yandex Tracker."""
 
 import asyncio
-from typing import Optional, Callable, Dict, List, Any
+import json
+import zlib
+from typing import Optional, Callable, Dict, List, Any, AsyncIterator, Awaitable, Iterable, Set, Tuple, TypeVar
 from dataclasses import dataclass, field
+import aiohttp
 from YaTrackerApi import YandexTrackerClient
 
+from .bulk_change import BulkChangeEngine
+from .clone_journal import CloneJournal
+from .clone_progress import CloneProgress
+from .clone_stats import CloneStats, collect_stats, record_failure, stats_phase
+from .issue_import import ImportUnavailable, IssueImporter
+from .link_planner import PlannedLink, plan_links
+from .rate_limiter import is_transient_error
+from .reference_cache import TrackerReferenceData
+from .user_directory import UserDirectory, load_user_directory
+from .project_records import (
+    ChecklistItem,
+    IssueRecord,
+    LinkRecord,
+    checklist_from_api,
+    comments_from_api,
+    links_from_api,
+)
+
+T = TypeVar("T")
+
+# Максимальное количество одновременных запросов к API по умолчанию
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Размер страницы поиска задач проекта
+ISSUES_PAGE_SIZE = 100
+
+# Сколько ключей задач запрашивается одним поиском (не больше страницы поиска)
+LINKED_ISSUES_BATCH_SIZE = 50
+
+# Глубина поиска связанных задач вне проекта по умолчанию
+# (1 - только задачи, на которые ссылаются задачи проекта)
+DEFAULT_LINKED_ISSUES_DEPTH = 1
+
+# Поля задачи, которые читает клонирование (_build_issue_payload, наблюдатели,
+# иерархия, время создания и автор для импорта) и отпечаток снимка шаблона
+ISSUE_CLONE_FIELDS = (
+    "key",
+    "summary",
+    "description",
+    "type",
+    "priority",
+    "assignee",
+    "tags",
+    "deadline",
+    "estimation",
+    "followers",
+    "parent",
+    "createdAt",
+    "createdBy",
+    "updatedAt",
+    "checklistItems",
+)
+
+# Поля задачи, по которым видно, что у нее есть чеклист
+CHECKLIST_INDICATOR_FIELDS = ("checklistTotal", "checklistDone")
+
+# Версия формата снимка шаблона (ProjectData.to_snapshot)
+SNAPSHOT_FORMAT = 3
+
+# Ответы на создание связи, когда такая связь между задачами уже есть
+LINK_EXISTS_STATUSES = {409, 422}
+
+
+@dataclass(frozen=True)
+class CloneProfile:
+    """
+    Профиль загрузки задач шаблона.
+
+    Attributes:
+        name: Название профиля (входит в отпечаток снимка шаблона)
+        fields: Запрашиваемые поля задач (None - все поля)
+        expand: Дополнительные разделы ответа (transitions, attachments)
+        embedded_checklists: Брать чеклисты из ответа поиска задач
+            (иначе - отдельный запрос чеклиста для каждой задачи)
+    """
+
+    name: str
+    fields: Optional[Tuple[str, ...]] = None
+    expand: Tuple[str, ...] = ()
+    embedded_checklists: bool = True
+
+    def search_params(self) -> Dict[str, str]:
+        """
+        Параметры запроса поиска задач для профиля.
+
+        Returns:
+            Словарь query-параметров (fields, expand)
+        """
+        params = {}
+        if self.fields:
+            params["fields"] = ",".join(self.fields)
+        if self.expand:
+            params["expand"] = ",".join(self.expand)
+        return params
+
+
+# Только поля, нужные для клонирования
+MINIMAL_CLONE_PROFILE = CloneProfile("minimal", fields=ISSUE_CLONE_FIELDS)
+
+# Все поля задач с переходами и вложениями (прежнее поведение)
+FULL_CLONE_PROFILE = CloneProfile("full", expand=("transitions", "attachments"))
+
+CLONE_PROFILES = {
+    profile.name: profile for profile in (MINIMAL_CLONE_PROFILE, FULL_CLONE_PROFILE)
+}
+
+
+def get_clone_profile(name: Optional[str]) -> CloneProfile:
+    """
+    Найти профиль загрузки по названию.
+
+    Args:
+        name: Название профиля (None или пустая строка - minimal)
+
+    Returns:
+        CloneProfile
+    """
+    if not name:
+        return MINIMAL_CLONE_PROFILE
+    try:
+        return CLONE_PROFILES[name.lower()]
+    except KeyError:
+        raise ValueError(f"Неизвестный профиль клонирования: {name}") from None
+
+
+# Способы создания задач: create - issues.create, import - API импорта
+# (с откатом на create, если импорт недоступен)
+CREATE_BACKEND = "create"
+IMPORT_BACKEND = "import"
+CLONE_BACKENDS = (CREATE_BACKEND, IMPORT_BACKEND)
+
+
+def get_clone_backend(name: Optional[str]) -> str:
+    """
+    Проверить способ создания задач.
+
+    Args:
+        name: Название способа (None или пустая строка - create)
+
+    Returns:
+        Название способа
+    """
+    if not name:
+        return CREATE_BACKEND
+    if name.lower() not in CLONE_BACKENDS:
+        raise ValueError(f"Неизвестный способ создания задач: {name}")
+    return name.lower()
+
+
+def _is_not_found(error: BaseException) -> bool:
+    """Ответ 404: подресурса у задачи нет, это не ошибка клонирования."""
+    return isinstance(error, aiohttp.ClientResponseError) and error.status == 404
+
+
+# Задача из ответа поиска: запись и пункты чеклиста из ответа (None - нужен запрос)
+ParsedIssue = Tuple[IssueRecord, Optional[List[ChecklistItem]]]
+
+
 @dataclass
 class ProjectData:
-    """Данные проекта для клонирования."""
+    """
+    Данные проекта для клонирования.
+
+    Задачи, пункты чеклистов и связи хранятся компактными записями
+    (src/project_records.py), комментарии - только текстом: сырые ответы
+    API отбрасываются сразу при разборе.
+    """
 
     project: Dict[str, Any]
-    issues: List[Dict[str, Any]] = field(default_factory=list)
-    checklists: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
-    links: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
-    comments: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    issues: List[IssueRecord] = field(default_factory=list)
+    checklists: Dict[str, List[ChecklistItem]] = field(default_factory=dict)
+    links: Dict[str, List[LinkRecord]] = field(default_factory=dict)
+    comments: Dict[str, List[str]] = field(default_factory=dict)
     parent_child: Dict[str, str] = field(default_factory=dict)  # {child_key: parent_key}
 
+    def to_snapshot(self) -> bytes:
+        """
+        Сериализовать данные проекта в сжатый JSON (записи - строками значений).
+
+        Returns:
+            Сжатые zlib байты JSON
+        """
+        payload = {
+            "format": SNAPSHOT_FORMAT,
+            "project": self.project,
+            "issues": [issue.to_row() for issue in self.issues],
+            "checklists": {
+                key: [item.to_row() for item in items] for key, items in self.checklists.items()
+            },
+            "links": {
+                key: [link.to_row() for link in link_list] for key, link_list in self.links.items()
+            },
+            "comments": self.comments,
+            "parent_child": self.parent_child,
+        }
+        raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return zlib.compress(raw.encode("utf-8"))
+
+    @classmethod
+    def from_snapshot(cls, payload: bytes) -> "ProjectData":
+        """
+        Восстановить данные проекта из сжатого JSON.
+
+        Args:
+            payload: Байты, полученные из to_snapshot()
+
+        Returns:
+            ProjectData
+
+        Raises:
+            ValueError: Снимок сохранен в другом формате
+        """
+        data = json.loads(zlib.decompress(payload).decode("utf-8"))
+        if data.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Формат снимка шаблона {data.get('format')} не поддерживается")
+
+        return cls(
+            project=data["project"],
+            issues=[IssueRecord.from_row(row) for row in data["issues"]],
+            checklists={
+                key: [ChecklistItem(*row) for row in rows] for key, rows in data["checklists"].items()
+            },
+            links={
+                key: [LinkRecord(*row) for row in rows] for key, rows in data["links"].items()
+            },
+            comments=data["comments"],
+            parent_child=data["parent_child"],
+        )
+
 @dataclass
 class CloneResult:
     """Результат клонирования проекта."""
@@ -26,42 +247,87 @@ class CloneResult:
     new_project_name: Optional[str] = None
     new_issues_mapping: Dict[str, str] = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
+    stats: CloneStats = field(default_factory=CloneStats)
 
 
-class ProjectCloner:
-    """Класс для клонирования проектов Yandex Tracker с поддержкой прогресса."""
+@dataclass
+class CloneTarget:
+    """Новый проект пакетного клонирования."""
 
-    def __init__(self, tracker_client: YandexTrackerClient):
-        """
-        Инициализация клонера проектов.
+    new_project_name: str
+    target_queue: str
+    journal: Optional[CloneJournal] = None
+    progress: Optional[CloneProgress] = None  # счетчики прогресса этой копии
 
-        Args:
-            tracker_client: Экземпляр TrackerClient
-        """
-        self.tracker = tracker_client
-        self._progress_callback: Optional[Callable[[float], None]] = None
 
-    def set_progress_callback(self, callback: Callable[[float], None]) -> None:
+class ProjectCloner:
+    """
+    Класс для клонирования проектов Yandex Tracker с поддержкой прогресса.
+
+    Кроме clone_project и clone_project_batch, клонер предоставляет шаги
+    клонирования, из которых потоковый режим (src/clone_pipeline.py) и
+    планировщик (src/clone_planner.py) собирают свой порядок выполнения.
+    Все шаги идут через лимит запросов клонера и пишут прогресс в журнал:
+
+        prepare_copy - справочник пользователей и новый проект
+        load_users - справочник пользователей (self.users)
+        create_project_copy - создание проекта
+        parse_issue - запись задачи и чеклист из ответа поиска
+        fetch_issue_details - чеклист, связи и комментарии задачи
+        ensure_all_linked_issues - задачи вне проекта, на которые ссылаются задачи
+        group_issues_by_depth - уровни иерархии задач
+        clone_issue - создание копии одной задачи
+        restore_followers - наблюдатели созданных задач
+        restore_issue_checklist, restore_issue_comments - пункты одной задачи
+        restore_link - одна связь
+        check_unfinished - итог по невосстановленным пунктам
+    """
+
+    def __init__(
+        self,
+        tracker_client: YandexTrackerClient,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        linked_issues_depth: int = DEFAULT_LINKED_ISSUES_DEPTH,
+        profile: CloneProfile = MINIMAL_CLONE_PROFILE,
+        backend: str = CREATE_BACKEND,
+        fallback_user: Optional[str] = None,
+        reference_data: Optional[TrackerReferenceData] = None,
+    ):
         """
-        Установить callback для обновления прогресса.
+        Инициализация клонера проектов.
 
         Args:
-            callback: Функция принимающая значение прогресса (0-100)
-        """
-        self._progress_callback = callback
-
-    async def _update_progress(self, value: float) -> None:
+            tracker_client: Экземпляр TrackerClient
+            max_concurrency: Максимальное количество одновременных запросов к API
+            linked_issues_depth: Глубина поиска связанных задач вне проекта
+            profile: Профиль загрузки задач (какие поля запрашивать)
+            backend: Способ создания задач (CLONE_BACKENDS)
+            fallback_user: Логин или ID пользователя вместо уволенных и неизвестных
+            reference_data: Справочные данные Tracker (если None - свой кэш клонера)
         """
-        Обновить прогресс выполнения.
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency должен быть положительным числом")
+        if linked_issues_depth < 0:
+            raise ValueError("linked_issues_depth не может быть отрицательным")
 
-        Args:
-            value: Значение прогресса (0-100)
-        """
-        if self._progress_callback:
-            if asyncio.iscoroutinefunction(self._progress_callback):
-                await self._progress_callback(value)
-            else:
-                self._progress_callback(value)
+        self.tracker = tracker_client
+        self.max_concurrency = max_concurrency
+        self.linked_issues_depth = linked_issues_depth
+        self.profile = profile
+        self.backend = get_clone_backend(backend)
+        self.fallback_user = fallback_user
+        self.reference_data = reference_data or TrackerReferenceData(tracker_client)
+        # Справочник пользователей: загружается в начале клонирования (load_users)
+        self.users = UserDirectory()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._importer = IssueImporter(tracker_client) if self.backend == IMPORT_BACKEND else None
+        # Задачи, импортированные вместе с наблюдателями (этап наблюдателей их пропускает)
+        self._followers_imported: Set[str] = set()
+        # Продолжение прерванного клонирования: задачи создаются только через
+        # issues.create с unique (импорт его не принимает)
+        self._resuming = False
+        # Счетчики прогресса: клонер только записывает их, отображение - ProgressReporter
+        self.progress = CloneProgress()
 
     async def fetch_project_data(self, project_id: str) -> ProjectData:
         """
@@ -73,35 +339,41 @@ class ProjectCloner:
         Returns:
             ProjectData с полными данными проекта
         """
-        await self._update_progress(0)
+        self.progress.set(0)
 
         # 1. Получить проект со всеми полями (5%)
-        project = await self.tracker.client.entities.get(
-            entity_id=project_id,
-            entity_type="project",
-            fields="summary,description,lead,teamUsers,teamAccess,parentEntity"
-        )
-        await self._update_progress(5)
-
-        # 2. Получить все задачи проекта рекурсивно (35%)
-        issues, parent_child = await self._fetch_project_issues_recursive(project_id)
-        await self._update_progress(40)
-
-        # 3. Получить чеклисты для всех задач (15%)
-        checklists = await self._fetch_all_checklists(issues)
-        await self._update_progress(55)
+        with stats_phase("fetch"):
+            project = await self.fetch_project(project_id)
+        self.progress.set(5)
+
+        # 2. Получить все задачи проекта постранично (35%)
+        # Чеклисты, связи и комментарии запрашиваются сразу по мере прихода страниц
+        detail_tasks: List[asyncio.Task] = []
+
+        def start_details(page: List[ParsedIssue]) -> None:
+            detail_tasks.extend(
+                asyncio.create_task(self.fetch_issue_details(issue.key, checklist))
+                for issue, checklist in page
+            )
 
-        # 4. Получить связи для всех задач (20%)
-        links = await self._fetch_all_links(issues)
-        await self._update_progress(75)
+        try:
+            with stats_phase("fetch"):
+                issues, parent_child = await self._fetch_project_issues_recursive(
+                    project_id, on_page=start_details
+                )
+            self.progress.set(40)
 
-        # 5. Получить комментарии для всех задач (15%)
-        comments = await self._fetch_all_comments(issues)
-        await self._update_progress(90)
+            # 3. Дождаться чеклистов, связей и комментариев всех задач (50%)
+            checklists, links, comments = await self._fetch_issues_details(detail_tasks)
+            self.progress.set(90)
+        finally:
+            for task in detail_tasks:
+                task.cancel()
 
-        # 6. Проверить и дополнить недостающие связанные задачи (10%)
-        await self._ensure_all_linked_issues(issues, links, parent_child)
-        await self._update_progress(100)
+        # 4. Проверить и дополнить недостающие связанные задачи (10%)
+        with stats_phase("linked"):
+            await self.ensure_all_linked_issues(issues, links, parent_child)
+        self.progress.set(100)
 
         return ProjectData(
             project=project,
@@ -112,243 +384,586 @@ class ProjectCloner:
             parent_child=parent_child
         )
 
+    async def fetch_project(self, project_id: str) -> Dict[str, Any]:
+        """
+        Получить проект со всеми полями, нужными для клонирования.
+
+        Args:
+            project_id: ID проекта
+
+        Returns:
+            Данные проекта
+        """
+        return await self.tracker.client.entities.get(
+            entity_id=project_id,
+            entity_type="project",
+            fields="summary,description,lead,teamUsers,teamAccess,parentEntity"
+        )
+
+    async def fetch_project_fingerprint(self, project_id: str) -> str:
+        """
+        Получить дешевый отпечаток состояния задач проекта.
+
+        Отпечаток меняется при добавлении, удалении и любом изменении задачи
+        (включая комментарии и чеклисты, которые обновляют updatedAt задачи).
+
+        Args:
+            project_id: ID проекта
+
+        Returns:
+            Строка вида "<количество задач>:<максимальный updatedAt>:<профиль>"
+        """
+        count, latest = await asyncio.gather(
+            self._limited(self.tracker.client.issues.count(filter={"project": project_id})),
+            self._limited(self.tracker.client.issues.search(
+                filter={"project": project_id},
+                order="-updatedAt",
+                per_page=1,
+            )),
+        )
+        latest_updated_at = latest[0].get("updatedAt", "") if latest else ""
+        # Снимок, загруженный с другим набором полей, не подходит
+        return f"{count}:{latest_updated_at}:{self.profile.name}"
+
+    async def iter_project_issues(
+        self, project_id: str, page_size: int = ISSUES_PAGE_SIZE
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Постранично перебрать задачи проекта.
+
+        Страницы отдаются по мере получения, поэтому обработка может начаться
+        с первой страницы, а в памяти одновременно держится один ответ API.
+
+        Args:
+            project_id: ID проекта
+            page_size: Количество задач на странице
+
+        Yields:
+            Страница задач (список словарей)
+        """
+        page = 1
+        while True:
+            batch = await self._search_issues(
+                {"filter": {"project": project_id}, "order": "+createdAt"},
+                per_page=page_size,
+                page=page,
+            )
+            if not isinstance(batch, list) or not batch:
+                return
+
+            yield batch
+
+            if len(batch) < page_size:
+                return
+            page += 1
+
+    async def _search_issues(
+        self, payload: Dict[str, Any], per_page: int, page: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Одна страница поиска задач с полями профиля загрузки.
+
+        issues.search не передает номер страницы и список полей,
+        поэтому запрос выполняется напрямую.
+
+        Args:
+            payload: Тело запроса (filter/keys/order)
+            per_page: Количество задач на странице
+            page: Номер страницы
+
+        Returns:
+            Список задач
+        """
+        params = {"perPage": per_page, "page": page, **self.profile.search_params()}
+        return await self._limited(self.tracker.client.request(
+            "/issues/_search", method="POST", data=payload, params=params
+        ))
+
     async def _fetch_project_issues_recursive(
-        self, project_id: str
-    ) -> tuple[List[Dict[str, Any]], Dict[str, str]]:
+        self,
+        project_id: str,
+        on_page: Optional[Callable[[List[ParsedIssue]], None]] = None,
+    ) -> tuple[List[IssueRecord], Dict[str, str]]:
         """
         Получить все задачи проекта включая подзадачи.
 
+        Задачи разбираются в IssueRecord сразу по получении страницы.
+
         Args:
             project_id: ID проекта
+            on_page: Вызывается с новыми задачами каждой полученной страницы
+                (задача и пункты чеклиста из ответа поиска)
 
         Returns:
             Кортеж (список всех задач, словарь parent_child связей)
         """
-        # Получить ВСЕ задачи проекта за один запрос
-        all_issues_raw = await self.tracker.client.issues.search(
-            filter={"project": project_id},
-            expand=["transitions", "attachments"]
-        )
-
         # Дедупликация по ключу задачи
         seen_keys = set()
         all_issues = []
         parent_child = {}
+        pages = 0
 
-        for issue in all_issues_raw:
-            issue_key = issue.get("key")
+        async for page in self.iter_project_issues(project_id):
+            page_issues = []
+            for raw_issue in page:
+                # Пропускаем дубликаты (задача могла сдвинуться между страницами)
+                if raw_issue.get("key") in seen_keys:
+                    continue
 
-            # Пропускаем дубликаты
-            if issue_key in seen_keys:
-                continue
+                issue, checklist = self.parse_issue(raw_issue)
+                seen_keys.add(issue.key)
+                page_issues.append((issue, checklist))
 
-            seen_keys.add(issue_key)
-            all_issues.append(issue)
+                # Построить parent_child маппинг
+                if issue.parent:
+                    parent_child[issue.key] = issue.parent
 
-            # Построить parent_child маппинг
-            parent = issue.get("parent")
-            if parent and isinstance(parent, dict):
-                parent_key = parent.get("key")
-                if parent_key:
-                    parent_child[issue_key] = parent_key
+            all_issues.extend(issue for issue, _ in page_issues)
+            if on_page:
+                on_page(page_issues)
+
+            # Общее число задач заранее неизвестно - прогресс приближается к 40%
+            pages += 1
+            self.progress.set(40 - 35 / (pages + 1))
 
         return all_issues, parent_child
 
-    async def _ensure_all_linked_issues(
+    async def ensure_all_linked_issues(
         self,
-        issues: List[Dict[str, Any]],
-        links: Dict[str, List[Dict[str, Any]]],
+        issues: List[IssueRecord],
+        links: Dict[str, List[LinkRecord]],
         parent_child: Dict[str, str]
     ) -> None:
         """
         Проверить что все связанные задачи включены в список.
         Добавить недостающие если они есть.
 
+        Недостающие связанные задачи запрашиваются пачками через поиск по
+        ключам. Первый уровень - только цели связей: родитель задачи проекта
+        вне проекта не клонируется (задача становится корневой). Для найденных
+        задач на следующем уровне запрашиваются их родители и связи, пока не
+        достигнута глубина linked_issues_depth.
+
         Args:
             issues: Список задач
             links: Словарь связей
             parent_child: Словарь parent-child связей
         """
-        issue_keys = {issue.get("key") for issue in issues}
+        issue_keys = {issue.key for issue in issues}
+        missing = self._collect_missing_keys(links.values(), (), issue_keys)
+
+        for depth in range(1, self.linked_issues_depth + 1):
+            if not missing:
+                break
+
+            found = await self._fetch_issues_by_keys(sorted(missing))
+            # Недоступные задачи больше не запрашиваем
+            issue_keys.update(missing)
+
+            new_parents = []
+            for linked_issue in found:
+                issues.append(linked_issue)
+                if linked_issue.parent:
+                    parent_child[linked_issue.key] = linked_issue.parent
+                    new_parents.append(linked_issue.parent)
+
+            # На последнем уровне связи найденных задач уже не нужны
+            new_links = []
+            if depth < self.linked_issues_depth:
+                new_links = await self._fetch_links([issue.key for issue in found], links)
+
+            missing = self._collect_missing_keys(new_links, new_parents, issue_keys)
+
+    @staticmethod
+    def _collect_missing_keys(
+        link_lists: Iterable[List[LinkRecord]],
+        parent_keys: Iterable[str],
+        known_keys: Set[str],
+    ) -> Set[str]:
+        """
+        Собрать ключи связанных и родительских задач, которых нет в списке.
 
-        for issue_key, link_list in links.items():
+        Args:
+            link_lists: Списки связей задач
+            parent_keys: Ключи родительских задач
+            known_keys: Ключи уже известных задач
+
+        Returns:
+            Множество недостающих ключей
+        """
+        missing = {key for key in parent_keys if key and key not in known_keys}
+        for link_list in link_lists:
             for link in link_list:
-                linked_key = link.get("object", {}).get("key")
+                if link.linked_key not in known_keys:
+                    missing.add(link.linked_key)
+        return missing
 
-                # Если связанная задача отсутствует - попробовать добавить
-                if linked_key and linked_key not in issue_keys:
-                    try:
-                        linked_issue = await self.tracker.client.issues.get(linked_key)
-                        issues.append(linked_issue)
-                        issue_keys.add(linked_key)
+    async def _fetch_issues_by_keys(self, keys: List[str]) -> List[IssueRecord]:
+        """
+        Получить задачи по ключам пачками по LINKED_ISSUES_BATCH_SIZE.
 
-                        # Проверить parent связь
-                        parent_key = linked_issue.get("parent", {}).get("key")
-                        if parent_key:
-                            parent_child[linked_key] = parent_key
-                    except Exception:
-                        pass  # Пропускаем недоступные задачи
+        Args:
+            keys: Ключи задач
 
-    async def _fetch_all_checklists(
-        self, issues: List[Dict[str, Any]]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        Returns:
+            Найденные задачи (недоступные пропускаются)
         """
-        Получить чеклисты для всех задач.
+        batches = [
+            keys[i:i + LINKED_ISSUES_BATCH_SIZE]
+            for i in range(0, len(keys), LINKED_ISSUES_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._search_issues({"keys": batch}, per_page=LINKED_ISSUES_BATCH_SIZE)
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
+
+        found = []
+        for batch_result in results:
+            # Пропускаем недоступные задачи
+            if isinstance(batch_result, BaseException) or not isinstance(batch_result, list):
+                continue
+            found.extend(IssueRecord.from_api(issue) for issue in batch_result if issue.get("key"))
+        return found
+
+    async def _fetch_links(
+        self, issue_keys: List[str], links: Dict[str, List[LinkRecord]]
+    ) -> List[List[LinkRecord]]:
+        """
+        Получить связи задач и добавить их в словарь связей.
 
         Args:
-            issues: Список задач
+            issue_keys: Ключи задач
+            links: Словарь связей {issue_key: [links]}
 
         Returns:
-            Словарь {issue_key: [checklist_items]}
+            Полученные списки связей
+        """
+        results = await asyncio.gather(
+            *(
+                self._limited(self.tracker.client.issues.links.get(issue_id=key))
+                for key in issue_keys
+            ),
+            return_exceptions=True,
+        )
+
+        fetched = []
+        for issue_key, issue_links in zip(issue_keys, results):
+            if isinstance(issue_links, BaseException) or not isinstance(issue_links, list):
+                continue
+            links[issue_key] = links_from_api(issue_links)
+            fetched.append(links[issue_key])
+        return fetched
+
+    async def _fetch_issues_details(
+        self, tasks: List[asyncio.Task]
+    ) -> tuple[
+        Dict[str, List[ChecklistItem]],
+        Dict[str, List[LinkRecord]],
+        Dict[str, List[str]],
+    ]:
+        """
+        Собрать чеклисты, связи и комментарии задач из запущенных запросов.
+
+        Три подресурса одной задачи запрашиваются вместе, а общее число
+        одновременных запросов к API ограничено семафором.
+
+        Args:
+            tasks: Задачи fetch_issue_details (по одной на задачу Tracker)
+
+        Returns:
+            Кортеж словарей (checklists, links, comments) вида {issue_key: [items]}
         """
         checklists = {}
-        total = len(issues)
+        links = {}
+        comments = {}
+        total = len(tasks)
 
-        for idx, issue in enumerate(issues):
-            issue_key = issue.get("key")
-            try:
-                checklist_items = await self.tracker.client.issues.checklists.get(
-                    issue_id=issue_key
-                )
-                checklists[issue_key] = checklist_items
-            except Exception as e:
-                # Если чеклиста нет - продолжаем
-                checklists[issue_key] = []
+        for idx, task in enumerate(asyncio.as_completed(tasks)):
+            issue_key, issue_checklists, issue_links, issue_comments = await task
+            checklists[issue_key] = issue_checklists
+            links[issue_key] = issue_links
+            comments[issue_key] = issue_comments
 
             # Промежуточное обновление прогресса
             if total > 0:
-                progress = 40 + (idx + 1) / total * 20
-                await self._update_progress(progress)
+                self.progress.advance(40 + (idx + 1) / total * 50)
 
-        return checklists
+        return checklists, links, comments
 
-    async def _fetch_all_links(
-        self, issues: List[Dict[str, Any]]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    async def fetch_issue_details(
+        self, issue_key: str, issue_checklists: Optional[List[ChecklistItem]]
+    ) -> tuple[str, List[ChecklistItem], List[LinkRecord], List[str]]:
         """
-        Получить связи для всех задач.
+        Получить чеклист, связи и комментарии одной задачи.
+
+        Чеклист берется из ответа поиска задач (parse_issue), а отдельный
+        запрос делается, только если по ответу нельзя понять, что в чеклисте.
 
         Args:
-            issues: Список задач
+            issue_key: Ключ задачи
+            issue_checklists: Пункты чеклиста из ответа поиска (None - запросить)
 
         Returns:
-            Словарь {issue_key: [links]}
+            Кортеж (issue_key, checklist_items, links, comments)
         """
-        links = {}
-        total = len(issues)
+        requests = [
+            self._limited(self.tracker.client.issues.links.get(issue_id=issue_key)),
+            self._limited(self.tracker.client.issues.comments.get(issue_id=issue_key)),
+        ]
+        if issue_checklists is None:
+            requests.append(
+                self._limited(self.tracker.client.issues.checklists.get(issue_id=issue_key))
+            )
 
-        for idx, issue in enumerate(issues):
-            issue_key = issue.get("key")
-            try:
-                issue_links = await self.tracker.client.issues.links.get(
-                    issue_id=issue_key
-                )
-                links[issue_key] = issue_links
-            except Exception:
-                links[issue_key] = []
+        with stats_phase("details"):
+            results = await asyncio.gather(*requests, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception) and not _is_not_found(result):
+                    record_failure(issue_key, result)
+
+        # Если подресурса нет или запрос упал - продолжаем с пустым списком
+        issue_links, issue_comments = results[0], results[1]
+        if issue_checklists is None:
+            fetched_checklist = results[2]
+            issue_checklists = (
+                [] if isinstance(fetched_checklist, BaseException)
+                else checklist_from_api(fetched_checklist)
+            )
+        issue_links = [] if isinstance(issue_links, BaseException) else links_from_api(issue_links)
+        issue_comments = (
+            [] if isinstance(issue_comments, BaseException) else comments_from_api(issue_comments)
+        )
 
-            # Промежуточное обновление прогресса
-            if total > 0:
-                progress = 60 + (idx + 1) / total * 20
-                await self._update_progress(progress)
+        return issue_key, issue_checklists, issue_links, issue_comments
 
-        return links
+    def parse_issue(self, issue: Dict[str, Any]) -> ParsedIssue:
+        """
+        Разобрать задачу из ответа поиска.
+
+        Args:
+            issue: Задача из ответа поиска
 
-    async def _fetch_all_comments(
-        self, issues: List[Dict[str, Any]]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        Returns:
+            Кортеж (IssueRecord, пункты чеклиста из ответа или None, если
+            нужен отдельный запрос чеклиста)
+        """
+        return IssueRecord.from_api(issue), self._embedded_checklist(issue)
+
+    def _embedded_checklist(self, issue: Dict[str, Any]) -> Optional[List[ChecklistItem]]:
         """
-        Получить комментарии для всех задач.
+        Пункты чеклиста из ответа поиска задач.
 
         Args:
-            issues: Список задач
+            issue: Задача из ответа поиска
 
         Returns:
-            Словарь {issue_key: [comments]}
+            Пункты чеклиста или None, если нужен отдельный запрос
         """
-        comments = {}
-        total = len(issues)
+        if not self.profile.embedded_checklists:
+            return None
 
-        for idx, issue in enumerate(issues):
-            issue_key = issue.get("key")
-            try:
-                issue_comments = await self.tracker.client.issues.comments.get(
-                    issue_id=issue_key
-                )
-                comments[issue_key] = issue_comments
-            except Exception:
-                comments[issue_key] = []
+        items = issue.get("checklistItems")
+        if isinstance(items, list):
+            return checklist_from_api(items)
 
-            # Промежуточное обновление прогресса
-            if total > 0:
-                progress = 80 + (idx + 1) / total * 20
-                await self._update_progress(progress)
+        # Чеклист есть, но пунктов в ответе нет - запросим отдельно
+        if any(issue.get(name) for name in CHECKLIST_INDICATOR_FIELDS):
+            return None
+
+        # Пустые поля Tracker не возвращает - у задачи нет чеклиста
+        return []
 
-        return comments
+    async def _limited(self, coro: Awaitable[T]) -> T:
+        """
+        Выполнить запрос к API с учетом лимита одновременных запросов.
+
+        Args:
+            coro: Корутина запроса
+
+        Returns:
+            Результат корутины
+        """
+        try:
+            await self._semaphore.acquire()
+        except BaseException:
+            # Отмена до начала запроса - закрываем корутину, чтобы она не висела
+            close = getattr(coro, "close", None)
+            if close:
+                close()
+            raise
+
+        try:
+            return await coro
+        finally:
+            self._semaphore.release()
 
     async def clone_project(
         self,
         project_data: ProjectData,
         new_project_name: str,
-        target_queue: str
+        target_queue: str,
+        journal: Optional[CloneJournal] = None,
     ) -> CloneResult:
         """
         Создать копию проекта со всеми данными включая иерархию подзадач.
 
+        Если передан журнал с сохраненным прогрессом, клонирование продолжается
+        с последней контрольной точки: уже созданные проект, задачи и
+        восстановленные пункты не создаются повторно.
+
         Args:
             project_data: Данные исходного проекта
             new_project_name: Название нового проекта
             target_queue: Очередь для новых задач
+            journal: Журнал клонирования (для сохранения и продолжения прогресса)
 
         Returns:
             CloneResult с результатами клонирования
         """
         result = CloneResult(success=False)
-        await self._update_progress(0)
+        journal = journal or CloneJournal()
+        self.progress.set(0)
 
-        try:
-            # 1. Создать новый проект (8%)
-            new_project = await self._create_project_copy(
-                project_data.project, new_project_name
-            )
-            result.new_project_id = new_project.get("id")
-            result.new_project_short_id = new_project.get("shortId")
-            result.new_project_name = new_project_name
-            new_project_short_id = new_project.get("shortId")
-            await self._update_progress(8)
-
-            # 2. Создать копии всех задач (32%)
-            issues_mapping = await self._clone_issues(
-                project_data.issues, target_queue, new_project_short_id
-            )
-            result.new_issues_mapping = issues_mapping
-            await self._update_progress(40)
+        with collect_stats(result.stats):
+            try:
+                # 1. Загрузить справочник пользователей и создать новый проект (8%)
+                await self.prepare_copy(project_data.project, new_project_name, journal)
+
+                result.new_project_id = journal.new_project_id
+                result.new_project_short_id = journal.new_project_short_id
+                result.new_project_name = new_project_name
+                self.progress.set(8)
+
+                # 2. Создать копии всех задач вместе с иерархией (42%)
+                with stats_phase("issues"):
+                    issues_mapping = await self._clone_issues(
+                        project_data.issues,
+                        project_data.parent_child,
+                        target_queue,
+                        journal.new_project_short_id,
+                        journal,
+                    )
+                result.new_issues_mapping = issues_mapping
+
+                # Наблюдатели добавляются массовыми изменениями после создания задач
+                self.progress.set(48)
+                await self.restore_followers(project_data.issues, journal)
+                await journal.checkpoint(force=True)
+                self.progress.set(50)
+
+                # 3. Восстановить чеклисты (15%)
+                with stats_phase("checklists"):
+                    await self._restore_checklists(project_data.checklists, journal)
+                await journal.checkpoint(force=True)
+                self.progress.set(65)
+
+                # 4. Восстановить связи между задачами (15%)
+                with stats_phase("links"):
+                    await self._restore_links(project_data.links, journal)
+                await journal.checkpoint(force=True)
+                self.progress.set(80)
+
+                # 5. Восстановить комментарии (20%)
+                with stats_phase("comments"):
+                    await self._restore_comments(project_data.comments, journal)
+                await journal.checkpoint(force=True)
+                self.progress.set(100)
+
+                result.success = self.check_unfinished(result, journal, project_data)
 
-            # 3. Восстановить parent-child связи (10%)
-            await self._restore_parent_child(project_data.parent_child, issues_mapping)
-            await self._update_progress(50)
+            except Exception as e:
+                result.errors.append(str(e))
+                result.success = False
 
-            # 4. Восстановить чеклисты (15%)
-            await self._restore_checklists(project_data.checklists, issues_mapping)
-            await self._update_progress(65)
+        return result
 
-            # 5. Восстановить связи между задачами (15%)
-            await self._restore_links(project_data.links, issues_mapping)
-            await self._update_progress(80)
+    async def clone_project_batch(
+        self,
+        project_data: ProjectData,
+        targets: List[CloneTarget],
+    ) -> List[CloneResult]:
+        """
+        Создать несколько копий проекта по одним загруженным данным.
 
-            # 6. Восстановить комментарии (20%)
-            await self._restore_comments(project_data.comments, issues_mapping)
-            await self._update_progress(100)
+        Копии клонируются одновременно, но все запросы идут через общий
+        семафор клонера: max_concurrency - бюджет всего пакета, а не каждой
+        копии. Прогресс каждой копии пишется в CloneTarget.progress, прогресс
+        клонера - среднее по копиям.
 
-            result.success = True
+        Args:
+            project_data: Данные исходного проекта
+            targets: Новые проекты (название, очередь, журнал, счетчики прогресса)
 
-        except Exception as e:
-            result.errors.append(str(e))
-            result.success = False
+        Returns:
+            CloneResult для каждой цели в порядке targets
+        """
 
-        return result
+        def target_cloner(target: CloneTarget) -> "ProjectCloner":
+            cloner = ProjectCloner(
+                self.tracker,
+                self.max_concurrency,
+                self.linked_issues_depth,
+                self.profile,
+                self.backend,
+                self.fallback_user,
+                # Общий кэш: справочник пользователей загружается один раз на пакет
+                self.reference_data,
+            )
+            cloner._semaphore = self._semaphore
+            cloner._importer = self._importer  # Недоступность импорта общая для пакета
+            cloner.progress = self.progress.add_part(target.progress)
+            return cloner
+
+        return list(await asyncio.gather(*(
+            target_cloner(target).clone_project(
+                project_data, target.new_project_name, target.target_queue, target.journal
+            )
+            for target in targets
+        )))
+
+    async def prepare_copy(
+        self, original_project: Dict[str, Any], new_project_name: str, journal: CloneJournal
+    ) -> None:
+        """
+        Подготовить копию: загрузить справочник пользователей и создать проект.
+
+        Проект создается, только если его нет в журнале. Если проект уже
+        создан прерванным прогоном, задачи создаются только через
+        issues.create с unique (импорт unique не принимает).
+
+        Args:
+            original_project: Исходный проект
+            new_project_name: Название нового проекта
+            journal: Журнал клонирования
+        """
+        self._resuming = bool(journal.new_project_id)
+        with stats_phase("users"):
+            await self.load_users()
+        if journal.new_project_id:
+            return
+
+        with stats_phase("project"):
+            new_project = await self.create_project_copy(original_project, new_project_name)
+        journal.new_project_id = new_project.get("id")
+        journal.new_project_short_id = new_project.get("shortId")
+        await journal.checkpoint(force=True)
+
+    async def load_users(self) -> UserDirectory:
+        """
+        Загрузить справочник пользователей для текущего клонирования.
+
+        Returns:
+            UserDirectory (он же в self.users)
+        """
+        self.users = await self._limited(
+            load_user_directory(self.reference_data, self.fallback_user)
+        )
+        return self.users
 
-    async def _create_project_copy(
+    async def create_project_copy(
         self, original_project: Dict[str, Any], new_name: str
     ) -> Dict[str, Any]:
         """Создать копию проекта."""
@@ -387,10 +1002,11 @@ class ProjectCloner:
 
         if lead:
             # Извлекаем id (поля login нет в API!)
-            if isinstance(lead, dict):
-                project_data["lead"] = lead.get("id")
-            else:
-                project_data["lead"] = lead
+            lead_id = lead.get("id") if isinstance(lead, dict) else lead
+            # Уволенного руководителя заменяем запасным пользователем
+            lead_id = self.users.resolve(lead_id)
+            if lead_id:
+                project_data["lead"] = lead_id
 
         # Копируем teamAccess
         team_access = original_project.get("teamAccess")
@@ -414,6 +1030,7 @@ class ProjectCloner:
                         user_ids.append(user_id)
                 else:
                     user_ids.append(user)
+            user_ids = self.users.resolve_many(user_ids)
             if user_ids:
                 project_data["team_users"] = user_ids  # snake_case для API!
 
@@ -460,217 +1077,594 @@ class ProjectCloner:
         return await self.tracker.client.entities.create(**project_data)
 
     async def _clone_issues(
-        self, issues: List[Dict[str, Any]], queue: str, project_short_id: int
+        self,
+        issues: List[IssueRecord],
+        parent_child: Dict[str, str],
+        queue: str,
+        project_short_id: int,
+        journal: CloneJournal,
     ) -> Dict[str, str]:
-        """Создать копии всех задач."""
-        mapping = {}
+        """
+        Создать копии всех задач с сохранением иерархии.
+
+        Задачи создаются по уровням вложенности: сначала корневые, затем их
+        подзадачи и т.д. Задачи одного уровня создаются параллельно, а ключ
+        нового родителя передается сразу при создании, поэтому отдельный
+        проход восстановления parent-child связей не нужен. Наблюдатели
+        добавляются позже одним этапом (restore_followers) или, при
+        импорте, вместе с задачей.
+
+        Args:
+            issues: Список задач исходного проекта
+            parent_child: Словарь {child_key: parent_key}
+            queue: Очередь для новых задач
+            project_short_id: shortId нового проекта
+            journal: Журнал клонирования (уже созданные задачи пропускаются)
+
+        Returns:
+            Маппинг старых ключей задач на новые
+        """
+        mapping = journal.issues_mapping
         total = len(issues)
+        processed = 0
 
-        for idx, issue in enumerate(issues):
-            old_key = issue.get("key")
-
-            # Подготовить данные для новой задачи
-            new_issue_data = {
-                "summary": issue.get("summary"),
-                "queue": queue,
-                "description": issue.get("description", ""),
-            }
-
-            # Добавить связь с проектом (используем shortId в формате v3 API)
-            if project_short_id:
-                new_issue_data["project"] = {"primary": project_short_id}
-
-            # Копировать тип (извлекаем только ключи)
-            if "type" in issue:
-                issue_type = issue["type"]
-                if isinstance(issue_type, dict):
-                    new_issue_data["type"] = issue_type.get("key") or issue_type.get("id")
+        for level in self.group_issues_by_depth(issues, parent_child):
+            pending = []
+            for issue in level:
+                if issue.key in mapping:
+                    processed += 1
                 else:
-                    new_issue_data["type"] = issue_type
+                    pending.append(issue)
+
+            tasks = [
+                asyncio.create_task(
+                    self.clone_issue(
+                        issue,
+                        queue,
+                        project_short_id,
+                        mapping.get(parent_child.get(issue.key)),
+                        journal.unique_token(issue.key),
+                    )
+                )
+                for issue in pending
+            ]
 
-            # Копировать приоритет
-            if "priority" in issue:
-                issue_priority = issue["priority"]
-                if isinstance(issue_priority, dict):
-                    new_issue_data["priority"] = issue_priority.get("key") or issue_priority.get("id")
-                else:
-                    new_issue_data["priority"] = issue_priority
+            try:
+                for task in asyncio.as_completed(tasks):
+                    old_key, new_key = await task
+                    if new_key:
+                        mapping[old_key] = new_key
+                        await journal.checkpoint()
+
+                    # Обновить прогресс
+                    processed += 1
+                    if total > 0:
+                        self.progress.advance(8 + processed / total * 40)
+            finally:
+                for task in tasks:
+                    task.cancel()
 
-            # Копировать исполнителя
-            if "assignee" in issue:
-                assignee = issue["assignee"]
-                if isinstance(assignee, dict):
-                    new_issue_data["assignee"] = assignee.get("login") or assignee.get("id")
-                else:
-                    new_issue_data["assignee"] = assignee
+        return mapping
 
-            # Копировать теги
-            if "tags" in issue and issue["tags"]:
-                new_issue_data["tags"] = issue["tags"]
+    @staticmethod
+    def group_issues_by_depth(
+        issues: List[IssueRecord], parent_child: Dict[str, str]
+    ) -> List[List[IssueRecord]]:
+        """
+        Разбить задачи на уровни по глубине вложенности.
 
-            # Копировать дедлайн
-            if "deadline" in issue:
-                new_issue_data["deadline"] = issue["deadline"]
+        Родитель, которого нет среди клонируемых задач, не учитывается -
+        такая задача считается корневой. Циклы в иерархии разрываются.
 
-            # Копировать время оценки
-            if "estimation" in issue:
-                new_issue_data["estimation"] = issue["estimation"]
+        Args:
+            issues: Список задач
+            parent_child: Словарь {child_key: parent_key}
 
-            # Создать задачу
-            try:
-                new_issue = await self.tracker.client.issues.create(**new_issue_data)
-                new_key = new_issue.get("key")
-                mapping[old_key] = new_key
-
-                # Добавить наблюдателей после создания задачи
-                if "followers" in issue and issue["followers"]:
-                    try:
-                        followers = issue["followers"]
-                        # Извлекаем логины наблюдателей
-                        follower_ids = []
-                        for follower in followers:
-                            if isinstance(follower, dict):
-                                follower_id = follower.get("login") or follower.get("id")
-                                if follower_id:
-                                    follower_ids.append(follower_id)
-                            else:
-                                follower_ids.append(follower)
-
-                        if follower_ids:
-                            await self.tracker.client.issues.update(
-                                issue_id=new_key,
-                                followers={"add": follower_ids}
-                            )
-                    except Exception:
-                        pass  # Игнорируем ошибки с наблюдателями
+        Returns:
+            Список уровней (уровень 0 - корневые задачи)
+        """
+        issue_keys = {issue.key for issue in issues}
+        depths: Dict[str, int] = {}
+
+        def get_depth(key: str) -> int:
+            # Итеративный подъем по цепочке родителей (без рекурсии)
+            chain = []
+            current = key
+            while current not in depths:
+                parent_key = parent_child.get(current)
+                if parent_key not in issue_keys or parent_key in chain or parent_key == current:
+                    depths[current] = 0
+                    break
+                chain.append(current)
+                current = parent_key
+
+            depth = depths[current]
+            for child_key in reversed(chain):
+                depth += 1
+                depths[child_key] = depth
+            return depths[key]
+
+        levels: List[List[IssueRecord]] = []
+        for issue in issues:
+            depth = get_depth(issue.key)
+            while len(levels) <= depth:
+                levels.append([])
+            levels[depth].append(issue)
+
+        return levels
+
+    async def clone_issue(
+        self,
+        issue: IssueRecord,
+        queue: str,
+        project_short_id: int,
+        new_parent_key: Optional[str] = None,
+        unique: Optional[str] = None,
+    ) -> tuple[str, Optional[str]]:
+        """
+        Создать копию одной задачи.
+
+        Args:
+            issue: Исходная задача
+            queue: Очередь для новой задачи
+            project_short_id: shortId нового проекта
+            new_parent_key: Ключ уже созданной родительской задачи (если есть)
+            unique: Токен идемпотентного создания (повтор не создаст дубликат)
 
+        Returns:
+            Кортеж (старый ключ, новый ключ или None при ошибке)
+        """
+        old_key = issue.key
+        new_issue_data = self._build_issue_payload(issue, queue, project_short_id, self.users)
+        if new_parent_key:
+            new_issue_data["parent"] = new_parent_key
+        if unique:
+            new_issue_data["unique"] = unique
+
+        # Создать задачу
+        with stats_phase("issues"):
+            try:
+                new_issue = await self._create_issue(issue, new_issue_data)
+            except aiohttp.ClientResponseError as e:
+                # 409: задача уже создана прошлым (прерванным) прогоном
+                if e.status != 409 or not unique:
+                    record_failure(old_key, e)
+                    return old_key, None
+                new_issue = await self._find_issue_by_unique(unique)
+                if not new_issue:
+                    record_failure(old_key, e)
+                    return old_key, None
             except Exception as e:
-                # Логируем ошибку но продолжаем
-                pass
+                # Учитываем ошибку, но продолжаем
+                record_failure(old_key, e)
+                return old_key, None
 
-            # Обновить прогресс
-            if total > 0:
-                progress = 10 + (idx + 1) / total * 40
-                await self._update_progress(progress)
+        return old_key, new_issue.get("key")
 
-        return mapping
+    async def _create_issue(self, issue: IssueRecord, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Создать задачу через импорт (если он доступен) или issues.create.
+
+        При продолжении прерванного клонирования импорт не используется:
+        прошлый прогон мог импортировать задачу, не получив ответа, а
+        повтор с unique через issues.create дубликат не создаст.
 
-    async def _restore_parent_child(
-        self, parent_child: Dict[str, str], issues_mapping: Dict[str, str]
+        Args:
+            issue: Исходная задача
+            payload: Результат _build_issue_payload с родителем и токеном unique
+
+        Returns:
+            Созданная задача
+        """
+        if self._importer and self._importer.available and not self._resuming:
+            followers = self.users.resolve_many(issue.followers)
+            try:
+                new_issue = await self._limited(self._importer.import_issue(
+                    {**payload, "followers": followers} if followers else payload,
+                    created_at=issue.created_at,
+                    # Автор переносится, уволенный заменяется как исполнитель
+                    created_by=self.users.resolve(issue.created_by),
+                ))
+            except ImportUnavailable:
+                pass
+            else:
+                if issue.followers:
+                    self._followers_imported.add(issue.key)
+                return new_issue
+
+        return await self._limited(self.tracker.client.issues.create(**payload))
+
+    async def restore_followers(
+        self, issues: List[IssueRecord], journal: CloneJournal
     ) -> None:
         """
-        Восстановить parent-child связи между задачами.
+        Добавить наблюдателей в новые задачи массовыми изменениями.
+
+        Изменения группируются по набору наблюдателей: одна операция
+        добавляет одинаковый набор во все задачи, где он был в шаблоне,
+        небольшие группы BulkChangeEngine изменяет обычными запросами.
+        Задачи, импортированные вместе с наблюдателями, пропускаются.
 
         Args:
-            parent_child: Словарь {child_key: parent_key} из исходного проекта
-            issues_mapping: Маппинг старых ключей задач на новые
+            issues: Задачи исходного проекта
+            journal: Журнал клонирования (маппинг задач и выполненные задачи)
         """
-        total = len(parent_child)
-        processed = 0
+        bulk = BulkChangeEngine(self.tracker, limited=self._limited)
+        pending: Dict[str, str] = {}  # {new_key: old_key}
+
+        for issue in issues:
+            old_key = issue.key
+            new_key = journal.issues_mapping.get(old_key)
+            if old_key in self._followers_imported and new_key:
+                journal.followers_done.add(old_key)
+            if not new_key or old_key in journal.followers_done or not issue.followers:
+                continue
 
-        for old_child_key, old_parent_key in parent_child.items():
-            new_child_key = issues_mapping.get(old_child_key)
-            new_parent_key = issues_mapping.get(old_parent_key)
+            followers = self.users.resolve_many(issue.followers)
+            if not followers:
+                # Все наблюдатели уволены, а запасного пользователя нет
+                journal.followers_done.add(old_key)
+                continue
 
-            if new_child_key and new_parent_key:
-                try:
-                    # Обновить задачу, установив parent
-                    await self.tracker.client.issues.update(
-                        issue_id=new_child_key,
-                        parent=new_parent_key
-                    )
-                except Exception as e:
-                    # Логируем ошибку но продолжаем
-                    pass
+            pending[new_key] = old_key
+            bulk.add(new_key, {"followers": {"add": sorted(followers, key=str)}})
 
-            processed += 1
-            if total > 0:
-                progress = 40 + processed / total * 10
-                await self._update_progress(progress)
+        if not pending:
+            return
+
+        with stats_phase("followers"):
+            bulk_result = await bulk.flush()
+
+            # Задачи с ошибкой не отмечаем - продолжение клонирования повторит их
+            for new_key, old_key in pending.items():
+                if new_key in bulk_result.failed:
+                    record_failure(old_key, bulk_result.failed[new_key])
+                else:
+                    journal.followers_done.add(old_key)
+
+    async def _find_issue_by_unique(self, unique: str) -> Optional[Dict[str, Any]]:
+        """
+        Найти задачу, созданную с указанным уникальным токеном.
+
+        Args:
+            unique: Значение поля unique
+
+        Returns:
+            Задача или None
+        """
+        try:
+            found = await self._limited(
+                self.tracker.client.issues.search(filter={"unique": unique})
+            )
+        except Exception:
+            return None
+        return found[0] if found else None
+
+    @staticmethod
+    def _build_issue_payload(
+        issue: IssueRecord,
+        queue: str,
+        project_short_id: int,
+        users: Optional[UserDirectory] = None,
+    ) -> Dict[str, Any]:
+        """
+        Подготовить данные для создания копии задачи.
+
+        Args:
+            issue: Исходная задача
+            queue: Очередь для новой задачи
+            project_short_id: shortId нового проекта
+            users: Справочник пользователей (неактивный исполнитель заменяется)
+
+        Returns:
+            Аргументы для issues.create()
+        """
+        new_issue_data = {
+            "summary": issue.summary,
+            "queue": queue,
+            "description": issue.description or "",
+        }
+
+        # Добавить связь с проектом (используем shortId в формате v3 API)
+        if project_short_id:
+            new_issue_data["project"] = {"primary": project_short_id}
+
+        # Тип, приоритет и исполнитель уже сведены к ключу/логину при разборе
+        if issue.type:
+            new_issue_data["type"] = issue.type
+        if issue.priority:
+            new_issue_data["priority"] = issue.priority
+        assignee = users.resolve(issue.assignee) if users else issue.assignee
+        if assignee:
+            new_issue_data["assignee"] = assignee
+
+        # Копировать теги
+        if issue.tags:
+            new_issue_data["tags"] = list(issue.tags)
+
+        # Копировать дедлайн
+        if issue.deadline is not None:
+            new_issue_data["deadline"] = issue.deadline
+
+        # Копировать время оценки
+        if issue.estimation is not None:
+            new_issue_data["estimation"] = issue.estimation
+
+        return new_issue_data
 
     async def _restore_checklists(
-        self, checklists: Dict[str, List], issues_mapping: Dict[str, str]
+        self, checklists: Dict[str, List[ChecklistItem]], journal: CloneJournal
     ) -> None:
-        """Восстановить чеклисты в новых задачах."""
+        """
+        Восстановить чеклисты в новых задачах.
+
+        Каждая задача - отдельная очередь: ее пункты создаются по одному и в
+        исходном порядке, а очереди разных задач идут параллельно в пределах
+        лимита клонера (max_concurrency).
+        """
+        issues_mapping = journal.issues_mapping
         total_items = sum(len(items) for items in checklists.values())
         processed = 0
 
+        def on_item() -> None:
+            nonlocal processed
+            processed += 1
+            if total_items > 0:
+                self.progress.advance(50 + processed / total_items * 15)
+
+        tasks = []
         for old_key, items in checklists.items():
             new_key = issues_mapping.get(old_key)
             if not new_key:
                 continue
 
-            for item in items:
+            # Пункты, восстановленные прошлым прогоном, пропускаем
+            processed += journal.checklists_done.get(old_key, 0)
+            tasks.append(asyncio.create_task(
+                self.restore_issue_checklist(old_key, new_key, items, journal, on_item)
+            ))
+
+        await self._run_lanes(tasks)
+
+    @staticmethod
+    async def _run_lanes(tasks: List[asyncio.Task]) -> None:
+        """
+        Дождаться очередей восстановления задач.
+
+        Ошибка одной очереди (отмена, сбой журнала) прерывает остальные.
+
+        Args:
+            tasks: Задачи restore_issue_checklist / restore_issue_comments
+        """
+        try:
+            for task in asyncio.as_completed(tasks):
+                await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def restore_issue_checklist(
+        self,
+        old_key: str,
+        new_key: str,
+        items: List[ChecklistItem],
+        journal: CloneJournal,
+        on_item: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Восстановить чеклист одной задачи (с пункта, на котором остановились).
+
+        Счетчик журнала сдвигается только после созданного пункта или
+        постоянной ошибки (4xx - пункт пропускается). На временной ошибке
+        очередь задачи останавливается: продолжение начнет с этого пункта.
+
+        Args:
+            old_key: Ключ исходной задачи
+            new_key: Ключ новой задачи
+            items: Пункты чеклиста исходной задачи
+            journal: Журнал клонирования
+            on_item: Вызывается после каждого пункта
+        """
+        done = journal.checklists_done.get(old_key, 0)
+        for idx, item in enumerate(items[done:], start=done):
+            with stats_phase("checklists"):
                 try:
-                    await self.tracker.client.issues.checklists.create(
+                    await self._limited(self.tracker.client.issues.checklists.create(
                         issue_id=new_key,
-                        text=item.get("text"),
-                        checked=item.get("checked", False),
-                    )
-                except Exception:
-                    pass  # Пропускаем ошибки
+                        text=item.text,
+                        checked=item.checked,
+                    ))
+                except Exception as e:
+                    record_failure(old_key, e)
+                    if is_transient_error(e):
+                        return
+                    # Пункт пропускаем
+
+            journal.checklists_done[old_key] = idx + 1
+            await journal.checkpoint()
+            if on_item:
+                on_item()
+
+    @staticmethod
+    def check_unfinished(
+        result: CloneResult, journal: CloneJournal, project_data: ProjectData
+    ) -> bool:
+        """
+        Проверить, что очереди чеклистов и комментариев дошли до конца, а
+        связи между созданными задачами восстановлены.
 
-                processed += 1
-                if total_items > 0:
-                    progress = 50 + processed / total_items * 15
-                    await self._update_progress(progress)
+        Очередь задачи останавливается на временной ошибке Tracker, не сдвигая
+        счетчик журнала, а несозданная связь не попадает в журнал. Такое
+        клонирование завершается неуспешно, чтобы его можно было продолжить
+        с того же пункта.
+
+        Args:
+            result: Результат клонирования (сюда добавляется ошибка)
+            journal: Журнал клонирования
+            project_data: Данные исходного проекта
+
+        Returns:
+            True, если все пункты и связи восстановлены (или пункты пропущены)
+        """
+        unfinished = journal.unfinished_items(project_data.checklists, project_data.comments)
+        if unfinished:
+            result.errors.append(
+                f"Не восстановлено пунктов чеклистов и комментариев из-за сбоя Tracker: "
+                f"{unfinished}. Клонирование можно продолжить"
+            )
+        issues_mapping = journal.issues_mapping
+        unfinished_links = sum(
+            1 for link in plan_links(project_data.links)
+            if link.source in issues_mapping
+            and link.target in issues_mapping
+            and link.key not in journal.links_done
+        )
+        if unfinished_links:
+            result.errors.append(
+                f"Не восстановлено связей: {unfinished_links}. Клонирование можно продолжить"
+            )
+        return not unfinished and not unfinished_links
 
     async def _restore_links(
-        self, links: Dict[str, List], issues_mapping: Dict[str, str]
+        self, links: Dict[str, List[LinkRecord]], journal: CloneJournal
     ) -> None:
-        """Восстановить связи между задачами."""
-        total_links = sum(len(link_list) for link_list in links.values())
+        """
+        Восстановить связи между задачами.
+
+        Каждая связь создается один раз (Tracker отдает ее у обеих задач),
+        запросы выполняются параллельно в пределах лимита клонера.
+        """
+        issues_mapping = journal.issues_mapping
+        planned = [
+            link for link in plan_links(links)
+            if link.source in issues_mapping
+            and link.target in issues_mapping
+            and link.key not in journal.links_done
+        ]
+        total_links = len(planned)
         processed = 0
 
-        for old_key, link_list in links.items():
-            new_key = issues_mapping.get(old_key)
-            if not new_key:
-                continue
+        tasks = [
+            asyncio.create_task(self.restore_link(link, journal))
+            for link in planned
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                await task
 
-            for link in link_list:
-                # Получить связанную задачу
-                linked_issue_key = link.get("object", {}).get("key")
-                new_linked_key = issues_mapping.get(linked_issue_key)
+                processed += 1
+                self.progress.advance(65 + processed / total_links * 15)
+        finally:
+            for task in tasks:
+                task.cancel()
 
-                if not new_linked_key:
-                    continue
+    async def restore_link(self, link: PlannedLink, journal: CloneJournal) -> None:
+        """
+        Восстановить одну связь, если обе задачи уже созданы.
 
-                try:
-                    await self.tracker.client.issues.links.create(
-                        issue_id=new_key,
-                        relationship=link.get("type", {}).get("id", "relates"),
-                        issue=new_linked_key,
-                    )
-                except Exception:
-                    pass  # Пропускаем ошибки дублирования
+        В журнал попадает созданная связь и связь, которая уже есть
+        (LINK_EXISTS_STATUSES). После временной или другой ошибки связь
+        остается невосстановленной, и продолжение клонирования повторит ее.
 
-                processed += 1
-                if total_links > 0:
-                    progress = 65 + processed / total_links * 15
-                    await self._update_progress(progress)
+        Args:
+            link: Связь в каноническом виде
+            journal: Журнал клонирования
+        """
+        issues_mapping = journal.issues_mapping
+        new_key = issues_mapping.get(link.source)
+        new_linked_key = issues_mapping.get(link.target)
+
+        if not new_key or not new_linked_key or link.key in journal.links_done:
+            return
+
+        with stats_phase("links"):
+            try:
+                await self._limited(self.tracker.client.issues.links.create(
+                    issue_id=new_key,
+                    relationship=link.relationship,
+                    linked_issue=new_linked_key,
+                ))
+            except Exception as e:
+                record_failure(link.source, e)
+                exists = (
+                    isinstance(e, aiohttp.ClientResponseError)
+                    and e.status in LINK_EXISTS_STATUSES
+                )
+                if not exists:
+                    return
+
+        journal.links_done.add(link.key)
+        await journal.checkpoint()
 
     async def _restore_comments(
-        self, comments: Dict[str, List], issues_mapping: Dict[str, str]
+        self, comments: Dict[str, List[str]], journal: CloneJournal
     ) -> None:
-        """Восстановить комментарии в новых задачах."""
+        """
+        Восстановить комментарии в новых задачах.
+
+        Как и чеклисты: комментарии одной задачи создаются по порядку,
+        задачи - параллельно в пределах лимита клонера.
+        """
+        issues_mapping = journal.issues_mapping
         total_comments = sum(len(comment_list) for comment_list in comments.values())
         processed = 0
 
+        def on_item() -> None:
+            nonlocal processed
+            processed += 1
+            if total_comments > 0:
+                self.progress.advance(80 + processed / total_comments * 20)
+
+        tasks = []
         for old_key, comment_list in comments.items():
             new_key = issues_mapping.get(old_key)
             if not new_key:
                 continue
 
-            for comment in comment_list:
+            # Комментарии, восстановленные прошлым прогоном, пропускаем
+            processed += journal.comments_done.get(old_key, 0)
+            tasks.append(asyncio.create_task(
+                self.restore_issue_comments(old_key, new_key, comment_list, journal, on_item)
+            ))
+
+        await self._run_lanes(tasks)
+
+    async def restore_issue_comments(
+        self,
+        old_key: str,
+        new_key: str,
+        comment_list: List[str],
+        journal: CloneJournal,
+        on_item: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Восстановить комментарии одной задачи (с того, на котором остановились).
+
+        Как и для чеклиста: на временной ошибке очередь останавливается, не
+        сдвигая счетчик журнала, постоянная ошибка пропускает комментарий.
+
+        Args:
+            old_key: Ключ исходной задачи
+            new_key: Ключ новой задачи
+            comment_list: Тексты комментариев исходной задачи
+            journal: Журнал клонирования
+            on_item: Вызывается после каждого комментария
+        """
+        done = journal.comments_done.get(old_key, 0)
+        for idx, text in enumerate(comment_list[done:], start=done):
+            with stats_phase("comments"):
                 try:
-                    await self.tracker.client.issues.comments.create(
+                    await self._limited(self.tracker.client.issues.comments.create(
                         issue_id=new_key,
-                        text=comment.get("text", ""),
-                    )
-                except Exception:
-                    pass  # Пропускаем ошибки
-
-                processed += 1
-                if total_comments > 0:
-                    progress = 80 + processed / total_comments * 20
-                    await self._update_progress(progress)
+                        text=text,
+                    ))
+                except Exception as e:
+                    record_failure(old_key, e)
+                    if is_transient_error(e):
+                        return
+                    # Комментарий пропускаем
+
+            journal.comments_done[old_key] = idx + 1
+            await journal.checkpoint()
+            if on_item:
+                on_item()
@@ -0,0 +1,235 @@
+"""Компактные записи данных шаблона: только поля, которые читает клонирование."""
+
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _intern(value: Any) -> Optional[str]:
+    """Интернировать повторяющуюся строку (тип, приоритет, логин, ключ)."""
+    if value is None:
+        return None
+    return sys.intern(str(value))
+
+
+def _ref_id(value: Any, *names: str) -> Optional[str]:
+    """
+    Идентификатор из ссылки API ({"key": ..., "id": ...}) или значения как есть.
+
+    Args:
+        value: Ссылка на объект Tracker или строка
+        names: Поля ссылки по приоритету
+
+    Returns:
+        Интернированная строка или None
+    """
+    if isinstance(value, dict):
+        for name in names:
+            if value.get(name):
+                return _intern(value[name])
+        return None
+    return _intern(value) if value else None
+
+
+class IssueRecord:
+    """
+    Задача шаблона.
+
+    Тип, приоритет, исполнитель, наблюдатели, автор, теги и ключи хранятся
+    интернированными строками: в шаблоне их немного разных значений.
+    Поля, которых не было в ответе API, равны None. Время создания и автор
+    нужны только импорту задач (IssueImporter).
+    """
+
+    __slots__ = (
+        "key",
+        "summary",
+        "description",
+        "type",
+        "priority",
+        "assignee",
+        "tags",
+        "deadline",
+        "estimation",
+        "followers",
+        "parent",
+        "created_at",
+        "created_by",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        type: Optional[str] = None,
+        priority: Optional[str] = None,
+        assignee: Optional[str] = None,
+        tags: Tuple[str, ...] = (),
+        deadline: Optional[str] = None,
+        estimation: Optional[str] = None,
+        followers: Tuple[str, ...] = (),
+        parent: Optional[str] = None,
+        created_at: Optional[str] = None,
+        created_by: Optional[str] = None,
+    ):
+        self.key = key
+        self.summary = summary
+        self.description = description
+        self.type = type
+        self.priority = priority
+        self.assignee = assignee
+        self.tags = tags
+        self.deadline = deadline
+        self.estimation = estimation
+        self.followers = followers
+        self.parent = parent
+        self.created_at = created_at
+        self.created_by = created_by
+
+    @classmethod
+    def from_api(cls, issue: Dict[str, Any]) -> "IssueRecord":
+        """
+        Запись из ответа поиска задач.
+
+        Args:
+            issue: Задача из ответа API
+
+        Returns:
+            IssueRecord
+        """
+        followers = (
+            _ref_id(follower, "login", "id") for follower in issue.get("followers") or []
+        )
+        return cls(
+            key=_intern(issue.get("key")),
+            summary=issue.get("summary"),
+            description=issue.get("description"),
+            type=_ref_id(issue.get("type"), "key", "id"),
+            priority=_ref_id(issue.get("priority"), "key", "id"),
+            assignee=_ref_id(issue.get("assignee"), "login", "id"),
+            tags=tuple(_intern(tag) for tag in issue.get("tags") or []),
+            deadline=issue.get("deadline"),
+            estimation=issue.get("estimation"),
+            followers=tuple(follower for follower in followers if follower),
+            parent=_ref_id(issue.get("parent"), "key"),
+            created_at=issue.get("createdAt"),
+            created_by=_ref_id(issue.get("createdBy"), "login", "id"),
+        )
+
+    def to_row(self) -> List[Any]:
+        """Строка снимка шаблона (значения полей в порядке __slots__)."""
+        return [getattr(self, name) for name in self.__slots__]
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> "IssueRecord":
+        """
+        Запись из строки снимка шаблона.
+
+        Args:
+            row: Результат to_row() после JSON
+
+        Returns:
+            IssueRecord
+        """
+        (key, summary, description, issue_type, priority, assignee,
+         tags, deadline, estimation, followers, parent, created_at, created_by) = row
+        return cls(
+            key=_intern(key),
+            summary=summary,
+            description=description,
+            type=_intern(issue_type),
+            priority=_intern(priority),
+            assignee=_intern(assignee),
+            tags=tuple(_intern(tag) for tag in tags),
+            deadline=deadline,
+            estimation=estimation,
+            followers=tuple(_intern(follower) for follower in followers),
+            parent=_intern(parent),
+            created_at=created_at,
+            created_by=_intern(created_by),
+        )
+
+    def __repr__(self) -> str:
+        return f"<IssueRecord({self.key})>"
+
+
+class ChecklistItem:
+    """Пункт чеклиста задачи шаблона."""
+
+    __slots__ = ("text", "checked")
+
+    def __init__(self, text: Optional[str], checked: bool = False):
+        self.text = text
+        self.checked = checked
+
+    @classmethod
+    def from_api(cls, item: Dict[str, Any]) -> "ChecklistItem":
+        """Пункт из ответа API."""
+        return cls(item.get("text"), bool(item.get("checked", False)))
+
+    def to_row(self) -> List[Any]:
+        """Строка снимка шаблона."""
+        return [self.text, self.checked]
+
+    def __repr__(self) -> str:
+        return f"<ChecklistItem({self.text!r}, checked={self.checked})>"
+
+
+class LinkRecord:
+    """
+    Связь задачи шаблона в том виде, как ее вернул API для одной задачи.
+
+    Attributes:
+        type_id: Тип связи (relates, depends, ...)
+        direction: Направление со стороны задачи (outward / inward)
+        linked_key: Ключ связанной задачи
+    """
+
+    __slots__ = ("type_id", "direction", "linked_key")
+
+    def __init__(self, type_id: str, direction: Optional[str], linked_key: str):
+        self.type_id = type_id
+        self.direction = direction
+        self.linked_key = linked_key
+
+    @classmethod
+    def from_api(cls, link: Dict[str, Any]) -> Optional["LinkRecord"]:
+        """
+        Связь из ответа API.
+
+        Args:
+            link: Связь из ответа issues.links.get
+
+        Returns:
+            LinkRecord или None, если в связи нет ключа связанной задачи
+        """
+        linked_key = (link.get("object") or {}).get("key")
+        if not linked_key:
+            return None
+
+        link_type = link.get("type") or {}
+        type_id = link_type.get("id", "relates") if isinstance(link_type, dict) else str(link_type)
+        return cls(_intern(type_id), _intern(link.get("direction")), _intern(linked_key))
+
+    def to_row(self) -> List[Any]:
+        """Строка снимка шаблона."""
+        return [self.type_id, self.direction, self.linked_key]
+
+    def __repr__(self) -> str:
+        return f"<LinkRecord({self.type_id}, {self.direction}, {self.linked_key})>"
+
+
+def checklist_from_api(items: Iterable[Dict[str, Any]]) -> List[ChecklistItem]:
+    """Пункты чеклиста из ответа API."""
+    return [ChecklistItem.from_api(item) for item in items]
+
+
+def links_from_api(links: Iterable[Dict[str, Any]]) -> List[LinkRecord]:
+    """Связи задачи из ответа API (связи без ключа задачи пропускаются)."""
+    records = (LinkRecord.from_api(link) for link in links)
+    return [record for record in records if record]
+
+
+def comments_from_api(comments: Iterable[Dict[str, Any]]) -> List[str]:
+    """Комментарии задачи из ответа API - клонируется только текст."""
+    return [comment.get("text", "") for comment in comments]
@@ -0,0 +1,370 @@
+"""Ограничение частоты и повтор запросов к Yandex Tracker API."""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Параметры по умолчанию (один OAuth токен на организацию)
+DEFAULT_RATE = 20.0  # запросов в секунду
+DEFAULT_BURST = 20  # размер "ведра" токенов
+DEFAULT_INITIAL_CONCURRENCY = 8
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_LATENCY_TARGET = 1.5  # секунд - выше лимит не увеличивается
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 0.5  # секунд
+DEFAULT_MAX_DELAY = 30.0  # секунд
+
+# HTTP статусы временных ошибок сервера
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+
+# Размер окна последних измеренных задержек
+LATENCY_WINDOW = 200
+
+# Наблюдатель попыток запросов текущей задачи: (задержка, будет повтор).
+# Позволяет учитывать запросы одного клонирования при общем лимитере организации.
+request_observer: ContextVar[Optional[Callable[[float, bool], None]]] = ContextVar(
+    "request_observer", default=None
+)
+
+
+class TokenBucket:
+    """Token bucket: не более rate запросов в секунду с допустимым всплеском burst."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        """
+        Инициализация token bucket.
+
+        Args:
+            rate: Скорость пополнения (токенов в секунду)
+            burst: Максимальное количество накопленных токенов
+        """
+        if rate <= 0:
+            raise ValueError("rate должен быть положительным числом")
+        if burst < 1:
+            raise ValueError("burst должен быть не меньше 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Получить lock текущего event loop (лимитер может пережить loop)."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    def _refill(self, now: float) -> None:
+        """Пополнить токены за прошедшее время."""
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def pause(self, seconds: float) -> None:
+        """
+        Приостановить выдачу токенов (например, по заголовку Retry-After).
+
+        Args:
+            seconds: Длительность паузы в секундах
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    async def acquire(self) -> None:
+        """Дождаться и забрать один токен."""
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Адаптивный лимит одновременных запросов (AIMD).
+
+    Лимит растет на единицу после каждого "окна" быстрых успешных
+    запросов и уменьшается вдвое при ответе 429.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_limit: int = DEFAULT_MIN_CONCURRENCY,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        latency_target: float = DEFAULT_LATENCY_TARGET,
+    ):
+        """
+        Инициализация лимитера.
+
+        Args:
+            initial: Начальный лимит
+            min_limit: Минимальный лимит
+            max_limit: Максимальный лимит
+            latency_target: Задержка (сек), до которой запрос считается быстрым
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Должно выполняться 1 <= min_limit <= initial <= max_limit")
+
+        self.limit = initial
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self._healthy_count = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Получить condition текущего event loop."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    async def acquire(self) -> None:
+        """Дождаться свободного слота."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self, latency: Optional[float], throttled: bool = False) -> None:
+        """
+        Освободить слот и скорректировать лимит.
+
+        Args:
+            latency: Длительность запроса (None если запрос упал до ответа)
+            throttled: Получен ли ответ 429
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight = max(0, self.in_flight - 1)
+
+            if throttled:
+                new_limit = max(self.min_limit, self.limit // 2)
+                if new_limit != self.limit:
+                    logger.info(f"Tracker concurrency limit: {self.limit} -> {new_limit}")
+                self.limit = new_limit
+                self._healthy_count = 0
+            elif latency is not None and latency <= self.latency_target:
+                self._healthy_count += 1
+                if self._healthy_count >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._healthy_count = 0
+
+            condition.notify_all()
+
+
+class TrackerRateLimiter:
+    """
+    Общий для организации лимитер запросов к Tracker API.
+
+    Объединяет token bucket, адаптивный лимит одновременных запросов
+    и повтор запросов с экспоненциальной задержкой и jitter.
+    """
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        """
+        Инициализация лимитера.
+
+        Args:
+            bucket: Token bucket (по умолчанию DEFAULT_RATE запросов/сек)
+            concurrency: Адаптивный лимит одновременных запросов
+            max_retries: Максимальное количество повторов одного запроса
+            base_delay: Базовая задержка перед повтором (сек)
+            max_delay: Максимальная задержка перед повтором (сек)
+        """
+        self.bucket = bucket or TokenBucket()
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter()
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        # Статистика
+        self.requests_count = 0
+        self.retries_count = 0
+        self.throttled_count = 0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Задержка перед повтором: exponential backoff с full jitter."""
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    @staticmethod
+    def _retry_after(error: aiohttp.ClientResponseError) -> Optional[float]:
+        """Извлечь значение заголовка Retry-After (в секундах)."""
+        if not error.headers:
+            return None
+        value = error.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        idempotent: bool = True,
+    ) -> T:
+        """
+        Выполнить запрос с ограничением частоты и повторами.
+
+        Ответ 429 повторяется всегда (запрос не был выполнен). Ошибки 5xx,
+        таймауты и обрывы соединения повторяются только для идемпотентных
+        запросов, чтобы не создать дубликаты задач.
+
+        Args:
+            func: Фабрика корутины запроса (вызывается на каждую попытку)
+            idempotent: Можно ли безопасно повторить запрос после сбоя
+
+        Returns:
+            Результат запроса
+        """
+        observer = request_observer.get()
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            await self.concurrency.acquire()
+
+            started_at = time.monotonic()
+            latency: Optional[float] = None
+            throttled = False
+            retried = False
+            try:
+                self.requests_count += 1
+                result = await func()
+                latency = time.monotonic() - started_at
+                self.latencies.append(latency)
+                return result
+            except aiohttp.ClientResponseError as e:
+                latency = time.monotonic() - started_at
+                throttled = e.status == 429
+                retryable = throttled or (idempotent and e.status in RETRYABLE_STATUSES)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                retried = True
+
+                delay = self._backoff_delay(attempt)
+                if throttled:
+                    self.throttled_count += 1
+                    retry_after = self._retry_after(e)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
+                    # Пауза общая для всех запросов организации
+                    self.bucket.pause(delay)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                retried = True
+                delay = self._backoff_delay(attempt)
+            finally:
+                if observer:
+                    observer(time.monotonic() - started_at, retried)
+                await self.concurrency.release(latency, throttled)
+
+            attempt += 1
+            self.retries_count += 1
+            logger.warning(
+                f"Повтор запроса к Tracker через {delay:.2f} сек (попытка {attempt}/{self.max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+
+# Общие лимитеры по организациям: все клиенты одного токена делят бюджет запросов
+_shared_limiters: Dict[str, TrackerRateLimiter] = {}
+
+
+def get_shared_rate_limiter(org_id: str) -> TrackerRateLimiter:
+    """
+    Получить общий лимитер для организации.
+
+    Args:
+        org_id: ID организации Tracker
+
+    Returns:
+        TrackerRateLimiter, общий для всех TrackerClient этой организации
+    """
+    if org_id not in _shared_limiters:
+        _shared_limiters[org_id] = TrackerRateLimiter()
+    return _shared_limiters[org_id]
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Проверить, что ошибка временная (запрос стоит выполнить позже).
+
+    Args:
+        error: Исключение запроса (после всех повторов лимитера)
+
+    Returns:
+        True для 429, ошибок 5xx, разрыва соединения и таймаута
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status in RETRYABLE_STATUSES
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+def is_idempotent_request(
+    endpoint: str, method: str, data: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Проверить, можно ли безопасно повторить запрос после сбоя.
+
+    Args:
+        endpoint: Конечная точка API
+        method: HTTP метод
+        data: Тело запроса
+
+    Returns:
+        True для чтения, поисковых POST-запросов и создания задачи с unique
+    """
+    method = method.upper()
+    if method in ("GET", "HEAD", "PUT", "DELETE"):
+        return True
+    if method != "POST":
+        return False
+    # Поиск и подсчет выполняются через POST, но ничего не изменяют
+    path = endpoint.split("?", 1)[0].rstrip("/")
+    if path.endswith("/_search") or path.endswith("/_count"):
+        return True
+    # Повтор создания с тем же unique не создаст дубликат: если первая
+    # попытка дошла до сервера, повтор получит 409
+    return path.endswith("/issues") and bool(data and data.get("unique"))
+
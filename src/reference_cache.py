@@ -0,0 +1,262 @@
+"""Кэш справочных данных Tracker (очереди, портфели, пользователи, сущности)."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+from dataclasses import dataclass
+
+from .tracker_client import TrackerClient
+
+logger = logging.getLogger(__name__)
+
+# Время жизни записей кэша (в секундах)
+QUEUES_TTL = 600.0
+PORTFOLIOS_TTL = 600.0
+USERS_TTL = 600.0
+ENTITY_TTL = 600.0
+
+# Размер страницы Tracker для поиска сущностей
+ENTITIES_PAGE_SIZE = 50
+
+# Размер страницы списка пользователей
+USERS_PAGE_SIZE = 100
+
+
+def users_pages(count: int) -> int:
+    """Запросов на загрузку списка из count пользователей (последняя страница неполная)."""
+    return count // USERS_PAGE_SIZE + 1
+
+
+@dataclass
+class _CacheEntry:
+    """Значение кэша со временем устаревания."""
+
+    value: Any
+    expires_at: float
+
+
+class TTLCache:
+    """
+    Кэш с временем жизни записей и single-flight загрузкой.
+
+    - Пока запись свежая, значение отдается без запросов к API.
+    - Устаревшая запись отдается сразу, а обновление идет в фоне
+      (один фоновый запрос на ключ).
+    - Если значения нет, все одновременные запросы ключа ждут одну загрузку.
+    Ошибки загрузки не кэшируются.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, _CacheEntry] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+    ) -> Any:
+        """
+        Получить значение из кэша или загрузить его.
+
+        Args:
+            key: Ключ кэша
+            loader: Функция загрузки значения
+            ttl: Время жизни значения (в секундах)
+
+        Returns:
+            Значение из кэша или результат loader
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at <= time.monotonic():
+                self._load(key, loader, ttl)
+            return entry.value
+
+        return await asyncio.shield(self._load(key, loader, ttl))
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Сбросить запись кэша.
+
+        Args:
+            key: Ключ записи (если None - сбросить весь кэш)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+    ) -> asyncio.Task:
+        """Запустить загрузку ключа (или вернуть уже идущую)."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_loader(key, loader, ttl))
+            # Ошибку фонового обновления никто не ждет - забираем ее сами
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        return task
+
+    async def _run_loader(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+    ) -> Any:
+        """Загрузить значение и сохранить его в кэш."""
+        try:
+            value = await loader()
+            self._entries[key] = _CacheEntry(value, time.monotonic() + ttl)
+            return value
+        except Exception as e:
+            if key in self._entries:
+                # Фоновое обновление: оставляем устаревшее значение
+                logger.warning(f"Reference cache refresh failed for {key!r}: {e}")
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+
+class TrackerReferenceData:
+    """Справочные данные Tracker с общим для всего приложения кэшем."""
+
+    def __init__(self, tracker: TrackerClient, cache: Optional[TTLCache] = None):
+        """
+        Args:
+            tracker: Клиент Tracker
+            cache: Кэш (если None - создается новый)
+        """
+        self.tracker = tracker
+        self.cache = cache or TTLCache()
+
+    async def get_queues(self) -> List[Dict[str, Any]]:
+        """
+        Список очередей.
+
+        Returns:
+            Очереди в формате API
+        """
+        return await self.cache.get("queues", self.tracker.client.queues.get, QUEUES_TTL)
+
+    async def get_portfolios(self) -> List[Dict[str, Any]]:
+        """
+        Список портфелей (с полем summary).
+
+        Returns:
+            Портфели в формате API
+        """
+        return await self.cache.get(
+            "portfolios",
+            lambda: self._search_entities("portfolio", fields="summary"),
+            PORTFOLIOS_TTL,
+        )
+
+    async def get_users(self) -> List[Dict[str, Any]]:
+        """
+        Список пользователей организации (все страницы).
+
+        Returns:
+            Пользователи в формате API
+        """
+        return await self.cache.get("users", self._load_users, USERS_TTL)
+
+    async def get_entity(
+        self, entity_id: str, entity_type: str, fields: str = "summary"
+    ) -> Dict[str, Any]:
+        """
+        Сущность (проект, портфель) по ID.
+
+        Args:
+            entity_id: ID сущности
+            entity_type: Тип сущности
+            fields: Запрашиваемые поля
+
+        Returns:
+            Сущность в формате API
+        """
+        return await self.cache.get(
+            ("entity", entity_type, entity_id, fields),
+            lambda: self.tracker.client.entities.get(
+                entity_id=entity_id, entity_type=entity_type, fields=fields
+            ),
+            ENTITY_TTL,
+        )
+
+    async def _load_users(self) -> List[Dict[str, Any]]:
+        """
+        Загрузить всех пользователей организации постранично.
+
+        Страницы запрашиваются, пока очередная не окажется неполной. Если
+        страница не добавила новых пользователей (сервер не поддерживает
+        пагинацию и каждый раз отдает весь список), загрузка заканчивается.
+
+        Returns:
+            Пользователи в формате API
+        """
+        users: List[Dict[str, Any]] = []
+        seen = set()
+        page = 1
+        while True:
+            batch = await self.tracker.client.request(
+                "/users", params={"perPage": USERS_PAGE_SIZE, "page": page}
+            )
+            if isinstance(batch, dict):
+                batch = batch.get("values", [])
+            batch = [user for user in batch or [] if isinstance(user, dict)]
+
+            new_users = [
+                user for user in batch
+                if (user.get("uid"), user.get("login")) not in seen
+            ]
+            for user in new_users:
+                seen.add((user.get("uid"), user.get("login")))
+            users.extend(new_users)
+
+            if len(batch) < USERS_PAGE_SIZE or not new_users:
+                return users
+            page += 1
+
+    async def _search_entities(
+        self, entity_type: str, fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Найти все сущности типа постранично.
+
+        Страницы фиксированного размера запрашиваются, пока не будут
+        получены все страницы из ответа или очередная не окажется неполной.
+
+        Args:
+            entity_type: Тип сущности
+            fields: Запрашиваемые поля
+
+        Returns:
+            Список сущностей
+        """
+        kwargs: Dict[str, Any] = {"entity_type": entity_type}
+        if fields:
+            kwargs["fields"] = fields
+
+        entities: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            response = await self.tracker.client.entities.search(
+                per_page=ENTITIES_PAGE_SIZE, page=page, **kwargs
+            )
+            # Не dict - непагинированный ответ со всем списком
+            if not isinstance(response, dict):
+                entities.extend(item for item in response or [] if isinstance(item, dict))
+                return entities
+
+            batch = [item for item in response.get("values") or [] if isinstance(item, dict)]
+            entities.extend(batch)
+
+            pages = response.get("pages", 1)
+            if not isinstance(pages, int) or page >= pages or len(batch) < ENTITIES_PAGE_SIZE:
+                return entities
+            page += 1
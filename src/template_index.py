@@ -0,0 +1,200 @@
+"""Индекс проектов-шаблонов для быстрого выбора в диалоге клонирования."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+
+from .tracker_client import TrackerClient
+
+logger = logging.getLogger(__name__)
+
+# Слово в названии, по которому проект считается шаблоном
+TEMPLATE_KEYWORD = "шаблон"
+
+# Через сколько секунд индекс проверяет новые и измененные шаблоны
+INCREMENTAL_REFRESH_INTERVAL = 120.0
+
+# Через сколько секунд индекс перестраивается целиком (удаленные и переименованные)
+FULL_REFRESH_INTERVAL = 3600.0
+
+# Размер страницы поиска сущностей
+PAGE_SIZE = 100
+
+
+@dataclass
+class TemplateProject:
+    """Проект-шаблон в индексе."""
+
+    id: str
+    name: str
+    updated_at: str = ""
+
+
+class TemplateIndex:
+    """
+    Локальный индекс проектов-шаблонов.
+
+    Шаблоны ищутся на стороне Tracker (подстрока в названии), поэтому не нужно
+    скачивать все проекты организации. Индекс обновляется инкрементально:
+    запрашиваются только проекты, измененные после последнего обновления,
+    а раз в час индекс перестраивается полностью. Поиск по индексу локальный.
+    """
+
+    def __init__(self, tracker: TrackerClient, keyword: str = TEMPLATE_KEYWORD):
+        """
+        Args:
+            tracker: Клиент Tracker
+            keyword: Слово в названии проекта-шаблона
+        """
+        self.tracker = tracker
+        self.keyword = keyword
+        self._items: Dict[str, TemplateProject] = {}
+        self._latest_updated_at = ""
+        self._refreshed_at = 0.0
+        self._full_refreshed_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Индекс хотя бы раз загружен."""
+        return self._full_refreshed_at > 0
+
+    async def get_templates(self) -> List[TemplateProject]:
+        """
+        Список шаблонов, отсортированный по названию.
+
+        Первая загрузка ожидается, дальше индекс отдается сразу, а устаревший
+        индекс обновляется в фоне.
+
+        Returns:
+            Список шаблонов
+        """
+        now = time.monotonic()
+        if not self.is_loaded:
+            await asyncio.shield(self._start_refresh())
+        elif now - self._refreshed_at >= INCREMENTAL_REFRESH_INTERVAL:
+            self._start_refresh()
+
+        return sorted(self._items.values(), key=lambda item: item.name.lower())
+
+    async def search(self, query: str = "") -> List[TemplateProject]:
+        """
+        Поиск шаблонов по части названия (все слова запроса, без учета регистра).
+
+        Args:
+            query: Строка поиска (пустая - все шаблоны)
+
+        Returns:
+            Найденные шаблоны (сначала те, что начинаются с запроса)
+        """
+        templates = await self.get_templates()
+        words = query.lower().split()
+        if not words:
+            return templates
+
+        query_lower = query.strip().lower()
+        found = [t for t in templates if all(word in t.name.lower() for word in words)]
+        found.sort(key=lambda t: not t.name.lower().startswith(query_lower))
+        return found
+
+    def _start_refresh(self) -> asyncio.Task:
+        """Запустить обновление индекса (или вернуть уже идущее)."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.refresh())
+            # Ошибку фонового обновления никто не ждет - забираем ее сами
+            self._refresh_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return self._refresh_task
+
+    async def refresh(self, full: bool = False) -> None:
+        """
+        Обновить индекс.
+
+        Args:
+            full: Перестроить индекс целиком (иначе - только измененные проекты)
+        """
+        now = time.monotonic()
+        full = full or not self.is_loaded or now - self._full_refreshed_at >= FULL_REFRESH_INTERVAL
+
+        try:
+            if full:
+                items: Dict[str, TemplateProject] = {}
+                async for project in self._iter_projects():
+                    self._add(items, project)
+                self._items = items
+                self._full_refreshed_at = now
+            else:
+                async for project in self._iter_projects(newest_first=True):
+                    if project.updated_at and project.updated_at <= self._latest_updated_at:
+                        break
+                    self._items.pop(project.id, None)
+                    self._add(self._items, project)
+
+            self._latest_updated_at = max(
+                (item.updated_at for item in self._items.values()),
+                default=self._latest_updated_at,
+            )
+            self._refreshed_at = now
+            logger.info(f"Template index refreshed ({'full' if full else 'incremental'}): {len(self._items)} templates")
+        except Exception as e:
+            logger.error(f"Failed to refresh template index: {e}", exc_info=True)
+            raise
+
+    def _add(self, items: Dict[str, TemplateProject], project: TemplateProject) -> None:
+        """Добавить проект в индекс, если это шаблон."""
+        if self.keyword in project.name.lower():
+            items[project.id] = project
+
+    async def _iter_projects(self, newest_first: bool = False):
+        """
+        Постранично перебрать проекты с ключевым словом в названии.
+
+        Args:
+            newest_first: Сортировать по дате изменения (новые первыми)
+
+        Yields:
+            TemplateProject
+        """
+        page = 1
+        while True:
+            response = await self.tracker.client.entities.search(
+                entity_type="project",
+                fields="summary,updatedAt",
+                input=self.keyword,
+                order_by="updatedAt" if newest_first else "summary",
+                order_asc=not newest_first,
+                per_page=PAGE_SIZE,
+                page=page,
+            )
+
+            if isinstance(response, dict):
+                values = response.get("values", [])
+                pages = response.get("pages", 1)
+            else:
+                values = response or []
+                pages = 1
+
+            for raw in values:
+                project = self._parse_project(raw)
+                if project:
+                    yield project
+
+            if not isinstance(pages, int) or page >= pages or not values:
+                return
+            page += 1
+
+    @staticmethod
+    def _parse_project(raw: Any) -> Optional[TemplateProject]:
+        """Преобразовать ответ API в TemplateProject."""
+        if not isinstance(raw, dict) or not raw.get("id"):
+            return None
+
+        fields = raw.get("fields", {})
+        name = (
+            fields.get("summary")
+            or raw.get("summary")
+            or f"Проект #{raw.get('shortId', 'N/A')}"
+        )
+        updated_at = fields.get("updatedAt") or raw.get("updatedAt") or ""
+        return TemplateProject(id=raw["id"], name=name, updated_at=updated_at)
@@ -1,10 +1,12 @@
 """Базовый клиент для работы с Yandex Tracker API."""
 
 import os
-from typing import Optional
+from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 from YaTrackerApi import YandexTrackerClient
 
+from .rate_limiter import TrackerRateLimiter, get_shared_rate_limiter, is_idempotent_request
+
 class TrackerClient:
     """Обертка над YandexTrackerClient с загрузкой из .env."""
 
@@ -12,7 +14,9 @@ class TrackerClient:
         self,
         oauth_token: Optional[str] = None,
         org_id: Optional[str] = None,
-        log_level: str = "WARNING"
+        log_level: str = "WARNING",
+        rate_limiter: Optional[TrackerRateLimiter] = None,
+        base_url: Optional[str] = None,
     ):
         """
         Инициализация клиента Tracker.
@@ -21,6 +25,8 @@ class TrackerClient:
             oauth_token: OAuth токен (если None - загружается из .env)
             org_id: ID организации (если None - загружается из .env)
             log_level: Уровень логирования (WARNING - не показывать детальные INFO логи API)
+            rate_limiter: Лимитер запросов (если None - общий лимитер организации)
+            base_url: Адрес API (если None - API Tracker; используется в бенчмарках)
         """
         load_dotenv()
 
@@ -33,26 +39,80 @@ class TrackerClient:
         if not self.org_id:
             raise ValueError("TRACKER_ORG_ID не найден в .env файле")
 
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter(self.org_id)
+        self.base_url = base_url
         self._client: Optional[YandexTrackerClient] = None
 
-    async def __aenter__(self):
-        """Асинхронный вход в контекстный менеджер."""
-        self._client = YandexTrackerClient(
+    async def start(self) -> "TrackerClient":
+        """
+        Открыть HTTP-сессию клиента.
+
+        Сессия держит пул keep-alive соединений, поэтому долгоживущий клиент
+        (один на приложение) не тратит время на TLS-рукопожатие при каждом запросе.
+
+        Returns:
+            Этот же клиент
+        """
+        if self._client:
+            return self
+
+        client = YandexTrackerClient(
             oauth_token=self.oauth_token,
             org_id=self.org_id,
             log_level=self.log_level
         )
-        await self._client.__aenter__()
+        if self.base_url:
+            client.base_url = self.base_url.rstrip("/")
+        await client.__aenter__()
+
+        # Все модули API ходят через client.request - ограничиваем частоту
+        # и повторяем временные ошибки в одном месте
+        client.request = self._wrap_request(client.request)
+        self._client = client
         return self
 
+    async def close(self) -> None:
+        """Закрыть HTTP-сессию клиента (повторный вызов безопасен)."""
+        client, self._client = self._client, None
+        if client:
+            await client.__aexit__(None, None, None)
+
+    async def __aenter__(self):
+        """Асинхронный вход в контекстный менеджер."""
+        return await self.start()
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Асинхронный выход из контекстного менеджера."""
-        if self._client:
-            await self._client.__aexit__(exc_type, exc_val, exc_tb)
+        await self.close()
+
+    def _wrap_request(self, request):
+        """
+        Обернуть базовый метод запроса лимитером и повторами.
+
+        Args:
+            request: Исходный метод YandexTrackerClient.request
+
+        Returns:
+            Метод с той же сигнатурой
+        """
+        rate_limiter = self.rate_limiter
+
+        async def limited_request(
+            endpoint: str,
+            method: str = "GET",
+            data: Optional[Dict] = None,
+            params: Optional[Dict] = None,
+        ) -> Dict[str, Any]:
+            return await rate_limiter.call(
+                lambda: request(endpoint, method, data, params),
+                idempotent=is_idempotent_request(endpoint, method, data),
+            )
+
+        return limited_request
 
     @property
     def client(self) -> YandexTrackerClient:
         """Получение экземпляра YandexTrackerClient."""
         if not self._client:
-            raise RuntimeError("Клиент не инициализирован. Используйте 'async with'")
+            raise RuntimeError("Клиент не инициализирован. Используйте 'async with' или start()")
         return self._client
@@ -0,0 +1,119 @@
+"""Справочник пользователей организации для проверки людей в копиях задач."""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .reference_cache import TrackerReferenceData
+
+logger = logging.getLogger(__name__)
+
+# Поля пользователя, по которым на него ссылаются задачи и проекты
+USER_ID_FIELDS = ("login", "id", "uid", "trackerUid", "passportUid", "cloudUid")
+
+
+class UserDirectory:
+    """
+    Уволенные пользователи организации.
+
+    Исполнитель, наблюдатели, руководитель и участники проекта из шаблона
+    проверяются локально: пользователь, который есть в списке организации с
+    dismissed: true, заменяется запасным (fallback) или убирается, и запрос
+    создания не падает на сервере. Пользователи, которых нет в списке
+    (роботы, внешние учетные записи, ID в другом формате), передаются как
+    есть - решение о них остается за сервером. Справочник без списка
+    пользователей (не удалось загрузить) пропускает всех.
+    """
+
+    def __init__(
+        self,
+        users: Optional[Iterable[Dict[str, Any]]] = None,
+        fallback: Optional[str] = None,
+    ):
+        """
+        Args:
+            users: Пользователи в формате API (None - не проверять)
+            fallback: Логин или ID запасного пользователя
+        """
+        self._dismissed: Set[str] = set()
+        # Количество пользователей в списке (None - список не загружен)
+        self.size: Optional[int] = None
+        if users is not None:
+            users = list(users)
+            self.size = len(users)
+            self._dismissed = {
+                str(user[name])
+                for user in users
+                if user.get("dismissed", False)
+                for name in USER_ID_FIELDS
+                if user.get(name) not in (None, "")
+            }
+
+        self.fallback = fallback or None
+        if self.fallback and not self.is_active(self.fallback):
+            logger.warning(f"Fallback user {self.fallback} is dismissed, dismissed users will be dropped")
+            self.fallback = None
+
+        # Замененные пользователи (для журнала)
+        self.replaced: Set[str] = set()
+
+    def is_active(self, user: Any) -> bool:
+        """Пользователь не числится уволенным (неизвестные считаются активными)."""
+        return str(user) not in self._dismissed
+
+    def resolve(self, user: Optional[Any]) -> Optional[Any]:
+        """
+        Пользователь для копии.
+
+        Args:
+            user: Логин или ID из шаблона
+
+        Returns:
+            Тот же пользователь, если он не уволен, иначе запасной (или None)
+        """
+        if user in (None, "") or self.is_active(user):
+            return user
+        if str(user) not in self.replaced:
+            self.replaced.add(str(user))
+            logger.info(f"User {user} is dismissed, replaced with {self.fallback}")
+        return self.fallback
+
+    def resolve_many(self, users: Iterable[Any]) -> List[Any]:
+        """
+        Список пользователей для копии (без повторов после замены).
+
+        Args:
+            users: Логины или ID из шаблона
+
+        Returns:
+            Пользователи из шаблона и запасной вместо уволенных
+        """
+        resolved = []
+        for user in users:
+            user = self.resolve(user)
+            if user not in (None, "") and user not in resolved:
+                resolved.append(user)
+        return resolved
+
+
+async def load_user_directory(
+    reference_data: TrackerReferenceData, fallback: Optional[str] = None
+) -> UserDirectory:
+    """
+    Загрузить справочник пользователей из кэша справочных данных.
+
+    Ошибка загрузки не прерывает клонирование: пользователи передаются
+    без проверки, как раньше.
+
+    Args:
+        reference_data: Справочные данные Tracker (один запрос на время жизни кэша)
+        fallback: Логин или ID запасного пользователя
+
+    Returns:
+        UserDirectory
+    """
+    try:
+        users = await reference_data.get_users()
+    except Exception as e:
+        logger.warning(f"User directory is unavailable, users are not validated: {e}")
+        return UserDirectory(fallback=fallback)
+    return UserDirectory(users, fallback)
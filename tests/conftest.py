@@ -0,0 +1,64 @@
+"""Общие фикстуры: fake-сервер Tracker из бенчмарка и клиент к нему."""
+
+import pytest
+
+from benchmarks.fake_tracker import (
+    FakeTrackerConfig,
+    FakeTrackerServer,
+    FakeTrackerState,
+    generate_template,
+)
+from src.rate_limiter import TokenBucket, TrackerRateLimiter
+from src.tracker_client import TrackerClient
+
+# Размер шаблона по умолчанию (достаточно для иерархии, чеклистов и связей)
+TEMPLATE_SIZE = 30
+
+
+@pytest.fixture
+def fake_state() -> FakeTrackerState:
+    """Пустые данные fake-сервера."""
+    return FakeTrackerState()
+
+
+@pytest.fixture
+def template_id(fake_state: FakeTrackerState) -> str:
+    """ID синтетического проекта-шаблона."""
+    return generate_template(fake_state, TEMPLATE_SIZE)
+
+
+@pytest.fixture
+def fake_config() -> FakeTrackerConfig:
+    """Настройки fake-сервера: без задержек, лимитов и ошибок."""
+    return FakeTrackerConfig(latency=0.0)
+
+
+@pytest.fixture
+def fake_server(fake_state: FakeTrackerState, fake_config: FakeTrackerConfig) -> FakeTrackerServer:
+    """Fake-сервер (запускается фикстурой tracker)."""
+    return FakeTrackerServer(fake_state, fake_config)
+
+
+@pytest.fixture
+def rate_limiter() -> TrackerRateLimiter:
+    """Отдельный лимитер теста с короткими паузами перед повтором."""
+    return TrackerRateLimiter(bucket=TokenBucket(rate=1000, burst=1000), base_delay=0.01, max_delay=0.05)
+
+
+@pytest.fixture
+async def tracker(fake_server: FakeTrackerServer, rate_limiter: TrackerRateLimiter):
+    """TrackerClient, подключенный к запущенному fake-серверу."""
+    base_url = await fake_server.start()
+    client = TrackerClient(
+        oauth_token="test",
+        org_id="test",
+        log_level="CRITICAL",
+        rate_limiter=rate_limiter,
+        base_url=base_url,
+    )
+    await client.start()
+    try:
+        yield client
+    finally:
+        await client.close()
+        await fake_server.stop()
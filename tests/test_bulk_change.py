@@ -0,0 +1,75 @@
+"""Группировка изменений и привязка ошибок в BulkChangeEngine."""
+
+import asyncio
+
+from src.bulk_change import BulkChangeEngine
+
+
+def _follower_ids(issue: dict) -> set:
+    return {follower.get("id") or follower.get("login") for follower in issue.get("followers", [])}
+
+
+async def test_small_group_is_updated_without_operation(tracker, fake_state, template_id):
+    keys = list(fake_state.issues)[:3]
+    bulk = BulkChangeEngine(tracker, min_issues=5, poll_interval=0.01)
+    for key in keys:
+        bulk.add(key, {"followers": {"add": ["user7"]}})
+
+    result = await bulk.flush()
+
+    assert (result.operations, result.direct_updates, result.updated) == (0, 3, 3)
+    assert not fake_state.bulk_changes
+    assert all("user7" in _follower_ids(fake_state.issues[key]) for key in keys)
+
+
+async def test_identical_changes_share_one_operation(tracker, fake_state, template_id):
+    keys = list(fake_state.issues)[:6]
+    bulk = BulkChangeEngine(tracker, min_issues=5, poll_interval=0.01)
+    for key in keys:
+        bulk.add(key, {"followers": {"add": ["user7", "user8"]}})
+
+    result = await bulk.flush()
+
+    assert (result.operations, result.direct_updates, result.updated) == (1, 0, 6)
+    assert len(fake_state.bulk_changes) == 1
+    assert all({"user7", "user8"} <= _follower_ids(fake_state.issues[key]) for key in keys)
+
+
+async def test_failed_operation_reports_only_failed_issues(tracker, fake_state, template_id):
+    keys = list(fake_state.issues)[:5] + ["WORK-404"]
+    bulk = BulkChangeEngine(tracker, min_issues=5, poll_interval=0.01)
+    for key in keys:
+        bulk.add(key, {"followers": {"add": ["user7"]}})
+
+    result = await bulk.flush()
+
+    # Операция изменила не все задачи - задачи обновляются по одной
+    assert result.operations == 1
+    assert result.fallback_updates == len(keys)
+    assert result.updated == 5
+    assert list(result.failed) == ["WORK-404"]
+
+
+async def test_updates_go_through_limit(tracker, fake_state, template_id):
+    in_flight = 0
+    peak = 0
+    semaphore = asyncio.Semaphore(2)
+
+    async def limited(coro):
+        nonlocal in_flight, peak
+        async with semaphore:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await coro
+            finally:
+                in_flight -= 1
+
+    bulk = BulkChangeEngine(tracker, limited=limited)
+    for idx, key in enumerate(list(fake_state.issues)[:10]):
+        bulk.add(key, {"tags": [f"tag{idx}"]})
+
+    result = await bulk.flush()
+
+    assert result.direct_updates == 10
+    assert peak <= 2
@@ -0,0 +1,67 @@
+"""Лимиты при взятии заданий клонирования из очереди."""
+
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+# bot.database создает движок при импорте; тесты работают со своим движком
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from bot.database.crud import CloneJobCRUD  # noqa: E402
+from bot.database.models import Base  # noqa: E402
+
+
+@pytest.fixture
+async def session_maker():
+    """Фабрика сессий in-memory SQLite с таблицами моделей."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+async def _enqueue(session_maker, *user_ids):
+    ids = []
+    for idx, user_id in enumerate(user_ids):
+        async with session_maker() as session:
+            job = await CloneJobCRUD.create_job(session, "tmpl", f"Копия {idx}", "WORK", user_id=user_id)
+            ids.append(job.id)
+    return ids
+
+
+async def _claim(session_maker, per_user_limit=10, global_limit=10):
+    async with session_maker() as session:
+        job = await CloneJobCRUD.claim_next_job(
+            session, "worker", per_user_limit=per_user_limit, global_limit=global_limit
+        )
+        return job.id if job else None
+
+
+async def test_claims_oldest_job_first(session_maker):
+    first, second = await _enqueue(session_maker, 1, 2)
+
+    assert await _claim(session_maker) == first
+    assert await _claim(session_maker) == second
+    assert await _claim(session_maker) is None
+
+
+async def test_skips_users_at_their_limit(session_maker):
+    first, _, other_user = await _enqueue(session_maker, 1, 1, 2)
+
+    assert await _claim(session_maker, per_user_limit=1) == first
+    # Второе задание пользователя 1 ждет, берется задание пользователя 2
+    assert await _claim(session_maker, per_user_limit=1) == other_user
+    assert await _claim(session_maker, per_user_limit=1) is None
+
+
+async def test_stops_at_global_limit(session_maker):
+    first, _ = await _enqueue(session_maker, 1, 2)
+
+    assert await _claim(session_maker, global_limit=1) == first
+    assert await _claim(session_maker, global_limit=1) is None
+    assert await _claim(session_maker, global_limit=2) is not None
@@ -0,0 +1,40 @@
+"""Сохранение журнала клонирования и подсчет невосстановленных пунктов."""
+
+from src.clone_journal import CloneJournal
+
+
+def test_state_round_trip():
+    journal = CloneJournal(
+        new_project_id="project-1",
+        new_project_short_id=7,
+        issues_mapping={"TMPL-1": "WORK-1"},
+        checklists_done={"TMPL-1": 2},
+        comments_done={"TMPL-1": 1},
+        links_done={"TMPL-1:relates:TMPL-2"},
+        followers_done={"TMPL-1"},
+    )
+
+    restored = CloneJournal.from_state(journal.run_id, journal.to_state(), "project-1", 7)
+
+    assert restored == journal
+    assert restored.unique_token("TMPL-1") == journal.unique_token("TMPL-1")
+
+
+def test_empty_state_gives_new_journal():
+    journal = CloneJournal.from_state("run", None)
+
+    assert journal.run_id == "run"
+    assert not journal.issues_mapping and journal.new_project_id is None
+
+
+def test_unfinished_items_count_only_created_issues():
+    journal = CloneJournal(
+        issues_mapping={"TMPL-1": "WORK-1", "TMPL-2": "WORK-2"},
+        checklists_done={"TMPL-1": 1},
+        comments_done={"TMPL-2": 2},
+    )
+    checklists = {"TMPL-1": ["a", "b", "c"], "TMPL-3": ["a"]}
+    comments = {"TMPL-2": ["x", "y"], "TMPL-1": ["z"]}
+
+    # TMPL-3 не создана - ее пункты не считаются
+    assert journal.unfinished_items(checklists, comments) == 2 + 1
@@ -0,0 +1,48 @@
+"""Потоковое клонирование задач, чей родитель не будет создан."""
+
+import asyncio
+
+from src.clone_journal import CloneJournal
+from src.clone_pipeline import clone_project_streaming
+from src.project_cloner import ProjectCloner
+
+
+def _template_keys(state, template_id):
+    return [
+        key for key, issue in state.issues.items()
+        if issue.get("project", {}).get("primary", {}).get("id") == template_id
+    ]
+
+
+async def _clone_streaming(tracker, template_id):
+    journal = CloneJournal()
+    # Зависшая задача в ожидании родителя - ошибка конвейера, а не медленный тест
+    result, project_data = await asyncio.wait_for(
+        clone_project_streaming(ProjectCloner(tracker), template_id, "Копия", "WORK", journal),
+        timeout=10,
+    )
+    assert result.success, result.errors
+    return journal, project_data
+
+
+async def test_issue_with_missing_parent_is_created_as_root(tracker, fake_state, template_id):
+    key = _template_keys(fake_state, template_id)[-1]
+    fake_state.issues[key]["parent"] = {"key": "TMPL-9999"}
+
+    journal, project_data = await _clone_streaming(tracker, template_id)
+
+    assert set(journal.issues_mapping) == {issue.key for issue in project_data.issues}
+    assert "parent" not in fake_state.issues[journal.issues_mapping[key]]
+
+
+async def test_parent_cycle_is_broken(tracker, fake_state, template_id):
+    first, second = _template_keys(fake_state, template_id)[-2:]
+    fake_state.issues[first]["parent"] = {"key": second}
+    fake_state.issues[second]["parent"] = {"key": first}
+
+    journal, _ = await _clone_streaming(tracker, template_id)
+
+    assert set(_template_keys(fake_state, template_id)) <= set(journal.issues_mapping)
+    # Одна задача цикла становится корневой, вторая - ее подзадачей
+    parents = [fake_state.issues[journal.issues_mapping[key]].get("parent") for key in (first, second)]
+    assert parents.count(None) == 1
@@ -0,0 +1,120 @@
+"""Продолжение клонирования по журналу с частично восстановленной задачи."""
+
+from typing import Set
+
+import pytest
+from aiohttp import web
+
+from benchmarks.fake_tracker import FakeTrackerConfig, FakeTrackerServer, FakeTrackerState
+from src.clone_journal import CloneJournal
+from src.clone_pipeline import clone_project_streaming
+from src.link_planner import plan_links
+from src.project_cloner import ProjectCloner
+from src.project_records import ChecklistItem
+
+
+class FlakyTrackerServer(FakeTrackerServer):
+    """
+    Fake-сервер, который один раз отвечает 503 на пункт чеклиста с заданным
+    текстом и на первые fail_links запросов создания связи.
+    """
+
+    def __init__(self, state: FakeTrackerState, config: FakeTrackerConfig):
+        super().__init__(state, config)
+        self.fail_once: Set[str] = set()
+        self.fail_links = 0
+
+    async def create_checklist_item(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        if body.get("text") in self.fail_once:
+            self.fail_once.discard(body["text"])
+            return web.json_response({"errorMessages": ["Injected error"]}, status=503)
+        return await super().create_checklist_item(request)
+
+    async def create_link(self, request: web.Request) -> web.Response:
+        if self.fail_links > 0:
+            self.fail_links -= 1
+            return web.json_response({"errorMessages": ["Injected error"]}, status=503)
+        return await super().create_link(request)
+
+
+@pytest.fixture
+def fake_server(fake_state: FakeTrackerState, fake_config: FakeTrackerConfig) -> FlakyTrackerServer:
+    return FlakyTrackerServer(fake_state, fake_config)
+
+
+def _issue_with_checklist(state: FakeTrackerState, min_items: int = 3) -> str:
+    """Ключ задачи шаблона с чеклистом не короче min_items."""
+    return next(key for key, items in state.checklists.items() if len(items) >= min_items)
+
+
+def _checklist_texts(state: FakeTrackerState, key: str) -> list:
+    return [item["text"] for item in state.checklists.get(key, [])]
+
+
+async def test_checklist_lane_starts_after_restored_items(tracker, fake_state, template_id):
+    old_key = _issue_with_checklist(fake_state)
+    new_key = "WORK-1"
+    fake_state.issues[new_key] = {"key": new_key, "summary": "Копия"}
+    items = [ChecklistItem(item["text"], item["checked"]) for item in fake_state.checklists[old_key]]
+
+    journal = CloneJournal(issues_mapping={old_key: new_key}, checklists_done={old_key: 2})
+    await ProjectCloner(tracker).restore_issue_checklist(old_key, new_key, items, journal)
+
+    assert _checklist_texts(fake_state, new_key) == [item.text for item in items[2:]]
+    assert journal.checklists_done[old_key] == len(items)
+
+
+async def test_streaming_clone_resumes_from_failed_checklist_item(
+    tracker, fake_server, fake_state, template_id
+):
+    old_key = _issue_with_checklist(fake_state)
+    source_texts = _checklist_texts(fake_state, old_key)
+    fake_server.fail_once.add(source_texts[2])
+
+    journal = CloneJournal()
+    result, _ = await clone_project_streaming(
+        ProjectCloner(tracker), template_id, "Копия", "WORK", journal
+    )
+
+    # Временная ошибка останавливает очередь задачи, не сдвигая счетчик
+    assert not result.success
+    assert journal.checklists_done[old_key] == 2
+    new_key = journal.issues_mapping[old_key]
+    assert _checklist_texts(fake_state, new_key) == source_texts[:2]
+
+    result, _ = await clone_project_streaming(
+        ProjectCloner(tracker), template_id, "Копия", "WORK", journal
+    )
+
+    assert result.success, result.errors
+    assert journal.issues_mapping[old_key] == new_key
+    assert _checklist_texts(fake_state, new_key) == source_texts
+
+
+def _link_count(state: FakeTrackerState, keys) -> int:
+    return sum(len(state.links.get(key, [])) for key in keys)
+
+
+async def test_streaming_clone_resumes_failed_link(tracker, fake_server, fake_state, template_id):
+    fake_server.fail_links = 1
+
+    journal = CloneJournal()
+    result, project_data = await clone_project_streaming(
+        ProjectCloner(tracker), template_id, "Копия", "WORK", journal
+    )
+
+    # Связь после 503 не отмечена в журнале - клонирование можно продолжить
+    assert not result.success
+    planned = {link.key for link in plan_links(project_data.links)}
+    assert len(planned - journal.links_done) == 1
+
+    result, _ = await clone_project_streaming(
+        ProjectCloner(tracker), template_id, "Копия", "WORK", journal
+    )
+
+    assert result.success, result.errors
+    assert journal.links_done >= planned
+    new_keys = set(journal.issues_mapping.values())
+    template_keys = set(journal.issues_mapping)
+    assert _link_count(fake_state, new_keys) == _link_count(fake_state, template_keys)
@@ -0,0 +1,33 @@
+"""Создание задач через API импорта: автор, время создания и продолжение."""
+
+from src.clone_journal import CloneJournal
+from src.project_cloner import IMPORT_BACKEND, ProjectCloner
+
+
+async def _clone(tracker, template_id, journal=None):
+    cloner = ProjectCloner(tracker, backend=IMPORT_BACKEND)
+    project_data = await cloner.fetch_project_data(template_id)
+    result = await cloner.clone_project(project_data, "Копия", "WORK", journal)
+    assert result.success, result.errors
+    return result
+
+
+async def test_import_keeps_source_time_and_author(tracker, fake_state, template_id):
+    source = {key: dict(issue) for key, issue in fake_state.issues.items()}
+
+    result = await _clone(tracker, template_id)
+
+    for old_key, new_key in result.new_issues_mapping.items():
+        new_issue = fake_state.issues[new_key]
+        assert new_issue["createdAt"] == source[old_key]["createdAt"]
+        assert new_issue["createdBy"]["id"] == source[old_key]["createdBy"]["id"]
+
+
+async def test_resumed_clone_creates_issues_with_unique(tracker, fake_state, template_id):
+    # Проект создан прерванным прогоном - задачи создаются через issues.create
+    journal = CloneJournal(new_project_id="project-1", new_project_short_id=1)
+
+    result = await _clone(tracker, template_id, journal)
+
+    tokens = {journal.unique_token(old_key) for old_key in result.new_issues_mapping}
+    assert tokens <= set(fake_state.unique)
@@ -0,0 +1,42 @@
+"""Создание задач по уровням иерархии."""
+
+from src.project_cloner import ProjectCloner
+from src.project_records import IssueRecord
+
+
+def _levels(parent_child, keys):
+    issues = [IssueRecord(key) for key in keys]
+    levels = ProjectCloner.group_issues_by_depth(issues, parent_child)
+    return [[issue.key for issue in level] for level in levels]
+
+
+def test_children_follow_their_parents():
+    parent_child = {"A-2": "A-1", "A-3": "A-2", "A-4": "A-1"}
+
+    assert _levels(parent_child, ["A-3", "A-4", "A-1", "A-2"]) == [["A-1"], ["A-4", "A-2"], ["A-3"]]
+
+
+def test_parent_outside_project_makes_issue_a_root():
+    assert _levels({"A-2": "OTHER-1"}, ["A-1", "A-2"]) == [["A-1", "A-2"]]
+
+
+def test_cycle_is_broken():
+    levels = _levels({"A-1": "A-2", "A-2": "A-1", "A-3": "A-3"}, ["A-1", "A-2", "A-3"])
+
+    assert sorted(key for level in levels for key in level) == ["A-1", "A-2", "A-3"]
+    assert "A-3" in levels[0]
+    assert len(levels) == 2
+
+
+async def test_cloned_issues_keep_hierarchy(tracker, fake_state, template_id):
+    cloner = ProjectCloner(tracker)
+    project_data = await cloner.fetch_project_data(template_id)
+    assert project_data.parent_child
+
+    result = await cloner.clone_project(project_data, "Копия", "WORK")
+
+    assert result.success, result.errors
+    mapping = result.new_issues_mapping
+    for child_key, parent_key in project_data.parent_child.items():
+        new_issue = fake_state.issues[mapping[child_key]]
+        assert new_issue["parent"]["key"] == mapping[parent_key]
@@ -0,0 +1,84 @@
+"""Канонический вид связей и восстановление каждой связи один раз."""
+
+from src.link_planner import SYMMETRIC_LINK_TYPES, PlannedLink, canonical_link, plan_links
+from src.project_cloner import ProjectCloner
+from src.project_records import LinkRecord
+
+
+def test_both_sides_of_link_give_same_plan():
+    outward = canonical_link("A-1", LinkRecord("depends", "outward", "A-2"))
+    inward = canonical_link("A-2", LinkRecord("depends", "inward", "A-1"))
+
+    # A-2 зависит от A-1: связь создается со стороны блокирующей задачи
+    assert outward == inward == PlannedLink("A-1", "is dependent by", "A-2")
+
+
+def test_symmetric_link_goes_from_smaller_key():
+    assert canonical_link("A-2", LinkRecord("relates", "outward", "A-1")) == PlannedLink(
+        "A-1", "relates", "A-2"
+    )
+
+
+def test_hierarchy_and_self_links_are_skipped():
+    assert canonical_link("A-1", LinkRecord("subtask", "outward", "A-2")) is None
+    assert canonical_link("A-1", LinkRecord("relates", "outward", "A-1")) is None
+
+
+def test_unknown_type_is_skipped_with_one_warning(caplog):
+    links = {
+        "A-1": [LinkRecord("blocks", "outward", "A-2"), LinkRecord("blocks", "outward", "A-3")],
+        "A-2": [LinkRecord("blocks", "inward", "A-1")],
+    }
+
+    assert plan_links(links) == []
+    assert len([record for record in caplog.records if "'blocks'" in record.getMessage()]) == 1
+
+
+def test_plan_keeps_first_occurrence_order():
+    links = {
+        "A-1": [LinkRecord("relates", "outward", "A-3"), LinkRecord("depends", "outward", "A-2")],
+        "A-2": [LinkRecord("depends", "inward", "A-1")],
+        "A-3": [LinkRecord("relates", "inward", "A-1")],
+    }
+
+    assert plan_links(links) == [
+        PlannedLink("A-1", "relates", "A-3"),
+        PlannedLink("A-1", "is dependent by", "A-2"),
+    ]
+
+
+def _links_between(state, keys):
+    """Связи между задачами keys: (задача, тип, направление, связанная задача)."""
+    # Направление связи без направления зависит от того, с какой стороны ее создали
+    return {
+        (
+            key,
+            link["type"]["id"],
+            None if link["type"]["id"] in SYMMETRIC_LINK_TYPES else link["direction"],
+            link["object"]["key"],
+        )
+        for key in keys
+        for link in state.links.get(key, [])
+        if link["object"]["key"] in keys
+    }
+
+
+async def test_clone_restores_each_link_once(tracker, fake_state, template_id):
+    cloner = ProjectCloner(tracker)
+    project_data = await cloner.fetch_project_data(template_id)
+    template_links = _links_between(fake_state, {issue.key for issue in project_data.issues})
+    assert template_links
+
+    result = await cloner.clone_project(project_data, "Копия", "WORK")
+
+    assert result.success, result.errors
+    mapping = result.new_issues_mapping
+    new_links = [
+        link for key in mapping.values() for link in fake_state.links.get(key, [])
+    ]
+    # Каждая связь видна с двух сторон, повторных связей нет
+    assert len(new_links) == len(template_links)
+    assert _links_between(fake_state, set(mapping.values())) == {
+        (mapping[key], type_id, direction, mapping[other])
+        for key, type_id, direction, other in template_links
+    }
@@ -0,0 +1,39 @@
+"""Задачи вне проекта: связанные догружаются, внешние родители - нет."""
+
+from src.project_cloner import ProjectCloner
+
+
+def _add_outside_issue(state, key: str) -> str:
+    state.issues[key] = {"id": f"id-{key}", "key": key, "summary": key, "queue": {"key": "OTHER"}}
+    return key
+
+
+def _template_key(state, template_id) -> str:
+    return next(
+        key for key, issue in state.issues.items()
+        if issue.get("project", {}).get("primary", {}).get("id") == template_id
+    )
+
+
+async def test_parent_outside_project_is_not_fetched(tracker, fake_state, template_id):
+    outside = _add_outside_issue(fake_state, "OTHER-1")
+    fake_state.issues[_template_key(fake_state, template_id)]["parent"] = {"key": outside}
+
+    project_data = await ProjectCloner(tracker).fetch_project_data(template_id)
+
+    assert outside not in {issue.key for issue in project_data.issues}
+
+
+async def test_linked_issue_outside_project_is_fetched(tracker, fake_state, template_id):
+    outside = _add_outside_issue(fake_state, "OTHER-1")
+    key = _template_key(fake_state, template_id)
+    fake_state.links.setdefault(key, []).append({
+        "id": 999,
+        "type": {"id": "relates"},
+        "direction": "outward",
+        "object": {"key": outside},
+    })
+
+    project_data = await ProjectCloner(tracker).fetch_project_data(template_id)
+
+    assert outside in {issue.key for issue in project_data.issues}
@@ -0,0 +1,54 @@
+"""Отпечаток шаблона и снимок ProjectData."""
+
+import json
+import zlib
+
+import pytest
+
+from src.project_cloner import FULL_CLONE_PROFILE, ProjectCloner, ProjectData
+
+
+def _rows(project_data: ProjectData) -> dict:
+    return json.loads(zlib.decompress(project_data.to_snapshot()))
+
+
+async def test_snapshot_round_trip(tracker, template_id):
+    project_data = await ProjectCloner(tracker).fetch_project_data(template_id)
+
+    restored = ProjectData.from_snapshot(project_data.to_snapshot())
+
+    assert _rows(restored) == _rows(project_data)
+    assert [issue.key for issue in restored.issues] == [issue.key for issue in project_data.issues]
+    assert restored.issues[0].created_at == project_data.issues[0].created_at
+
+
+async def test_snapshot_of_other_format_is_rejected(tracker, template_id):
+    project_data = await ProjectCloner(tracker).fetch_project_data(template_id)
+    payload = _rows(project_data)
+    payload["format"] -= 1
+
+    with pytest.raises(ValueError):
+        ProjectData.from_snapshot(zlib.compress(json.dumps(payload).encode("utf-8")))
+
+
+async def test_fingerprint_follows_issue_changes(tracker, fake_state, template_id):
+    cloner = ProjectCloner(tracker)
+    fingerprint = await cloner.fetch_project_fingerprint(template_id)
+    assert fingerprint == await cloner.fetch_project_fingerprint(template_id)
+
+    key = next(iter(fake_state.issues))
+    fake_state.issues[key]["updatedAt"] = "2026-02-01T00:00:00.000+0000"
+    updated = await cloner.fetch_project_fingerprint(template_id)
+    assert updated != fingerprint
+
+    del fake_state.issues[key]
+    assert await cloner.fetch_project_fingerprint(template_id) != updated
+
+
+async def test_fingerprint_depends_on_profile(tracker, template_id):
+    minimal = await ProjectCloner(tracker).fetch_project_fingerprint(template_id)
+    full = await ProjectCloner(tracker, profile=FULL_CLONE_PROFILE).fetch_project_fingerprint(
+        template_id
+    )
+
+    assert minimal != full
@@ -0,0 +1,71 @@
+"""Повторы запросов и адаптивный лимит одновременных запросов TrackerRateLimiter."""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from src.rate_limiter import AdaptiveConcurrencyLimiter, is_idempotent_request
+
+
+async def test_throttled_requests_are_retried_and_halve_concurrency(
+    tracker, fake_server, fake_config, rate_limiter
+):
+    fake_config.rate_limit = 50
+    fake_config.rate_burst = 2
+    initial_limit = rate_limiter.concurrency.limit
+
+    results = await asyncio.gather(*(tracker.client.request("/myself") for _ in range(6)))
+
+    assert all(result["login"] == "benchmark" for result in results)
+    assert fake_server.throttled_count > 0
+    assert rate_limiter.throttled_count == fake_server.throttled_count
+    assert rate_limiter.concurrency.limit < initial_limit
+
+
+async def test_server_error_is_retried_only_for_idempotent_requests(
+    tracker, fake_server, fake_config, rate_limiter
+):
+    fake_config.error_rate = 1.0
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await tracker.client.request("/issues/WORK-1/comments", method="POST", data={"text": "x"})
+    # Создание без unique не повторяется - повтор мог бы создать дубликат
+    assert fake_server.errors_count == 1
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await tracker.client.request("/myself")
+    assert fake_server.errors_count == 2 + rate_limiter.max_retries
+
+
+async def test_concurrency_grows_after_window_of_fast_requests():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=3, latency_target=1.0)
+
+    for _ in range(2):
+        await limiter.acquire()
+        await limiter.release(latency=0.1)
+    assert limiter.limit == 3
+
+    # Медленные ответы лимит не увеличивают, 429 уменьшает вдвое
+    await limiter.acquire()
+    await limiter.release(latency=5.0)
+    assert limiter.limit == 3
+    await limiter.acquire()
+    await limiter.release(latency=0.1, throttled=True)
+    assert limiter.limit == 1
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "method", "data", "expected"),
+    [
+        ("/issues/WORK-1", "GET", None, True),
+        ("/issues/_search", "POST", {"filter": {}}, True),
+        ("/issues/", "POST", {"summary": "x", "unique": "clone:1:WORK-1"}, True),
+        ("/issues/", "POST", {"summary": "x"}, False),
+        ("/issues/_import", "POST", {"summary": "x", "unique": "clone:1:WORK-1"}, False),
+        ("/issues/WORK-1/comments", "POST", {"text": "x"}, False),
+        ("/issues/WORK-1", "PATCH", {"summary": "x"}, False),
+    ],
+)
+def test_idempotent_requests(endpoint, method, data, expected):
+    assert is_idempotent_request(endpoint, method, data) is expected
@@ -0,0 +1,18 @@
+"""Справочники трекера: постраничный поиск сущностей."""
+
+from src.reference_cache import ENTITIES_PAGE_SIZE, TrackerReferenceData
+
+
+async def test_portfolios_are_loaded_page_by_page(tracker, fake_server, fake_state, template_id):
+    for idx in range(ENTITIES_PAGE_SIZE * 2):
+        fake_state.projects[f"portfolio{idx}"] = {
+            "id": f"portfolio{idx}",
+            "entityType": "portfolio",
+            "fields": {"summary": f"Портфель {idx}"},
+        }
+
+    portfolios = await TrackerReferenceData(tracker).get_portfolios()
+
+    assert [p["id"] for p in portfolios] == list(fake_state.projects)
+    # Шаблон и 100 портфелей: две полные страницы и одна неполная
+    assert fake_server.requests_count == 3
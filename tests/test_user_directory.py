@@ -0,0 +1,71 @@
+"""Справочник пользователей: замена уволенных и постраничная загрузка."""
+
+from src.project_cloner import ProjectCloner
+from src.reference_cache import USERS_PAGE_SIZE, TrackerReferenceData, users_pages
+from src.user_directory import UserDirectory
+
+USERS = [
+    {"id": "1", "login": "alice"},
+    {"id": "2", "login": "bob", "dismissed": True},
+    {"id": "3", "login": "carol", "dismissed": True},
+]
+
+
+def test_dismissed_user_is_replaced_with_fallback():
+    users = UserDirectory(USERS, fallback="alice")
+
+    assert users.resolve("bob") == "alice"
+    assert users.resolve("2") == "alice"
+    assert users.resolve("alice") == "alice"
+    assert users.replaced == {"bob", "2"}
+
+
+def test_unknown_users_are_passed_through():
+    users = UserDirectory(USERS, fallback="alice")
+
+    assert users.resolve("robot") == "robot"
+    assert UserDirectory().resolve("bob") == "bob"
+
+
+def test_dismissed_fallback_drops_dismissed_users():
+    users = UserDirectory(USERS, fallback="carol")
+
+    assert users.fallback is None
+    assert users.resolve("bob") is None
+
+
+def test_resolve_many_removes_duplicates_after_replacement():
+    users = UserDirectory(USERS, fallback="alice")
+
+    assert users.resolve_many(["bob", "alice", "carol", "dave"]) == ["alice", "dave"]
+
+
+async def test_users_are_loaded_page_by_page(tracker, fake_server, fake_state):
+    fake_state.users = [
+        {"id": str(idx), "login": f"user{idx}"} for idx in range(USERS_PAGE_SIZE * 2)
+    ]
+
+    users = await TrackerReferenceData(tracker).get_users()
+
+    assert [user["login"] for user in users] == [user["login"] for user in fake_state.users]
+    # Последняя полная страница - еще один запрос, который вернет пустую
+    assert fake_server.requests_count == users_pages(len(users)) == 3
+
+
+async def test_clone_replaces_dismissed_assignees_and_followers(tracker, fake_state, template_id):
+    fake_state.dismiss_users(5)
+    dismissed = {
+        str(user[name]) for user in fake_state.users if user.get("dismissed") for name in ("id", "login")
+    }
+    cloner = ProjectCloner(tracker, fallback_user="user1")
+    project_data = await cloner.fetch_project_data(template_id)
+
+    result = await cloner.clone_project(project_data, "Копия", "WORK")
+
+    assert result.success, result.errors
+    assert cloner.users.replaced
+    assert len(result.new_issues_mapping) == len(project_data.issues)
+    for new_key in result.new_issues_mapping.values():
+        issue = fake_state.issues[new_key]
+        people = [issue.get("assignee"), *issue.get("followers", [])]
+        assert not {str(person.get("id") or person.get("login")) for person in people if person} & dismissed